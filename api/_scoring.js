@@ -0,0 +1,84 @@
+// generated by calm_profile_api/edge/build_artifact.py from scoring model v1 (scoring version baf2e5003c06cf31, cost model 1).
+// do not edit: rebuild after changing scoring_models/ or cost_model.py
+
+// Scoring from a compiled artifact (see build_artifact.py): the /api/assess
+// result of calm_profile_system + cost_model, without Python. Every per-axis
+// count combination is precomputed, so scoring is one array lookup.
+
+// Python's round(): ties go to the even neighbour. Only ndigits 0 and 1 are
+// needed; a tie at one decimal is exactly representable only for odd quarters.
+export function pyRound(x, ndigits = 0) {
+  if (ndigits === 0) {
+    const floor = Math.floor(x)
+    const diff = x - floor
+    if (diff === 0.5) return floor % 2 === 0 ? floor : floor + 1
+    return Math.round(x)
+  }
+  if (ndigits === 1) {
+    if (Number.isInteger(x * 4) && (x * 4) % 2 !== 0) {
+      const tenths = Math.floor(x * 10)
+      return (tenths % 2 === 0 ? tenths : tenths + 1) / 10
+    }
+    return Number(x.toFixed(1))
+  }
+  throw new Error('pyRound supports ndigits 0 and 1')
+}
+
+// raw 'A' / 'B' answers keyed by question number -> the shared result object
+export function score(artifact, responses) {
+  const { axes, axis_questions, axis_scores, strides, archetypes, outcomes } = artifact
+  const counts = axis_questions.map(qs => qs.reduce((c, q) => c + (responses[String(q)] === 'A' ? 1 : 0), 0))
+  const k = archetypes.length
+  const offset = counts.reduce((i, c, a) => i + c * strides[a], 0) * (1 + 2 * k)
+  const primary = archetypes[outcomes[offset]]
+  const mix = {}
+  const match = {}
+  archetypes.forEach((a, j) => {
+    mix[a.key] = outcomes[offset + 1 + j]
+    match[a.key] = outcomes[offset + 1 + k + j]
+  })
+  return {
+    archetype: { primary: primary.key, mix, tagline: primary.tagline },
+    scores: {
+      axes: Object.fromEntries(axes.map((name, a) => [name, axis_scores[a][counts[a]]])),
+      match,
+    },
+    recommendations: { strengths: primary.strengths, quick_wins: primary.quick_wins },
+  }
+}
+
+// cost_model.context_cost
+export function contextCost(artifact, primary, context) {
+  const cost = artifact.cost
+  const get = key => (context[key] === undefined ? cost.defaults[key] : context[key])
+  // float(): numbers and numeric strings (non-finite rates fail later in Python too)
+  const rawRate = get('hourlyRate')
+  const rate = typeof rawRate === 'number' ? rawRate
+    : typeof rawRate === 'string' && rawRate.trim() !== '' ? Number(rawRate) : NaN
+  if (!Number.isFinite(rate)) throw new Error(`invalid hourlyRate: ${JSON.stringify(rawRate)}`)
+  const meeting = String(get('meetingLoad')).toLowerCase()
+  const meetingKey = Object.keys(cost.overhead_multipliers).find(m => meeting.includes(m)) ?? cost.default_meeting_load
+  const overheadIndex = cost.overhead_multipliers[meetingKey] * (cost.archetype_adjust[primary.toLowerCase()] ?? 1.0)
+  const team = String(get('teamSize'))
+  const teamKey = Object.keys(cost.team_multipliers).find(t => team.includes(t))
+  const tm = teamKey === undefined ? 1 : cost.team_multipliers[teamKey]
+  const hoursLost = overheadIndex * cost.hours_per_overhead
+  return { overheadIndex, hoursLost, annualCost: hoursLost * cost.weeks_per_year * rate * tm }
+}
+
+// the /api/assess response body for raw answers + context
+export function assessmentPayload(artifact, responses, context, assessmentId) {
+  const result = score(artifact, responses || {})
+  const { overheadIndex, hoursLost, annualCost } = contextCost(artifact, result.archetype.primary, context || {})
+  return {
+    success: true,
+    assessment_id: assessmentId,
+    archetype: result.archetype,
+    scores: { ...result.scores.axes, overhead_index: pyRound(overheadIndex * 100) },
+    metrics: { hours_lost_ppw: pyRound(hoursLost, 1), annual_cost: pyRound(annualCost) },
+    recommendations: result.recommendations,
+    tagline: result.archetype.tagline,
+  }
+}
+
+export const ARTIFACT = {"format":1,"model":"v1","scoring_version":"baf2e5003c06cf31","cost_model_version":1,"axes":["structure","collaboration","scope","tempo"],"axis_questions":[[0,1,2,3,4],[5,6,7,8,9],[10,11,12,13,14],[15,16,17,18,19]],"strides":[216,36,6,1],"axis_scores":[[0,20,40,60,80,100],[0,20,40,60,80,100],[0,20,40,60,80,100],[0,20,40,60,80,100]],"archetypes":[{"key":"architect","name":"Architect","tagline":"systematic builders of scalable foundations","strengths":["Framework design","Process optimization","Long-term planning","System integration"],"quick_wins":["Implement project templates","Create workflow documentation","Set up automation tools"]},{"key":"conductor","name":"Conductor","tagline":"orchestrators of collaborative excellence","strengths":["Team coordination","Meeting facilitation","Stakeholder alignment","Resource orchestration"],"quick_wins":["Reduce status meetings with async updates","Define decision owners","Weekly cadence dashboard"]},{"key":"curator","name":"Curator","tagline":"quality guardians and creative refiners","strengths":["Quality assurance","Detail orientation","Creative curation","Standard maintenance"],"quick_wins":["Develop review checklists","Create style guides","Set up quality gates"]},{"key":"craftsperson","name":"Craftsperson","tagline":"deep work and quality at the edges","strengths":["Detail execution","Technical craft","Quality control","Repeatable delivery"],"quick_wins":["Protect maker time","Limit WIP","Definition of ready"]}],"cost":{"defaults":{"teamSize":"solo","meetingLoad":"light","hourlyRate":85,"platform":"web"},"overhead_multipliers":{"light":0.6,"moderate":0.8,"heavy":1.0},"default_meeting_load":"moderate","archetype_adjust":{"architect":0.9,"conductor":0.85,"curator":1.1,"craftsperson":1.2},"team_multipliers":{"solo":1,"2-5":4,"6-15":10,"16-50":25,"50+":55},"hours_per_overhead":5.0,"weeks_per_year":52},"outcomes":[2,25.8,16.7,31.8,25.8,42.5,27.5,52.5,42.5,2,25.7,17.6,31.1,25.7,47.5,32.5,57.5,47.5,2,25.6,18.3,30.5,25.6,52.5,37.5,62.5,52.5,2,24.1,21.5,30.4,24.1,47.5,42.5,60.0,47.5,2,23.9,21.1,31.0,23.9,42.5,37.5,55.0,42.5,2,23.8,20.6,31.7,23.8,37.5,32.5,50.0,37.5,2,25.7,17.6,31.1,25.7,47.5,32.5,57.5,47.5,2,25.6,18.3,30.5,25.6,52.5,37.5,62.5,52.5,2,25.6,18.9,30.0,25.6,57.5,42.5,67.5,57.5,2,24.1,21.8,29.9,24.1,52.5,47.5,65.0,52.5,2,24.1,21.5,30.4,24.1,47.5,42.5,60.0,47.5,2,23.9,21.1,31.0,23.9,42.5,37.5,55.0,42.5,2,26.2,18.8,28.8,26.2,52.5,37.5,57.5,52.5,2,26.1,19.3,28.4,26.1,57.5,42.5,62.5,57.5,2,26.0,19.8,28.1,26.0,62.5,47.5,67.5,62.5,2,24.7,22.6,28.0,24.7,57.5,52.5,65.0,57.5,2,24.7,22.4,28.2,24.7,52.5,47.5,60.0,52.5,2,24.7,22.1,28.6,24.7,47.5,42.5,55.0,47.5,0,27.4,20.2,25.0,27.4,57.5,42.5,52.5,57.5,0,27.2,20.7,25.0,27.2,62.5,47.5,57.5,62.5,0,27.0,21.0,25.0,27.0,67.5,52.5,62.5,67.5,0,25.8,23.7,24.7,25.8,62.5,57.5,60.0,62.5,0,25.8,23.6,24.7,25.8,57.5,52.5,55.0,57.5,0,25.9,23.5,24.7,25.9,52.5,47.5,50.0,52.5,3,27.1,21.2,22.4,29.4,57.5,45.0,47.5,62.5,3,26.9,21.5,22.6,29.0,62.5,50.0,52.5,67.5,3,26.7,21.8,22.8,28.7,67.5,55.0,57.5,72.5,3,25.5,24.5,22.4,27.6,62.5,60.0,55.0,67.5,3,25.6,24.4,22.2,27.8,57.5,55.0,50.0,62.5,3,25.6,24.4,22.0,28.0,52.5,50.0,45.0,57.5,3,27.3,20.8,22.1,29.9,52.5,40.0,42.5,57.5,3,27.1,21.2,22.4,29.4,57.5,45.0,47.5,62.5,3,26.9,21.5,22.6,29.0,62.5,50.0,52.5,67.5,3,25.6,24.4,22.2,27.8,57.5,55.0,50.0,62.5,3,25.6,24.4,22.0,28.0,52.5,50.0,45.0,57.5,3,25.7,24.3,21.6,28.4,47.5,45.0,40.0,52.5,2,25.7,17.6,31.1,25.7,47.5,32.5,57.5,47.5,2,25.6,18.3,30.5,25.6,52.5,37.5,62.5,52.5,2,25.6,18.9,30.0,25.6,57.5,42.5,67.5,57.5,2,24.1,21.8,29.9,24.1,52.5,47.5,65.0,52.5,2,24.1,21.5,30.4,24.1,47.5,42.5,60.0,47.5,2,23.9,21.1,31.0,23.9,42.5,37.5,55.0,42.5,2,25.6,18.3,30.5,25.6,52.5,37.5,62.5,52.5,2,25.6,18.9,30.0,25.6,57.5,42.5,67.5,57.5,2,25.5,19.4,29.6,25.5,62.5,47.5,72.5,62.5,2,24.2,22.1,29.5,24.2,57.5,52.5,70.0,57.5,2,24.1,21.8,29.9,24.1,52.5,47.5,65.0,52.5,2,24.1,21.5,30.4,24.1,47.5,42.5,60.0,47.5,2,26.1,19.3,28.4,26.1,57.5,42.5,62.5,57.5,2,26.0,19.8,28.1,26.0,62.5,47.5,67.5,62.5,2,26.0,20.2,27.9,26.0,67.5,52.5,72.5,67.5,2,24.8,22.8,27.7,24.8,62.5,57.5,70.0,62.5,2,24.7,22.6,28.0,24.7,57.5,52.5,65.0,57.5,2,24.7,22.4,28.2,24.7,52.5,47.5,60.0,52.5,0,27.2,20.7,25.0,27.2,62.5,47.5,57.5,62.5,0,27.0,21.0,25.0,27.0,67.5,52.5,62.5,67.5,0,26.9,21.3,25.0,26.9,72.5,57.5,67.5,72.5,0,25.7,23.8,24.8,25.7,67.5,62.5,65.0,67.5,0,25.8,23.7,24.7,25.8,62.5,57.5,60.0,62.5,0,25.8,23.6,24.7,25.8,57.5,52.5,55.0,57.5,3,26.9,21.5,22.6,29.0,62.5,50.0,52.5,67.5,3,26.7,21.8,22.8,28.7,67.5,55.0,57.5,72.5,3,26.6,22.0,22.9,28.4,72.5,60.0,62.5,77.5,3,25.5,24.5,22.6,27.4,67.5,65.0,60.0,72.5,3,25.5,24.5,22.4,27.6,62.5,60.0,55.0,67.5,3,25.6,24.4,22.2,27.8,57.5,55.0,50.0,62.5,3,27.1,21.2,22.4,29.4,57.5,45.0,47.5,62.5,3,26.9,21.5,22.6,29.0,62.5,50.0,52.5,67.5,3,26.7,21.8,22.8,28.7,67.5,55.0,57.5,72.5,3,25.5,24.5,22.4,27.6,62.5,60.0,55.0,67.5,3,25.6,24.4,22.2,27.8,57.5,55.0,50.0,62.5,3,25.6,24.4,22.0,28.0,52.5,50.0,45.0,57.5,2,25.3,19.0,31.6,24.1,50.0,37.5,62.5,47.5,2,25.3,19.5,31.0,24.1,55.0,42.5,67.5,52.5,2,25.3,20.0,30.5,24.2,60.0,47.5,72.5,57.5,2,23.9,22.8,30.4,22.8,55.0,52.5,70.0,52.5,2,23.8,22.6,31.0,22.6,50.0,47.5,65.0,47.5,2,23.7,22.4,31.6,22.4,45.0,42.5,60.0,42.5,2,25.3,19.5,31.0,24.1,55.0,42.5,67.5,52.5,2,25.3,20.0,30.5,24.2,60.0,47.5,72.5,57.5,2,25.2,20.4,30.1,24.3,65.0,52.5,77.5,62.5,2,24.0,23.0,30.0,23.0,60.0,57.5,75.0,57.5,2,23.9,22.8,30.4,22.8,55.0,52.5,70.0,52.5,2,23.8,22.6,31.0,22.6,50.0,47.5,65.0,47.5,2,25.8,20.4,29.0,24.7,60.0,47.5,67.5,57.5,2,25.7,20.8,28.7,24.8,65.0,52.5,72.5,62.5,2,25.7,21.1,28.4,24.8,70.0,57.5,77.5,67.5,2,24.5,23.6,28.3,23.6,65.0,62.5,75.0,62.5,2,24.5,23.5,28.6,23.5,60.0,57.5,70.0,57.5,2,24.4,23.3,28.9,23.3,55.0,52.5,65.0,52.5,0,26.8,21.6,25.8,25.8,65.0,52.5,62.5,62.5,0,26.7,21.9,25.7,25.7,70.0,57.5,67.5,67.5,0,26.5,22.1,25.7,25.7,75.0,62.5,72.5,72.5,0,25.5,24.5,25.5,24.5,70.0,67.5,70.0,67.5,0,25.5,24.5,25.5,24.5,65.0,62.5,65.0,62.5,0,25.5,24.5,25.5,24.5,60.0,57.5,60.0,57.5,3,26.5,22.4,23.5,27.6,65.0,55.0,57.5,67.5,3,26.4,22.6,23.6,27.4,70.0,60.0,62.5,72.5,3,26.3,22.8,23.7,27.2,75.0,65.0,67.5,77.5,3,25.2,25.2,23.4,26.1,70.0,70.0,65.0,72.5,3,25.2,25.2,23.3,26.2,65.0,65.0,60.0,67.5,3,25.3,25.3,23.2,26.3,60.0,60.0,55.0,62.5,3,26.7,22.2,23.3,27.8,60.0,50.0,52.5,62.5,3,26.5,22.4,23.5,27.6,65.0,55.0,57.5,67.5,3,26.4,22.6,23.6,27.4,70.0,60.0,62.5,72.5,3,25.2,25.2,23.3,26.2,65.0,65.0,60.0,67.5,3,25.3,25.3,23.2,26.3,60.0,60.0,55.0,62.5,3,25.3,25.3,23.0,26.4,55.0,55.0,50.0,57.5,2,22.8,21.5,34.2,21.5,45.0,42.5,67.5,42.5,2,23.0,21.8,33.3,21.8,50.0,47.5,72.5,47.5,2,23.2,22.1,32.6,22.1,55.0,52.5,77.5,52.5,2,21.7,25.0,32.6,20.7,50.0,57.5,75.0,47.5,2,21.4,25.0,33.3,20.2,45.0,52.5,70.0,42.5,2,21.1,25.0,34.2,19.7,40.0,47.5,65.0,37.5,2,23.0,21.8,33.3,21.8,50.0,47.5,72.5,47.5,2,23.2,22.1,32.6,22.1,55.0,52.5,77.5,52.5,2,23.3,22.3,32.0,22.3,60.0,57.5,82.5,57.5,2,22.0,25.0,32.0,21.0,55.0,62.5,80.0,52.5,2,21.7,25.0,32.6,20.7,50.0,57.5,75.0,47.5,2,21.4,25.0,33.3,20.2,45.0,52.5,70.0,42.5,2,23.7,22.6,31.2,22.6,55.0,52.5,72.5,52.5,2,23.8,22.8,30.7,22.8,60.0,57.5,77.5,57.5,2,23.9,22.9,30.3,22.9,65.0,62.5,82.5,62.5,2,22.6,25.5,30.2,21.7,60.0,67.5,80.0,57.5,2,22.4,25.5,30.6,21.4,55.0,62.5,75.0,52.5,2,22.2,25.6,31.1,21.1,50.0,57.5,70.0,47.5,2,24.7,23.7,27.8,23.7,60.0,57.5,67.5,57.5,2,24.8,23.8,27.6,23.8,65.0,62.5,72.5,62.5,2,24.8,23.9,27.4,23.9,70.0,67.5,77.5,67.5,2,23.6,26.4,27.3,22.7,65.0,72.5,75.0,62.5,2,23.5,26.5,27.5,22.5,60.0,67.5,70.0,57.5,2,23.4,26.6,27.7,22.3,55.0,62.5,65.0,52.5,2,24.5,24.5,25.5,25.5,60.0,60.0,62.5,62.5,2,24.5,24.5,25.5,25.5,65.0,65.0,67.5,67.5,2,24.6,24.6,25.4,25.4,70.0,70.0,72.5,72.5,1,23.4,27.0,25.2,24.3,65.0,75.0,70.0,67.5,1,23.3,27.2,25.2,24.3,60.0,70.0,65.0,62.5,1,23.2,27.4,25.3,24.2,55.0,65.0,60.0,57.5,2,24.4,24.4,25.6,25.6,55.0,55.0,57.5,57.5,2,24.5,24.5,25.5,25.5,60.0,60.0,62.5,62.5,2,24.5,24.5,25.5,25.5,65.0,65.0,67.5,67.5,1,23.3,27.2,25.2,24.3,60.0,70.0,65.0,62.5,1,23.2,27.4,25.3,24.2,55.0,65.0,60.0,57.5,1,23.0,27.6,25.3,24.1,50.0,60.0,55.0,52.5,2,20.5,24.4,35.9,19.2,40.0,47.5,70.0,37.5,2,20.9,24.4,34.9,19.8,45.0,52.5,75.0,42.5,2,21.3,24.5,34.0,20.2,50.0,57.5,80.0,47.5,2,19.8,27.5,34.1,18.7,45.0,62.5,77.5,42.5,2,19.3,27.7,34.9,18.1,40.0,57.5,72.5,37.5,2,18.7,28.0,36.0,17.3,35.0,52.5,67.5,32.5,2,20.9,24.4,34.9,19.8,45.0,52.5,75.0,42.5,2,21.3,24.5,34.0,20.2,50.0,57.5,80.0,47.5,2,21.6,24.5,33.3,20.6,55.0,62.5,85.0,52.5,2,20.2,27.3,33.3,19.2,50.0,67.5,82.5,47.5,2,19.8,27.5,34.1,18.7,45.0,62.5,77.5,42.5,2,19.3,27.7,34.9,18.1,40.0,57.5,72.5,37.5,2,21.7,25.0,32.6,20.7,50.0,57.5,75.0,47.5,2,22.0,25.0,32.0,21.0,55.0,62.5,80.0,52.5,2,22.2,25.0,31.5,21.3,60.0,67.5,85.0,57.5,2,21.0,27.6,31.4,20.0,55.0,72.5,82.5,52.5,2,20.6,27.8,32.0,19.6,50.0,67.5,77.5,47.5,2,20.2,28.1,32.6,19.1,45.0,62.5,72.5,42.5,2,22.9,26.0,29.2,21.9,55.0,62.5,70.0,52.5,2,23.1,26.0,28.8,22.1,60.0,67.5,75.0,57.5,2,23.2,25.9,28.6,22.3,65.0,72.5,80.0,62.5,1,22.0,28.4,28.4,21.1,60.0,77.5,77.5,57.5,1,21.8,28.7,28.7,20.8,55.0,72.5,72.5,52.5,1,21.5,29.0,29.0,20.4,50.0,67.5,67.5,47.5,1,22.7,26.8,26.8,23.7,55.0,65.0,65.0,57.5,1,22.9,26.7,26.7,23.8,60.0,70.0,70.0,62.5,1,23.0,26.5,26.5,23.9,65.0,75.0,75.0,67.5,1,21.8,29.1,26.4,22.7,60.0,80.0,72.5,62.5,1,21.6,29.4,26.5,22.5,55.0,75.0,67.5,57.5,1,21.3,29.8,26.6,22.3,50.0,70.0,62.5,52.5,1,22.5,27.0,27.0,23.6,50.0,60.0,60.0,52.5,1,22.7,26.8,26.8,23.7,55.0,65.0,65.0,57.5,1,22.9,26.7,26.7,23.8,60.0,70.0,70.0,62.5,1,21.6,29.4,26.5,22.5,55.0,75.0,67.5,57.5,1,21.3,29.8,26.6,22.3,50.0,70.0,62.5,52.5,1,20.9,30.2,26.7,22.1,45.0,65.0,57.5,47.5,2,19.7,25.4,36.6,18.3,35.0,45.0,65.0,32.5,2,20.3,25.3,35.4,19.0,40.0,50.0,70.0,37.5,2,20.7,25.3,34.5,19.5,45.0,55.0,75.0,42.5,2,19.0,28.6,34.5,17.9,40.0,60.0,72.5,37.5,2,18.4,28.9,35.5,17.1,35.0,55.0,67.5,32.5,2,17.6,29.4,36.8,16.2,30.0,50.0,62.5,27.5,2,20.3,25.3,35.4,19.0,40.0,50.0,70.0,37.5,2,20.7,25.3,34.5,19.5,45.0,55.0,75.0,42.5,2,21.1,25.3,33.7,20.0,50.0,60.0,80.0,47.5,2,19.6,28.3,33.7,18.5,45.0,65.0,77.5,42.5,2,19.0,28.6,34.5,17.9,40.0,60.0,72.5,37.5,2,18.4,28.9,35.5,17.1,35.0,55.0,67.5,32.5,2,21.2,25.9,32.9,20.0,45.0,55.0,70.0,42.5,2,21.5,25.8,32.3,20.4,50.0,60.0,75.0,47.5,2,21.8,25.7,31.7,20.8,55.0,65.0,80.0,52.5,2,20.4,28.6,31.6,19.4,50.0,70.0,77.5,47.5,2,20.0,28.9,32.2,18.9,45.0,65.0,72.5,42.5,2,19.5,29.3,32.9,18.3,40.0,60.0,67.5,37.5,2,22.5,27.0,29.2,21.3,50.0,60.0,65.0,47.5,2,22.7,26.8,28.9,21.6,55.0,65.0,70.0,52.5,2,22.9,26.7,28.6,21.9,60.0,70.0,75.0,57.5,1,21.6,29.4,28.4,20.6,55.0,75.0,72.5,52.5,1,21.3,29.8,28.7,20.2,50.0,70.0,67.5,47.5,1,20.9,30.2,29.1,19.8,45.0,65.0,62.5,42.5,1,22.2,27.8,26.7,23.3,50.0,62.5,60.0,52.5,1,22.4,27.6,26.5,23.5,55.0,67.5,65.0,57.5,1,22.6,27.4,26.4,23.6,60.0,72.5,70.0,62.5,1,21.4,30.1,26.2,22.3,55.0,77.5,67.5,57.5,1,21.1,30.5,26.3,22.1,50.0,72.5,62.5,52.5,1,20.7,31.0,26.4,21.8,45.0,67.5,57.5,47.5,1,22.0,28.0,26.8,23.2,45.0,57.5,55.0,47.5,1,22.2,27.8,26.7,23.3,50.0,62.5,60.0,52.5,1,22.4,27.6,26.5,23.5,55.0,67.5,65.0,57.5,1,21.1,30.5,26.3,22.1,50.0,72.5,62.5,52.5,1,20.7,31.0,26.4,21.8,45.0,67.5,57.5,47.5,1,20.3,31.6,26.6,21.5,40.0,62.5,52.5,42.5,2,25.7,17.6,31.1,25.7,47.5,32.5,57.5,47.5,2,25.6,18.3,30.5,25.6,52.5,37.5,62.5,52.5,2,25.6,18.9,30.0,25.6,57.5,42.5,67.5,57.5,2,24.1,21.8,29.9,24.1,52.5,47.5,65.0,52.5,2,24.1,21.5,30.4,24.1,47.5,42.5,60.0,47.5,2,23.9,21.1,31.0,23.9,42.5,37.5,55.0,42.5,2,25.6,18.3,30.5,25.6,52.5,37.5,62.5,52.5,2,25.6,18.9,30.0,25.6,57.5,42.5,67.5,57.5,2,25.5,19.4,29.6,25.5,62.5,47.5,72.5,62.5,2,24.2,22.1,29.5,24.2,57.5,52.5,70.0,57.5,2,24.1,21.8,29.9,24.1,52.5,47.5,65.0,52.5,2,24.1,21.5,30.4,24.1,47.5,42.5,60.0,47.5,2,26.1,19.3,28.4,26.1,57.5,42.5,62.5,57.5,2,26.0,19.8,28.1,26.0,62.5,47.5,67.5,62.5,2,26.0,20.2,27.9,26.0,67.5,52.5,72.5,67.5,2,24.8,22.8,27.7,24.8,62.5,57.5,70.0,62.5,2,24.7,22.6,28.0,24.7,57.5,52.5,65.0,57.5,2,24.7,22.4,28.2,24.7,52.5,47.5,60.0,52.5,0,27.2,20.7,25.0,27.2,62.5,47.5,57.5,62.5,0,27.0,21.0,25.0,27.0,67.5,52.5,62.5,67.5,0,26.9,21.3,25.0,26.9,72.5,57.5,67.5,72.5,0,25.7,23.8,24.8,25.7,67.5,62.5,65.0,67.5,0,25.8,23.7,24.7,25.8,62.5,57.5,60.0,62.5,0,25.8,23.6,24.7,25.8,57.5,52.5,55.0,57.5,3,26.9,21.5,22.6,29.0,62.5,50.0,52.5,67.5,3,26.7,21.8,22.8,28.7,67.5,55.0,57.5,72.5,3,26.6,22.0,22.9,28.4,72.5,60.0,62.5,77.5,3,25.5,24.5,22.6,27.4,67.5,65.0,60.0,72.5,3,25.5,24.5,22.4,27.6,62.5,60.0,55.0,67.5,3,25.6,24.4,22.2,27.8,57.5,55.0,50.0,62.5,3,27.1,21.2,22.4,29.4,57.5,45.0,47.5,62.5,3,26.9,21.5,22.6,29.0,62.5,50.0,52.5,67.5,3,26.7,21.8,22.8,28.7,67.5,55.0,57.5,72.5,3,25.5,24.5,22.4,27.6,62.5,60.0,55.0,67.5,3,25.6,24.4,22.2,27.8,57.5,55.0,50.0,62.5,3,25.6,24.4,22.0,28.0,52.5,50.0,45.0,57.5,2,25.6,18.3,30.5,25.6,52.5,37.5,62.5,52.5,2,25.6,18.9,30.0,25.6,57.5,42.5,67.5,57.5,2,25.5,19.4,29.6,25.5,62.5,47.5,72.5,62.5,2,24.2,22.1,29.5,24.2,57.5,52.5,70.0,57.5,2,24.1,21.8,29.9,24.1,52.5,47.5,65.0,52.5,2,24.1,21.5,30.4,24.1,47.5,42.5,60.0,47.5,2,25.6,18.9,30.0,25.6,57.5,42.5,67.5,57.5,2,25.5,19.4,29.6,25.5,62.5,47.5,72.5,62.5,2,25.5,19.8,29.2,25.5,67.5,52.5,77.5,67.5,2,24.3,22.3,29.1,24.3,62.5,57.5,75.0,62.5,2,24.2,22.1,29.5,24.2,57.5,52.5,70.0,57.5,2,24.1,21.8,29.9,24.1,52.5,47.5,65.0,52.5,2,26.0,19.8,28.1,26.0,62.5,47.5,67.5,62.5,2,26.0,20.2,27.9,26.0,67.5,52.5,72.5,67.5,2,25.9,20.5,27.7,25.9,72.5,57.5,77.5,72.5,2,24.8,22.9,27.5,24.8,67.5,62.5,75.0,67.5,2,24.8,22.8,27.7,24.8,62.5,57.5,70.0,62.5,2,24.7,22.6,28.0,24.7,57.5,52.5,65.0,57.5,0,27.0,21.0,25.0,27.0,67.5,52.5,62.5,67.5,0,26.9,21.3,25.0,26.9,72.5,57.5,67.5,72.5,0,26.7,21.6,25.0,26.7,77.5,62.5,72.5,77.5,0,25.7,23.9,24.8,25.7,72.5,67.5,70.0,72.5,0,25.7,23.8,24.8,25.7,67.5,62.5,65.0,67.5,0,25.8,23.7,24.7,25.8,62.5,57.5,60.0,62.5,3,26.7,21.8,22.8,28.7,67.5,55.0,57.5,72.5,3,26.6,22.0,22.9,28.4,72.5,60.0,62.5,77.5,3,26.5,22.2,23.1,28.2,77.5,65.0,67.5,82.5,3,25.4,24.6,22.8,27.2,72.5,70.0,65.0,77.5,3,25.5,24.5,22.6,27.4,67.5,65.0,60.0,72.5,3,25.5,24.5,22.4,27.6,62.5,60.0,55.0,67.5,3,26.9,21.5,22.6,29.0,62.5,50.0,52.5,67.5,3,26.7,21.8,22.8,28.7,67.5,55.0,57.5,72.5,3,26.6,22.0,22.9,28.4,72.5,60.0,62.5,77.5,3,25.5,24.5,22.6,27.4,67.5,65.0,60.0,72.5,3,25.5,24.5,22.4,27.6,62.5,60.0,55.0,67.5,3,25.6,24.4,22.2,27.8,57.5,55.0,50.0,62.5,2,25.3,19.5,31.0,24.1,55.0,42.5,67.5,52.5,2,25.3,20.0,30.5,24.2,60.0,47.5,72.5,57.5,2,25.2,20.4,30.1,24.3,65.0,52.5,77.5,62.5,2,24.0,23.0,30.0,23.0,60.0,57.5,75.0,57.5,2,23.9,22.8,30.4,22.8,55.0,52.5,70.0,52.5,2,23.8,22.6,31.0,22.6,50.0,47.5,65.0,47.5,2,25.3,20.0,30.5,24.2,60.0,47.5,72.5,57.5,2,25.2,20.4,30.1,24.3,65.0,52.5,77.5,62.5,2,25.2,20.7,29.7,24.3,70.0,57.5,82.5,67.5,2,24.1,23.1,29.6,23.1,65.0,62.5,80.0,62.5,2,24.0,23.0,30.0,23.0,60.0,57.5,75.0,57.5,2,23.9,22.8,30.4,22.8,55.0,52.5,70.0,52.5,2,25.7,20.8,28.7,24.8,65.0,52.5,72.5,62.5,2,25.7,21.1,28.4,24.8,70.0,57.5,77.5,67.5,2,25.6,21.4,28.2,24.8,75.0,62.5,82.5,72.5,2,24.6,23.7,28.1,23.7,70.0,67.5,80.0,67.5,2,24.5,23.6,28.3,23.6,65.0,62.5,75.0,62.5,2,24.5,23.5,28.6,23.5,60.0,57.5,70.0,57.5,0,26.7,21.9,25.7,25.7,70.0,57.5,67.5,67.5,0,26.5,22.1,25.7,25.7,75.0,62.5,72.5,72.5,0,26.4,22.3,25.6,25.6,80.0,67.5,77.5,77.5,0,25.4,24.6,25.4,24.6,75.0,72.5,75.0,72.5,0,25.5,24.5,25.5,24.5,70.0,67.5,70.0,67.5,0,25.5,24.5,25.5,24.5,65.0,62.5,65.0,62.5,3,26.4,22.6,23.6,27.4,70.0,60.0,62.5,72.5,3,26.3,22.8,23.7,27.2,75.0,65.0,67.5,77.5,3,26.2,23.0,23.8,27.0,80.0,70.0,72.5,82.5,3,25.2,25.2,23.5,26.1,75.0,75.0,70.0,77.5,3,25.2,25.2,23.4,26.1,70.0,70.0,65.0,72.5,3,25.2,25.2,23.3,26.2,65.0,65.0,60.0,67.5,3,26.5,22.4,23.5,27.6,65.0,55.0,57.5,67.5,3,26.4,22.6,23.6,27.4,70.0,60.0,62.5,72.5,3,26.3,22.8,23.7,27.2,75.0,65.0,67.5,77.5,3,25.2,25.2,23.4,26.1,70.0,70.0,65.0,72.5,3,25.2,25.2,23.3,26.2,65.0,65.0,60.0,67.5,3,25.3,25.3,23.2,26.3,60.0,60.0,55.0,62.5,2,23.0,21.8,33.3,21.8,50.0,47.5,72.5,47.5,2,23.2,22.1,32.6,22.1,55.0,52.5,77.5,52.5,2,23.3,22.3,32.0,22.3,60.0,57.5,82.5,57.5,2,22.0,25.0,32.0,21.0,55.0,62.5,80.0,52.5,2,21.7,25.0,32.6,20.7,50.0,57.5,75.0,47.5,2,21.4,25.0,33.3,20.2,45.0,52.5,70.0,42.5,2,23.2,22.1,32.6,22.1,55.0,52.5,77.5,52.5,2,23.3,22.3,32.0,22.3,60.0,57.5,82.5,57.5,2,23.4,22.5,31.5,22.5,65.0,62.5,87.5,62.5,2,22.2,25.0,31.5,21.3,60.0,67.5,85.0,57.5,2,22.0,25.0,32.0,21.0,55.0,62.5,80.0,52.5,2,21.7,25.0,32.6,20.7,50.0,57.5,75.0,47.5,2,23.8,22.8,30.7,22.8,60.0,57.5,77.5,57.5,2,23.9,22.9,30.3,22.9,65.0,62.5,82.5,62.5,2,23.9,23.1,29.9,23.1,70.0,67.5,87.5,67.5,2,22.8,25.4,29.8,21.9,65.0,72.5,85.0,62.5,2,22.6,25.5,30.2,21.7,60.0,67.5,80.0,57.5,2,22.4,25.5,30.6,21.4,55.0,62.5,75.0,52.5,2,24.8,23.8,27.6,23.8,65.0,62.5,72.5,62.5,2,24.8,23.9,27.4,23.9,70.0,67.5,77.5,67.5,2,24.8,24.0,27.3,24.0,75.0,72.5,82.5,72.5,2,23.7,26.3,27.1,22.9,70.0,77.5,80.0,67.5,2,23.6,26.4,27.3,22.7,65.0,72.5,75.0,62.5,2,23.5,26.5,27.5,22.5,60.0,67.5,70.0,57.5,2,24.5,24.5,25.5,25.5,65.0,65.0,67.5,67.5,2,24.6,24.6,25.4,25.4,70.0,70.0,72.5,72.5,2,24.6,24.6,25.4,25.4,75.0,75.0,77.5,77.5,1,23.5,26.9,25.2,24.4,70.0,80.0,75.0,72.5,1,23.4,27.0,25.2,24.3,65.0,75.0,70.0,67.5,1,23.3,27.2,25.2,24.3,60.0,70.0,65.0,62.5,2,24.5,24.5,25.5,25.5,60.0,60.0,62.5,62.5,2,24.5,24.5,25.5,25.5,65.0,65.0,67.5,67.5,2,24.6,24.6,25.4,25.4,70.0,70.0,72.5,72.5,1,23.4,27.0,25.2,24.3,65.0,75.0,70.0,67.5,1,23.3,27.2,25.2,24.3,60.0,70.0,65.0,62.5,1,23.2,27.4,25.3,24.2,55.0,65.0,60.0,57.5,2,20.9,24.4,34.9,19.8,45.0,52.5,75.0,42.5,2,21.3,24.5,34.0,20.2,50.0,57.5,80.0,47.5,2,21.6,24.5,33.3,20.6,55.0,62.5,85.0,52.5,2,20.2,27.3,33.3,19.2,50.0,67.5,82.5,47.5,2,19.8,27.5,34.1,18.7,45.0,62.5,77.5,42.5,2,19.3,27.7,34.9,18.1,40.0,57.5,72.5,37.5,2,21.3,24.5,34.0,20.2,50.0,57.5,80.0,47.5,2,21.6,24.5,33.3,20.6,55.0,62.5,85.0,52.5,2,21.8,24.5,32.7,20.9,60.0,67.5,90.0,57.5,2,20.6,27.1,32.7,19.6,55.0,72.5,87.5,52.5,2,20.2,27.3,33.3,19.2,50.0,67.5,82.5,47.5,2,19.8,27.5,34.1,18.7,45.0,62.5,77.5,42.5,2,22.0,25.0,32.0,21.0,55.0,62.5,80.0,52.5,2,22.2,25.0,31.5,21.3,60.0,67.5,85.0,57.5,2,22.4,25.0,31.0,21.6,65.0,72.5,90.0,62.5,2,21.2,27.4,31.0,20.4,60.0,77.5,87.5,57.5,2,21.0,27.6,31.4,20.0,55.0,72.5,82.5,52.5,2,20.6,27.8,32.0,19.6,50.0,67.5,77.5,47.5,2,23.1,26.0,28.8,22.1,60.0,67.5,75.0,57.5,2,23.2,25.9,28.6,22.3,65.0,72.5,80.0,62.5,2,23.3,25.8,28.3,22.5,70.0,77.5,85.0,67.5,1,22.2,28.2,28.2,21.4,65.0,82.5,82.5,62.5,1,22.0,28.4,28.4,21.1,60.0,77.5,77.5,57.5,1,21.8,28.7,28.7,20.8,55.0,72.5,72.5,52.5,1,22.9,26.7,26.7,23.8,60.0,70.0,70.0,62.5,1,23.0,26.5,26.5,23.9,65.0,75.0,75.0,67.5,1,23.1,26.4,26.4,24.0,70.0,80.0,80.0,72.5,1,22.0,28.8,26.3,22.9,65.0,85.0,77.5,67.5,1,21.8,29.1,26.4,22.7,60.0,80.0,72.5,62.5,1,21.6,29.4,26.5,22.5,55.0,75.0,67.5,57.5,1,22.7,26.8,26.8,23.7,55.0,65.0,65.0,57.5,1,22.9,26.7,26.7,23.8,60.0,70.0,70.0,62.5,1,23.0,26.5,26.5,23.9,65.0,75.0,75.0,67.5,1,21.8,29.1,26.4,22.7,60.0,80.0,72.5,62.5,1,21.6,29.4,26.5,22.5,55.0,75.0,67.5,57.5,1,21.3,29.8,26.6,22.3,50.0,70.0,62.5,52.5,2,20.3,25.3,35.4,19.0,40.0,50.0,70.0,37.5,2,20.7,25.3,34.5,19.5,45.0,55.0,75.0,42.5,2,21.1,25.3,33.7,20.0,50.0,60.0,80.0,47.5,2,19.6,28.3,33.7,18.5,45.0,65.0,77.5,42.5,2,19.0,28.6,34.5,17.9,40.0,60.0,72.5,37.5,2,18.4,28.9,35.5,17.1,35.0,55.0,67.5,32.5,2,20.7,25.3,34.5,19.5,45.0,55.0,75.0,42.5,2,21.1,25.3,33.7,20.0,50.0,60.0,80.0,47.5,2,21.4,25.2,33.0,20.4,55.0,65.0,85.0,52.5,2,20.0,28.0,33.0,19.0,50.0,70.0,82.5,47.5,2,19.6,28.3,33.7,18.5,45.0,65.0,77.5,42.5,2,19.0,28.6,34.5,17.9,40.0,60.0,72.5,37.5,2,21.5,25.8,32.3,20.4,50.0,60.0,75.0,47.5,2,21.8,25.7,31.7,20.8,55.0,65.0,80.0,52.5,2,22.0,25.7,31.2,21.1,60.0,70.0,85.0,57.5,2,20.8,28.3,31.1,19.8,55.0,75.0,82.5,52.5,2,20.4,28.6,31.6,19.4,50.0,70.0,77.5,47.5,2,20.0,28.9,32.2,18.9,45.0,65.0,72.5,42.5,2,22.7,26.8,28.9,21.6,55.0,65.0,70.0,52.5,2,22.9,26.7,28.6,21.9,60.0,70.0,75.0,57.5,2,23.0,26.5,28.3,22.1,65.0,75.0,80.0,62.5,1,21.8,29.1,28.2,20.9,60.0,80.0,77.5,57.5,1,21.6,29.4,28.4,20.6,55.0,75.0,72.5,52.5,1,21.3,29.8,28.7,20.2,50.0,70.0,67.5,47.5,1,22.4,27.6,26.5,23.5,55.0,67.5,65.0,57.5,1,22.6,27.4,26.4,23.6,60.0,72.5,70.0,62.5,1,22.8,27.2,26.3,23.7,65.0,77.5,75.0,67.5,1,21.6,29.7,26.1,22.5,60.0,82.5,72.5,62.5,1,21.4,30.1,26.2,22.3,55.0,77.5,67.5,57.5,1,21.1,30.5,26.3,22.1,50.0,72.5,62.5,52.5,1,22.2,27.8,26.7,23.3,50.0,62.5,60.0,52.5,1,22.4,27.6,26.5,23.5,55.0,67.5,65.0,57.5,1,22.6,27.4,26.4,23.6,60.0,72.5,70.0,62.5,1,21.4,30.1,26.2,22.3,55.0,77.5,67.5,57.5,1,21.1,30.5,26.3,22.1,50.0,72.5,62.5,52.5,1,20.7,31.0,26.4,21.8,45.0,67.5,57.5,47.5,2,25.6,18.3,30.5,25.6,52.5,37.5,62.5,52.5,2,25.6,18.9,30.0,25.6,57.5,42.5,67.5,57.5,2,25.5,19.4,29.6,25.5,62.5,47.5,72.5,62.5,2,24.2,22.1,29.5,24.2,57.5,52.5,70.0,57.5,2,24.1,21.8,29.9,24.1,52.5,47.5,65.0,52.5,2,24.1,21.5,30.4,24.1,47.5,42.5,60.0,47.5,2,25.6,18.9,30.0,25.6,57.5,42.5,67.5,57.5,2,25.5,19.4,29.6,25.5,62.5,47.5,72.5,62.5,2,25.5,19.8,29.2,25.5,67.5,52.5,77.5,67.5,2,24.3,22.3,29.1,24.3,62.5,57.5,75.0,62.5,2,24.2,22.1,29.5,24.2,57.5,52.5,70.0,57.5,2,24.1,21.8,29.9,24.1,52.5,47.5,65.0,52.5,2,26.0,19.8,28.1,26.0,62.5,47.5,67.5,62.5,2,26.0,20.2,27.9,26.0,67.5,52.5,72.5,67.5,2,25.9,20.5,27.7,25.9,72.5,57.5,77.5,72.5,2,24.8,22.9,27.5,24.8,67.5,62.5,75.0,67.5,2,24.8,22.8,27.7,24.8,62.5,57.5,70.0,62.5,2,24.7,22.6,28.0,24.7,57.5,52.5,65.0,57.5,0,27.0,21.0,25.0,27.0,67.5,52.5,62.5,67.5,0,26.9,21.3,25.0,26.9,72.5,57.5,67.5,72.5,0,26.7,21.6,25.0,26.7,77.5,62.5,72.5,77.5,0,25.7,23.9,24.8,25.7,72.5,67.5,70.0,72.5,0,25.7,23.8,24.8,25.7,67.5,62.5,65.0,67.5,0,25.8,23.7,24.7,25.8,62.5,57.5,60.0,62.5,3,26.7,21.8,22.8,28.7,67.5,55.0,57.5,72.5,3,26.6,22.0,22.9,28.4,72.5,60.0,62.5,77.5,3,26.5,22.2,23.1,28.2,77.5,65.0,67.5,82.5,3,25.4,24.6,22.8,27.2,72.5,70.0,65.0,77.5,3,25.5,24.5,22.6,27.4,67.5,65.0,60.0,72.5,3,25.5,24.5,22.4,27.6,62.5,60.0,55.0,67.5,3,26.9,21.5,22.6,29.0,62.5,50.0,52.5,67.5,3,26.7,21.8,22.8,28.7,67.5,55.0,57.5,72.5,3,26.6,22.0,22.9,28.4,72.5,60.0,62.5,77.5,3,25.5,24.5,22.6,27.4,67.5,65.0,60.0,72.5,3,25.5,24.5,22.4,27.6,62.5,60.0,55.0,67.5,3,25.6,24.4,22.2,27.8,57.5,55.0,50.0,62.5,2,25.6,18.9,30.0,25.6,57.5,42.5,67.5,57.5,2,25.5,19.4,29.6,25.5,62.5,47.5,72.5,62.5,2,25.5,19.8,29.2,25.5,67.5,52.5,77.5,67.5,2,24.3,22.3,29.1,24.3,62.5,57.5,75.0,62.5,2,24.2,22.1,29.5,24.2,57.5,52.5,70.0,57.5,2,24.1,21.8,29.9,24.1,52.5,47.5,65.0,52.5,2,25.5,19.4,29.6,25.5,62.5,47.5,72.5,62.5,2,25.5,19.8,29.2,25.5,67.5,52.5,77.5,67.5,2,25.4,20.2,28.9,25.4,72.5,57.5,82.5,72.5,2,24.3,22.5,28.8,24.3,67.5,62.5,80.0,67.5,2,24.3,22.3,29.1,24.3,62.5,57.5,75.0,62.5,2,24.2,22.1,29.5,24.2,57.5,52.5,70.0,57.5,2,26.0,20.2,27.9,26.0,67.5,52.5,72.5,67.5,2,25.9,20.5,27.7,25.9,72.5,57.5,77.5,72.5,2,25.8,20.8,27.5,25.8,77.5,62.5,82.5,77.5,2,24.8,23.1,27.4,24.8,72.5,67.5,80.0,72.5,2,24.8,22.9,27.5,24.8,67.5,62.5,75.0,67.5,2,24.8,22.8,27.7,24.8,62.5,57.5,70.0,62.5,0,26.9,21.3,25.0,26.9,72.5,57.5,67.5,72.5,0,26.7,21.6,25.0,26.7,77.5,62.5,72.5,77.5,0,26.6,21.8,25.0,26.6,82.5,67.5,77.5,82.5,0,25.6,24.0,24.8,25.6,77.5,72.5,75.0,77.5,0,25.7,23.9,24.8,25.7,72.5,67.5,70.0,72.5,0,25.7,23.8,24.8,25.7,67.5,62.5,65.0,67.5,3,26.6,22.0,22.9,28.4,72.5,60.0,62.5,77.5,3,26.5,22.2,23.1,28.2,77.5,65.0,67.5,82.5,3,26.4,22.4,23.2,28.0,82.5,70.0,72.5,87.5,3,25.4,24.6,23.0,27.0,77.5,75.0,70.0,82.5,3,25.4,24.6,22.8,27.2,72.5,70.0,65.0,77.5,3,25.5,24.5,22.6,27.4,67.5,65.0,60.0,72.5,3,26.7,21.8,22.8,28.7,67.5,55.0,57.5,72.5,3,26.6,22.0,22.9,28.4,72.5,60.0,62.5,77.5,3,26.5,22.2,23.1,28.2,77.5,65.0,67.5,82.5,3,25.4,24.6,22.8,27.2,72.5,70.0,65.0,77.5,3,25.5,24.5,22.6,27.4,67.5,65.0,60.0,72.5,3,25.5,24.5,22.4,27.6,62.5,60.0,55.0,67.5,2,25.3,20.0,30.5,24.2,60.0,47.5,72.5,57.5,2,25.2,20.4,30.1,24.3,65.0,52.5,77.5,62.5,2,25.2,20.7,29.7,24.3,70.0,57.5,82.5,67.5,2,24.1,23.1,29.6,23.1,65.0,62.5,80.0,62.5,2,24.0,23.0,30.0,23.0,60.0,57.5,75.0,57.5,2,23.9,22.8,30.4,22.8,55.0,52.5,70.0,52.5,2,25.2,20.4,30.1,24.3,65.0,52.5,77.5,62.5,2,25.2,20.7,29.7,24.3,70.0,57.5,82.5,67.5,2,25.2,21.0,29.4,24.4,75.0,62.5,87.5,72.5,2,24.1,23.3,29.3,23.3,70.0,67.5,85.0,67.5,2,24.1,23.1,29.6,23.1,65.0,62.5,80.0,62.5,2,24.0,23.0,30.0,23.0,60.0,57.5,75.0,57.5,2,25.7,21.1,28.4,24.8,70.0,57.5,77.5,67.5,2,25.6,21.4,28.2,24.8,75.0,62.5,82.5,72.5,2,25.6,21.6,28.0,24.8,80.0,67.5,87.5,77.5,2,24.6,23.8,27.9,23.8,75.0,72.5,85.0,72.5,2,24.6,23.7,28.1,23.7,70.0,67.5,80.0,67.5,2,24.5,23.6,28.3,23.6,65.0,62.5,75.0,62.5,0,26.5,22.1,25.7,25.7,75.0,62.5,72.5,72.5,0,26.4,22.3,25.6,25.6,80.0,67.5,77.5,77.5,0,26.4,22.5,25.6,25.6,85.0,72.5,82.5,82.5,0,25.4,24.6,25.4,24.6,80.0,77.5,80.0,77.5,0,25.4,24.6,25.4,24.6,75.0,72.5,75.0,72.5,0,25.5,24.5,25.5,24.5,70.0,67.5,70.0,67.5,3,26.3,22.8,23.7,27.2,75.0,65.0,67.5,77.5,3,26.2,23.0,23.8,27.0,80.0,70.0,72.5,82.5,3,26.2,23.1,23.8,26.9,85.0,75.0,77.5,87.5,3,25.2,25.2,23.6,26.0,80.0,80.0,75.0,82.5,3,25.2,25.2,23.5,26.1,75.0,75.0,70.0,77.5,3,25.2,25.2,23.4,26.1,70.0,70.0,65.0,72.5,3,26.4,22.6,23.6,27.4,70.0,60.0,62.5,72.5,3,26.3,22.8,23.7,27.2,75.0,65.0,67.5,77.5,3,26.2,23.0,23.8,27.0,80.0,70.0,72.5,82.5,3,25.2,25.2,23.5,26.1,75.0,75.0,70.0,77.5,3,25.2,25.2,23.4,26.1,70.0,70.0,65.0,72.5,3,25.2,25.2,23.3,26.2,65.0,65.0,60.0,67.5,2,23.2,22.1,32.6,22.1,55.0,52.5,77.5,52.5,2,23.3,22.3,32.0,22.3,60.0,57.5,82.5,57.5,2,23.4,22.5,31.5,22.5,65.0,62.5,87.5,62.5,2,22.2,25.0,31.5,21.3,60.0,67.5,85.0,57.5,2,22.0,25.0,32.0,21.0,55.0,62.5,80.0,52.5,2,21.7,25.0,32.6,20.7,50.0,57.5,75.0,47.5,2,23.3,22.3,32.0,22.3,60.0,57.5,82.5,57.5,2,23.4,22.5,31.5,22.5,65.0,62.5,87.5,62.5,2,23.5,22.7,31.1,22.7,70.0,67.5,92.5,67.5,2,22.4,25.0,31.0,21.6,65.0,72.5,90.0,62.5,2,22.2,25.0,31.5,21.3,60.0,67.5,85.0,57.5,2,22.0,25.0,32.0,21.0,55.0,62.5,80.0,52.5,2,23.9,22.9,30.3,22.9,65.0,62.5,82.5,62.5,2,23.9,23.1,29.9,23.1,70.0,67.5,87.5,67.5,2,24.0,23.2,29.6,23.2,75.0,72.5,92.5,72.5,2,23.0,25.4,29.5,22.1,70.0,77.5,90.0,67.5,2,22.8,25.4,29.8,21.9,65.0,72.5,85.0,62.5,2,22.6,25.5,30.2,21.7,60.0,67.5,80.0,57.5,2,24.8,23.9,27.4,23.9,70.0,67.5,77.5,67.5,2,24.8,24.0,27.3,24.0,75.0,72.5,82.5,72.5,2,24.8,24.0,27.1,24.0,80.0,77.5,87.5,77.5,2,23.8,26.2,27.0,23.0,75.0,82.5,85.0,72.5,2,23.7,26.3,27.1,22.9,70.0,77.5,80.0,67.5,2,23.6,26.4,27.3,22.7,65.0,72.5,75.0,62.5,2,24.6,24.6,25.4,25.4,70.0,70.0,72.5,72.5,2,24.6,24.6,25.4,25.4,75.0,75.0,77.5,77.5,2,24.6,24.6,25.4,25.4,80.0,80.0,82.5,82.5,1,23.6,26.8,25.2,24.4,75.0,85.0,80.0,77.5,1,23.5,26.9,25.2,24.4,70.0,80.0,75.0,72.5,1,23.4,27.0,25.2,24.3,65.0,75.0,70.0,67.5,2,24.5,24.5,25.5,25.5,65.0,65.0,67.5,67.5,2,24.6,24.6,25.4,25.4,70.0,70.0,72.5,72.5,2,24.6,24.6,25.4,25.4,75.0,75.0,77.5,77.5,1,23.5,26.9,25.2,24.4,70.0,80.0,75.0,72.5,1,23.4,27.0,25.2,24.3,65.0,75.0,70.0,67.5,1,23.3,27.2,25.2,24.3,60.0,70.0,65.0,62.5,2,21.3,24.5,34.0,20.2,50.0,57.5,80.0,47.5,2,21.6,24.5,33.3,20.6,55.0,62.5,85.0,52.5,2,21.8,24.5,32.7,20.9,60.0,67.5,90.0,57.5,2,20.6,27.1,32.7,19.6,55.0,72.5,87.5,52.5,2,20.2,27.3,33.3,19.2,50.0,67.5,82.5,47.5,2,19.8,27.5,34.1,18.7,45.0,62.5,77.5,42.5,2,21.6,24.5,33.3,20.6,55.0,62.5,85.0,52.5,2,21.8,24.5,32.7,20.9,60.0,67.5,90.0,57.5,2,22.0,24.6,32.2,21.2,65.0,72.5,95.0,62.5,2,20.9,27.0,32.2,20.0,60.0,77.5,92.5,57.5,2,20.6,27.1,32.7,19.6,55.0,72.5,87.5,52.5,2,20.2,27.3,33.3,19.2,50.0,67.5,82.5,47.5,2,22.2,25.0,31.5,21.3,60.0,67.5,85.0,57.5,2,22.4,25.0,31.0,21.6,65.0,72.5,90.0,62.5,2,22.6,25.0,30.6,21.8,70.0,77.5,95.0,67.5,2,21.5,27.3,30.6,20.7,65.0,82.5,92.5,62.5,2,21.2,27.4,31.0,20.4,60.0,77.5,87.5,57.5,2,21.0,27.6,31.4,20.0,55.0,72.5,82.5,52.5,2,23.2,25.9,28.6,22.3,65.0,72.5,80.0,62.5,2,23.3,25.8,28.3,22.5,70.0,77.5,85.0,67.5,2,23.4,25.8,28.1,22.7,75.0,82.5,90.0,72.5,1,22.4,28.0,28.0,21.6,70.0,87.5,87.5,67.5,1,22.2,28.2,28.2,21.4,65.0,82.5,82.5,62.5,1,22.0,28.4,28.4,21.1,60.0,77.5,77.5,57.5,1,23.0,26.5,26.5,23.9,65.0,75.0,75.0,67.5,1,23.1,26.4,26.4,24.0,70.0,80.0,80.0,72.5,1,23.3,26.4,26.4,24.0,75.0,85.0,85.0,77.5,1,22.2,28.6,26.2,23.0,70.0,90.0,82.5,72.5,1,22.0,28.8,26.3,22.9,65.0,85.0,77.5,67.5,1,21.8,29.1,26.4,22.7,60.0,80.0,72.5,62.5,1,22.9,26.7,26.7,23.8,60.0,70.0,70.0,62.5,1,23.0,26.5,26.5,23.9,65.0,75.0,75.0,67.5,1,23.1,26.4,26.4,24.0,70.0,80.0,80.0,72.5,1,22.0,28.8,26.3,22.9,65.0,85.0,77.5,67.5,1,21.8,29.1,26.4,22.7,60.0,80.0,72.5,62.5,1,21.6,29.4,26.5,22.5,55.0,75.0,67.5,57.5,2,20.7,25.3,34.5,19.5,45.0,55.0,75.0,42.5,2,21.1,25.3,33.7,20.0,50.0,60.0,80.0,47.5,2,21.4,25.2,33.0,20.4,55.0,65.0,85.0,52.5,2,20.0,28.0,33.0,19.0,50.0,70.0,82.5,47.5,2,19.6,28.3,33.7,18.5,45.0,65.0,77.5,42.5,2,19.0,28.6,34.5,17.9,40.0,60.0,72.5,37.5,2,21.1,25.3,33.7,20.0,50.0,60.0,80.0,47.5,2,21.4,25.2,33.0,20.4,55.0,65.0,85.0,52.5,2,21.6,25.2,32.4,20.7,60.0,70.0,90.0,57.5,2,20.4,27.8,32.4,19.4,55.0,75.0,87.5,52.5,2,20.0,28.0,33.0,19.0,50.0,70.0,82.5,47.5,2,19.6,28.3,33.7,18.5,45.0,65.0,77.5,42.5,2,21.8,25.7,31.7,20.8,55.0,65.0,80.0,52.5,2,22.0,25.7,31.2,21.1,60.0,70.0,85.0,57.5,2,22.2,25.6,30.8,21.4,65.0,75.0,90.0,62.5,2,21.1,28.1,30.7,20.2,60.0,80.0,87.5,57.5,2,20.8,28.3,31.1,19.8,55.0,75.0,82.5,52.5,2,20.4,28.6,31.6,19.4,50.0,70.0,77.5,47.5,2,22.9,26.7,28.6,21.9,60.0,70.0,75.0,57.5,2,23.0,26.5,28.3,22.1,65.0,75.0,80.0,62.5,2,23.1,26.4,28.1,22.3,70.0,80.0,85.0,67.5,1,22.0,28.8,28.0,21.2,65.0,85.0,82.5,62.5,1,21.8,29.1,28.2,20.9,60.0,80.0,77.5,57.5,1,21.6,29.4,28.4,20.6,55.0,75.0,72.5,52.5,1,22.6,27.4,26.4,23.6,60.0,72.5,70.0,62.5,1,22.8,27.2,26.3,23.7,65.0,77.5,75.0,67.5,1,23.0,27.0,26.2,23.8,70.0,82.5,80.0,72.5,1,21.8,29.4,26.1,22.7,65.0,87.5,77.5,67.5,1,21.6,29.7,26.1,22.5,60.0,82.5,72.5,62.5,1,21.4,30.1,26.2,22.3,55.0,77.5,67.5,57.5,1,22.4,27.6,26.5,23.5,55.0,67.5,65.0,57.5,1,22.6,27.4,26.4,23.6,60.0,72.5,70.0,62.5,1,22.8,27.2,26.3,23.7,65.0,77.5,75.0,67.5,1,21.6,29.7,26.1,22.5,60.0,82.5,72.5,62.5,1,21.4,30.1,26.2,22.3,55.0,77.5,67.5,57.5,1,21.1,30.5,26.3,22.1,50.0,72.5,62.5,52.5,0,26.7,19.8,26.7,26.7,57.5,42.5,57.5,57.5,0,26.6,20.2,26.6,26.6,62.5,47.5,62.5,62.5,0,26.5,20.6,26.5,26.5,67.5,52.5,67.5,67.5,2,25.3,23.2,26.3,25.3,62.5,57.5,65.0,62.5,2,25.3,23.1,26.4,25.3,57.5,52.5,60.0,57.5,2,25.3,22.9,26.5,25.3,52.5,47.5,55.0,52.5,0,26.6,20.2,26.6,26.6,62.5,47.5,62.5,62.5,0,26.5,20.6,26.5,26.5,67.5,52.5,67.5,67.5,0,26.4,20.9,26.4,26.4,72.5,57.5,72.5,72.5,2,25.2,23.4,26.2,25.2,67.5,62.5,70.0,67.5,2,25.3,23.2,26.3,25.3,62.5,57.5,65.0,62.5,2,25.3,23.1,26.4,25.3,57.5,52.5,60.0,57.5,0,27.0,21.0,25.0,27.0,67.5,52.5,62.5,67.5,0,26.9,21.3,25.0,26.9,72.5,57.5,67.5,72.5,0,26.7,21.6,25.0,26.7,77.5,62.5,72.5,77.5,0,25.7,23.9,24.8,25.7,72.5,67.5,70.0,72.5,0,25.7,23.8,24.8,25.7,67.5,62.5,65.0,67.5,0,25.8,23.7,24.7,25.8,62.5,57.5,60.0,62.5,0,27.9,22.1,22.1,27.9,72.5,57.5,57.5,72.5,0,27.7,22.3,22.3,27.7,77.5,62.5,62.5,77.5,0,27.5,22.5,22.5,27.5,82.5,67.5,67.5,82.5,0,26.5,24.8,22.2,26.5,77.5,72.5,65.0,77.5,0,26.6,24.8,22.0,26.6,72.5,67.5,60.0,72.5,0,26.7,24.8,21.8,26.7,67.5,62.5,55.0,67.5,3,27.6,22.9,20.0,29.5,72.5,60.0,52.5,77.5,3,27.4,23.0,20.4,29.2,77.5,65.0,57.5,82.5,3,27.3,23.1,20.7,28.9,82.5,70.0,62.5,87.5,3,26.3,25.4,20.3,28.0,77.5,75.0,60.0,82.5,3,26.4,25.5,20.0,28.2,72.5,70.0,55.0,77.5,3,26.5,25.5,19.6,28.4,67.5,65.0,50.0,72.5,3,27.8,22.7,19.6,29.9,67.5,55.0,47.5,72.5,3,27.6,22.9,20.0,29.5,72.5,60.0,52.5,77.5,3,27.4,23.0,20.4,29.2,77.5,65.0,57.5,82.5,3,26.4,25.5,20.0,28.2,72.5,70.0,55.0,77.5,3,26.5,25.5,19.6,28.4,67.5,65.0,50.0,72.5,3,26.6,25.5,19.1,28.7,62.5,60.0,45.0,67.5,0,26.6,20.2,26.6,26.6,62.5,47.5,62.5,62.5,0,26.5,20.6,26.5,26.5,67.5,52.5,67.5,67.5,0,26.4,20.9,26.4,26.4,72.5,57.5,72.5,72.5,2,25.2,23.4,26.2,25.2,67.5,62.5,70.0,67.5,2,25.3,23.2,26.3,25.3,62.5,57.5,65.0,62.5,2,25.3,23.1,26.4,25.3,57.5,52.5,60.0,57.5,0,26.5,20.6,26.5,26.5,67.5,52.5,67.5,67.5,0,26.4,20.9,26.4,26.4,72.5,57.5,72.5,72.5,0,26.3,21.2,26.3,26.3,77.5,62.5,77.5,77.5,2,25.2,23.5,26.1,25.2,72.5,67.5,75.0,72.5,2,25.2,23.4,26.2,25.2,67.5,62.5,70.0,67.5,2,25.3,23.2,26.3,25.3,62.5,57.5,65.0,62.5,0,26.9,21.3,25.0,26.9,72.5,57.5,67.5,72.5,0,26.7,21.6,25.0,26.7,77.5,62.5,72.5,77.5,0,26.6,21.8,25.0,26.6,82.5,67.5,77.5,82.5,0,25.6,24.0,24.8,25.6,77.5,72.5,75.0,77.5,0,25.7,23.9,24.8,25.7,72.5,67.5,70.0,72.5,0,25.7,23.8,24.8,25.7,67.5,62.5,65.0,67.5,0,27.7,22.3,22.3,27.7,77.5,62.5,62.5,77.5,0,27.5,22.5,22.5,27.5,82.5,67.5,67.5,82.5,0,27.3,22.7,22.7,27.3,87.5,72.5,72.5,87.5,0,26.4,24.8,22.4,26.4,82.5,77.5,70.0,82.5,0,26.5,24.8,22.2,26.5,77.5,72.5,65.0,77.5,0,26.6,24.8,22.0,26.6,72.5,67.5,60.0,72.5,3,27.4,23.0,20.4,29.2,77.5,65.0,57.5,82.5,3,27.3,23.1,20.7,28.9,82.5,70.0,62.5,87.5,3,27.1,23.3,20.9,28.7,87.5,75.0,67.5,92.5,3,26.2,25.4,20.6,27.8,82.5,80.0,65.0,87.5,3,26.3,25.4,20.3,28.0,77.5,75.0,60.0,82.5,3,26.4,25.5,20.0,28.2,72.5,70.0,55.0,77.5,3,27.6,22.9,20.0,29.5,72.5,60.0,52.5,77.5,3,27.4,23.0,20.4,29.2,77.5,65.0,57.5,82.5,3,27.3,23.1,20.7,28.9,82.5,70.0,62.5,87.5,3,26.3,25.4,20.3,28.0,77.5,75.0,60.0,82.5,3,26.4,25.5,20.0,28.2,72.5,70.0,55.0,77.5,3,26.5,25.5,19.6,28.4,67.5,65.0,50.0,72.5,2,26.3,21.2,27.3,25.3,65.0,52.5,67.5,62.5,2,26.2,21.5,27.1,25.2,70.0,57.5,72.5,67.5,2,26.1,21.7,27.0,25.2,75.0,62.5,77.5,72.5,2,25.0,24.1,26.8,24.1,70.0,67.5,75.0,67.5,2,25.0,24.0,26.9,24.0,65.0,62.5,70.0,62.5,2,25.0,24.0,27.1,24.0,60.0,57.5,65.0,57.5,2,26.2,21.5,27.1,25.2,70.0,57.5,72.5,67.5,2,26.1,21.7,27.0,25.2,75.0,62.5,77.5,72.5,2,26.0,22.0,26.8,25.2,80.0,67.5,82.5,77.5,2,25.0,24.2,26.7,24.2,75.0,72.5,80.0,72.5,2,25.0,24.1,26.8,24.1,70.0,67.5,75.0,67.5,2,25.0,24.0,26.9,24.0,65.0,62.5,70.0,62.5,0,26.5,22.1,25.7,25.7,75.0,62.5,72.5,72.5,0,26.4,22.3,25.6,25.6,80.0,67.5,77.5,77.5,0,26.4,22.5,25.6,25.6,85.0,72.5,82.5,82.5,0,25.4,24.6,25.4,24.6,80.0,77.5,80.0,77.5,0,25.4,24.6,25.4,24.6,75.0,72.5,75.0,72.5,0,25.5,24.5,25.5,24.5,70.0,67.5,70.0,67.5,0,27.4,23.1,23.1,26.5,80.0,67.5,67.5,77.5,0,27.2,23.2,23.2,26.4,85.0,72.5,72.5,82.5,0,27.1,23.3,23.3,26.3,90.0,77.5,77.5,87.5,0,26.2,25.4,23.1,25.4,85.0,82.5,75.0,82.5,0,26.2,25.4,23.0,25.4,80.0,77.5,70.0,77.5,0,26.3,25.4,22.8,25.4,75.0,72.5,65.0,72.5,3,27.1,23.7,21.2,28.0,80.0,70.0,62.5,82.5,3,27.0,23.8,21.4,27.8,85.0,75.0,67.5,87.5,3,26.9,23.9,21.6,27.6,90.0,80.0,72.5,92.5,3,26.0,26.0,21.4,26.7,85.0,85.0,70.0,87.5,3,26.0,26.0,21.1,26.8,80.0,80.0,65.0,82.5,3,26.1,26.1,20.9,27.0,75.0,75.0,60.0,77.5,3,27.3,23.6,20.9,28.2,75.0,65.0,57.5,77.5,3,27.1,23.7,21.2,28.0,80.0,70.0,62.5,82.5,3,27.0,23.8,21.4,27.8,85.0,75.0,67.5,87.5,3,26.0,26.0,21.1,26.8,80.0,80.0,65.0,82.5,3,26.1,26.1,20.9,27.0,75.0,75.0,60.0,77.5,3,26.2,26.2,20.6,27.1,70.0,70.0,55.0,72.5,2,24.2,23.2,29.3,23.2,60.0,57.5,72.5,57.5,2,24.3,23.4,29.0,23.4,65.0,62.5,77.5,62.5,2,24.3,23.5,28.7,23.5,70.0,67.5,82.5,67.5,2,23.2,25.9,28.6,22.3,65.0,72.5,80.0,62.5,2,23.1,26.0,28.8,22.1,60.0,67.5,75.0,57.5,2,22.9,26.0,29.2,21.9,55.0,62.5,70.0,52.5,2,24.3,23.4,29.0,23.4,65.0,62.5,77.5,62.5,2,24.3,23.5,28.7,23.5,70.0,67.5,82.5,67.5,2,24.4,23.6,28.5,23.6,75.0,72.5,87.5,72.5,2,23.3,25.8,28.3,22.5,70.0,77.5,85.0,67.5,2,23.2,25.9,28.6,22.3,65.0,72.5,80.0,62.5,2,23.1,26.0,28.8,22.1,60.0,67.5,75.0,57.5,2,24.8,23.9,27.4,23.9,70.0,67.5,77.5,67.5,2,24.8,24.0,27.3,24.0,75.0,72.5,82.5,72.5,2,24.8,24.0,27.1,24.0,80.0,77.5,87.5,77.5,2,23.8,26.2,27.0,23.0,75.0,82.5,85.0,72.5,2,23.7,26.3,27.1,22.9,70.0,77.5,80.0,67.5,2,23.6,26.4,27.3,22.7,65.0,72.5,75.0,62.5,0,25.6,24.8,24.8,24.8,75.0,72.5,72.5,72.5,0,25.6,24.8,24.8,24.8,80.0,77.5,77.5,77.5,0,25.6,24.8,24.8,24.8,85.0,82.5,82.5,82.5,1,24.6,26.9,24.6,23.8,80.0,87.5,80.0,77.5,1,24.6,27.0,24.6,23.8,75.0,82.5,75.0,72.5,1,24.6,27.2,24.6,23.7,70.0,77.5,70.0,67.5,3,25.4,25.4,22.9,26.3,75.0,75.0,67.5,77.5,3,25.4,25.4,23.0,26.2,80.0,80.0,72.5,82.5,3,25.4,25.4,23.1,26.1,85.0,85.0,77.5,87.5,1,24.4,27.5,22.9,25.2,80.0,90.0,75.0,82.5,1,24.4,27.6,22.8,25.2,75.0,85.0,70.0,77.5,1,24.3,27.8,22.6,25.2,70.0,80.0,65.0,72.5,3,25.5,25.5,22.7,26.4,70.0,70.0,62.5,72.5,3,25.4,25.4,22.9,26.3,75.0,75.0,67.5,77.5,3,25.4,25.4,23.0,26.2,80.0,80.0,72.5,82.5,1,24.4,27.6,22.8,25.2,75.0,85.0,70.0,77.5,1,24.3,27.8,22.6,25.2,70.0,80.0,65.0,72.5,1,24.3,28.0,22.4,25.2,65.0,75.0,60.0,67.5,2,22.4,25.5,30.6,21.4,55.0,62.5,75.0,52.5,2,22.6,25.5,30.2,21.7,60.0,67.5,80.0,57.5,2,22.8,25.4,29.8,21.9,65.0,72.5,85.0,62.5,2,21.6,27.9,29.7,20.7,60.0,77.5,82.5,57.5,2,21.4,28.2,30.1,20.4,55.0,72.5,77.5,52.5,2,21.1,28.4,30.5,20.0,50.0,67.5,72.5,47.5,2,22.6,25.5,30.2,21.7,60.0,67.5,80.0,57.5,2,22.8,25.4,29.8,21.9,65.0,72.5,85.0,62.5,2,23.0,25.4,29.5,22.1,70.0,77.5,90.0,67.5,2,21.8,27.7,29.4,21.0,65.0,82.5,87.5,62.5,2,21.6,27.9,29.7,20.7,60.0,77.5,82.5,57.5,2,21.4,28.2,30.1,20.4,55.0,72.5,77.5,52.5,2,23.2,25.9,28.6,22.3,65.0,72.5,80.0,62.5,2,23.3,25.8,28.3,22.5,70.0,77.5,85.0,67.5,2,23.4,25.8,28.1,22.7,75.0,82.5,90.0,72.5,1,22.4,28.0,28.0,21.6,70.0,87.5,87.5,67.5,1,22.2,28.2,28.2,21.4,65.0,82.5,82.5,62.5,1,22.0,28.4,28.4,21.1,60.0,77.5,77.5,57.5,1,24.1,26.7,25.9,23.3,70.0,77.5,75.0,67.5,1,24.2,26.6,25.8,23.4,75.0,82.5,80.0,72.5,1,24.2,26.5,25.8,23.5,80.0,87.5,85.0,77.5,1,23.3,28.7,25.6,22.5,75.0,92.5,82.5,72.5,1,23.1,28.9,25.6,22.3,70.0,87.5,77.5,67.5,1,23.0,29.2,25.7,22.1,65.0,82.5,72.5,62.5,1,23.9,27.4,23.9,24.8,70.0,80.0,70.0,72.5,1,24.0,27.2,24.0,24.8,75.0,85.0,75.0,77.5,1,24.1,27.1,24.1,24.8,80.0,90.0,80.0,82.5,1,23.1,29.2,23.8,23.8,75.0,95.0,77.5,77.5,1,23.0,29.5,23.8,23.8,70.0,90.0,72.5,72.5,1,22.8,29.8,23.7,23.7,65.0,85.0,67.5,67.5,1,23.9,27.5,23.9,24.8,65.0,75.0,65.0,67.5,1,23.9,27.4,23.9,24.8,70.0,80.0,70.0,72.5,1,24.0,27.2,24.0,24.8,75.0,85.0,75.0,77.5,1,23.0,29.5,23.8,23.8,70.0,90.0,72.5,72.5,1,22.8,29.8,23.7,23.7,65.0,85.0,67.5,67.5,1,22.6,30.2,23.6,23.6,60.0,80.0,62.5,62.5,2,22.0,26.4,30.8,20.9,50.0,60.0,70.0,47.5,2,22.2,26.3,30.3,21.2,55.0,65.0,75.0,52.5,2,22.4,26.2,29.9,21.5,60.0,70.0,80.0,57.5,2,21.2,28.8,29.8,20.2,55.0,75.0,77.5,52.5,2,20.8,29.2,30.2,19.8,50.0,70.0,72.5,47.5,2,20.5,29.5,30.7,19.3,45.0,65.0,67.5,42.5,2,22.2,26.3,30.3,21.2,55.0,65.0,75.0,52.5,2,22.4,26.2,29.9,21.5,60.0,70.0,80.0,57.5,2,22.6,26.1,29.6,21.7,65.0,75.0,85.0,62.5,2,21.4,28.6,29.5,20.5,60.0,80.0,82.5,57.5,2,21.2,28.8,29.8,20.2,55.0,75.0,77.5,52.5,2,20.8,29.2,30.2,19.8,50.0,70.0,72.5,47.5,2,22.9,26.7,28.6,21.9,60.0,70.0,75.0,57.5,2,23.0,26.5,28.3,22.1,65.0,75.0,80.0,62.5,2,23.1,26.4,28.1,22.3,70.0,80.0,85.0,67.5,1,22.0,28.8,28.0,21.2,65.0,85.0,82.5,62.5,1,21.8,29.1,28.2,20.9,60.0,80.0,77.5,57.5,1,21.6,29.4,28.4,20.6,55.0,75.0,72.5,52.5,1,23.9,27.5,25.7,22.9,65.0,75.0,70.0,62.5,1,23.9,27.4,25.6,23.1,70.0,80.0,75.0,67.5,1,24.0,27.2,25.6,23.2,75.0,85.0,80.0,72.5,1,23.0,29.5,25.4,22.1,70.0,90.0,77.5,67.5,1,22.8,29.8,25.4,21.9,65.0,85.0,72.5,62.5,1,22.6,30.2,25.5,21.7,60.0,80.0,67.5,57.5,1,23.6,28.2,23.6,24.5,65.0,77.5,65.0,67.5,1,23.7,28.0,23.7,24.6,70.0,82.5,70.0,72.5,1,23.8,27.8,23.8,24.6,75.0,87.5,75.0,77.5,1,22.8,30.1,23.6,23.6,70.0,92.5,72.5,72.5,1,22.6,30.4,23.5,23.5,65.0,87.5,67.5,67.5,1,22.4,30.8,23.4,23.4,60.0,82.5,62.5,62.5,1,23.5,28.4,23.5,24.5,60.0,72.5,60.0,62.5,1,23.6,28.2,23.6,24.5,65.0,77.5,65.0,67.5,1,23.7,28.0,23.7,24.6,70.0,82.5,70.0,72.5,1,22.6,30.4,23.5,23.5,65.0,87.5,67.5,67.5,1,22.4,30.8,23.4,23.4,60.0,82.5,62.5,62.5,1,22.2,31.3,23.2,23.2,55.0,77.5,57.5,57.5,0,28.4,19.3,23.9,28.4,62.5,42.5,52.5,62.5,0,28.1,19.8,24.0,28.1,67.5,47.5,57.5,67.5,0,27.9,20.2,24.0,27.9,72.5,52.5,62.5,72.5,0,26.7,22.8,23.8,26.7,67.5,57.5,60.0,67.5,0,26.9,22.6,23.7,26.9,62.5,52.5,55.0,62.5,0,27.1,22.4,23.5,27.1,57.5,47.5,50.0,57.5,0,28.1,19.8,24.0,28.1,67.5,47.5,57.5,67.5,0,27.9,20.2,24.0,27.9,72.5,52.5,62.5,72.5,0,27.7,20.5,24.1,27.7,77.5,57.5,67.5,77.5,0,26.6,22.9,23.9,26.6,72.5,62.5,65.0,72.5,0,26.7,22.8,23.8,26.7,67.5,57.5,60.0,67.5,0,26.9,22.6,23.7,26.9,62.5,52.5,55.0,62.5,0,28.4,20.6,22.5,28.4,72.5,52.5,57.5,72.5,0,28.2,20.9,22.7,28.2,77.5,57.5,62.5,77.5,0,28.0,21.2,22.9,28.0,82.5,62.5,67.5,82.5,0,27.0,23.5,22.6,27.0,77.5,67.5,65.0,77.5,0,27.1,23.4,22.4,27.1,72.5,62.5,60.0,72.5,0,27.3,23.2,22.2,27.3,67.5,57.5,55.0,67.5,0,29.2,21.7,19.8,29.2,77.5,57.5,52.5,77.5,0,28.9,21.9,20.2,28.9,82.5,62.5,57.5,82.5,0,28.7,22.1,20.5,28.7,87.5,67.5,62.5,87.5,0,27.7,24.4,20.2,27.7,82.5,72.5,60.0,82.5,0,27.9,24.3,19.8,27.9,77.5,67.5,55.0,77.5,0,28.2,24.3,19.4,28.2,72.5,62.5,50.0,72.5,3,29.0,22.4,17.8,30.8,77.5,60.0,47.5,82.5,3,28.7,22.6,18.3,30.4,82.5,65.0,52.5,87.5,3,28.5,22.8,18.7,30.1,87.5,70.0,57.5,92.5,3,27.5,25.0,18.3,29.2,82.5,75.0,55.0,87.5,3,27.7,25.0,17.9,29.5,77.5,70.0,50.0,82.5,3,27.9,25.0,17.3,29.8,72.5,65.0,45.0,77.5,3,29.3,22.2,17.2,31.3,72.5,55.0,42.5,77.5,3,29.0,22.4,17.8,30.8,77.5,60.0,47.5,82.5,3,28.7,22.6,18.3,30.4,82.5,65.0,52.5,87.5,3,27.7,25.0,17.9,29.5,77.5,70.0,50.0,82.5,3,27.9,25.0,17.3,29.8,72.5,65.0,45.0,77.5,3,28.1,25.0,16.7,30.2,67.5,60.0,40.0,72.5,0,28.1,19.8,24.0,28.1,67.5,47.5,57.5,67.5,0,27.9,20.2,24.0,27.9,72.5,52.5,62.5,72.5,0,27.7,20.5,24.1,27.7,77.5,57.5,67.5,77.5,0,26.6,22.9,23.9,26.6,72.5,62.5,65.0,72.5,0,26.7,22.8,23.8,26.7,67.5,57.5,60.0,67.5,0,26.9,22.6,23.7,26.9,62.5,52.5,55.0,62.5,0,27.9,20.2,24.0,27.9,72.5,52.5,62.5,72.5,0,27.7,20.5,24.1,27.7,77.5,57.5,67.5,77.5,0,27.5,20.8,24.2,27.5,82.5,62.5,72.5,82.5,0,26.5,23.1,23.9,26.5,77.5,67.5,70.0,77.5,0,26.6,22.9,23.9,26.6,72.5,62.5,65.0,72.5,0,26.7,22.8,23.8,26.7,67.5,57.5,60.0,67.5,0,28.2,20.9,22.7,28.2,77.5,57.5,62.5,77.5,0,28.0,21.2,22.9,28.0,82.5,62.5,67.5,82.5,0,27.8,21.4,23.0,27.8,87.5,67.5,72.5,87.5,0,26.8,23.6,22.8,26.8,82.5,72.5,70.0,82.5,0,27.0,23.5,22.6,27.0,77.5,67.5,65.0,77.5,0,27.1,23.4,22.4,27.1,72.5,62.5,60.0,72.5,0,28.9,21.9,20.2,28.9,82.5,62.5,57.5,82.5,0,28.7,22.1,20.5,28.7,87.5,67.5,62.5,87.5,0,28.5,22.3,20.8,28.5,92.5,72.5,67.5,92.5,0,27.6,24.4,20.5,27.6,87.5,77.5,65.0,87.5,0,27.7,24.4,20.2,27.7,82.5,72.5,60.0,82.5,0,27.9,24.3,19.8,27.9,77.5,67.5,55.0,77.5,3,28.7,22.6,18.3,30.4,82.5,65.0,52.5,87.5,3,28.5,22.8,18.7,30.1,87.5,70.0,57.5,92.5,3,28.2,22.9,19.1,29.8,92.5,75.0,62.5,97.5,3,27.3,25.0,18.8,28.9,87.5,80.0,60.0,92.5,3,27.5,25.0,18.3,29.2,82.5,75.0,55.0,87.5,3,27.7,25.0,17.9,29.5,77.5,70.0,50.0,82.5,3,29.0,22.4,17.8,30.8,77.5,60.0,47.5,82.5,3,28.7,22.6,18.3,30.4,82.5,65.0,52.5,87.5,3,28.5,22.8,18.7,30.1,87.5,70.0,57.5,92.5,3,27.5,25.0,18.3,29.2,82.5,75.0,55.0,87.5,3,27.7,25.0,17.9,29.5,77.5,70.0,50.0,82.5,3,27.9,25.0,17.3,29.8,72.5,65.0,45.0,77.5,0,27.7,20.8,24.8,26.7,70.0,52.5,62.5,67.5,0,27.5,21.1,24.8,26.6,75.0,57.5,67.5,72.5,0,27.4,21.4,24.8,26.5,80.0,62.5,72.5,77.5,0,26.3,23.7,24.6,25.4,75.0,67.5,70.0,72.5,0,26.4,23.6,24.5,25.5,70.0,62.5,65.0,67.5,0,26.5,23.5,24.5,25.5,65.0,57.5,60.0,62.5,0,27.5,21.1,24.8,26.6,75.0,57.5,67.5,72.5,0,27.4,21.4,24.8,26.5,80.0,62.5,72.5,77.5,0,27.2,21.6,24.8,26.4,85.0,67.5,77.5,82.5,0,26.2,23.8,24.6,25.4,80.0,72.5,75.0,77.5,0,26.3,23.7,24.6,25.4,75.0,67.5,70.0,72.5,0,26.4,23.6,24.5,25.5,70.0,62.5,65.0,67.5,0,27.8,21.7,23.5,27.0,80.0,62.5,67.5,77.5,0,27.6,22.0,23.6,26.8,85.0,67.5,72.5,82.5,0,27.5,22.1,23.7,26.7,90.0,72.5,77.5,87.5,0,26.6,24.2,23.4,25.8,85.0,77.5,75.0,82.5,0,26.7,24.2,23.3,25.8,80.0,72.5,70.0,77.5,0,26.8,24.1,23.2,25.9,75.0,67.5,65.0,72.5,0,28.6,22.7,21.0,27.7,85.0,67.5,62.5,82.5,0,28.3,22.8,21.3,27.6,90.0,72.5,67.5,87.5,0,28.1,23.0,21.5,27.4,95.0,77.5,72.5,92.5,0,27.3,25.0,21.2,26.5,90.0,82.5,70.0,87.5,0,27.4,25.0,21.0,26.6,85.0,77.5,65.0,82.5,0,27.6,25.0,20.7,26.7,80.0,72.5,60.0,77.5,3,28.3,23.3,19.2,29.2,85.0,70.0,57.5,87.5,3,28.1,23.4,19.5,28.9,90.0,75.0,62.5,92.5,3,27.9,23.5,19.9,28.7,95.0,80.0,67.5,97.5,3,27.1,25.6,19.5,27.8,90.0,85.0,65.0,92.5,3,27.2,25.6,19.2,28.0,85.0,80.0,60.0,87.5,3,27.4,25.6,18.8,28.2,80.0,75.0,55.0,82.5,3,28.6,23.2,18.8,29.5,80.0,65.0,52.5,82.5,3,28.3,23.3,19.2,29.2,85.0,70.0,57.5,87.5,3,28.1,23.4,19.5,28.9,90.0,75.0,62.5,92.5,3,27.2,25.6,19.2,28.0,85.0,80.0,60.0,87.5,3,27.4,25.6,18.8,28.2,80.0,75.0,55.0,82.5,3,27.5,25.7,18.3,28.4,75.0,70.0,50.0,77.5,2,25.7,22.8,26.7,24.8,65.0,57.5,67.5,62.5,2,25.7,22.9,26.6,24.8,70.0,62.5,72.5,67.5,2,25.6,23.1,26.5,24.8,75.0,67.5,77.5,72.5,2,24.6,25.4,26.3,23.7,70.0,72.5,75.0,67.5,2,24.5,25.5,26.4,23.6,65.0,67.5,70.0,62.5,2,24.5,25.5,26.5,23.5,60.0,62.5,65.0,57.5,2,25.7,22.9,26.6,24.8,70.0,62.5,72.5,67.5,2,25.6,23.1,26.5,24.8,75.0,67.5,77.5,72.5,2,25.6,23.2,26.4,24.8,80.0,72.5,82.5,77.5,2,24.6,25.4,26.2,23.8,75.0,77.5,80.0,72.5,2,24.6,25.4,26.3,23.7,70.0,72.5,75.0,67.5,2,24.5,25.5,26.4,23.6,65.0,67.5,70.0,62.5,0,26.1,23.5,25.2,25.2,75.0,67.5,72.5,72.5,0,26.0,23.6,25.2,25.2,80.0,72.5,77.5,77.5,0,26.0,23.7,25.2,25.2,85.0,77.5,82.5,82.5,1,25.0,25.8,25.0,24.2,80.0,82.5,80.0,77.5,1,25.0,25.8,25.0,24.2,75.0,77.5,75.0,72.5,1,25.0,25.9,25.0,24.1,70.0,72.5,70.0,67.5,0,26.9,24.4,22.7,26.1,80.0,72.5,67.5,77.5,0,26.8,24.4,22.8,26.0,85.0,77.5,72.5,82.5,0,26.7,24.4,23.0,25.9,90.0,82.5,77.5,87.5,1,25.8,26.5,22.7,25.0,85.0,87.5,75.0,82.5,1,25.8,26.6,22.6,25.0,80.0,82.5,70.0,77.5,1,25.9,26.7,22.4,25.0,75.0,77.5,65.0,72.5,3,26.7,25.0,20.8,27.5,80.0,75.0,62.5,82.5,3,26.6,25.0,21.1,27.3,85.0,80.0,67.5,87.5,3,26.5,25.0,21.3,27.2,90.0,85.0,72.5,92.5,1,25.6,27.1,21.1,26.3,85.0,90.0,70.0,87.5,1,25.6,27.2,20.8,26.4,80.0,85.0,65.0,82.5,1,25.6,27.4,20.5,26.5,75.0,80.0,60.0,77.5,3,26.8,25.0,20.5,27.7,75.0,70.0,57.5,77.5,3,26.7,25.0,20.8,27.5,80.0,75.0,62.5,82.5,3,26.6,25.0,21.1,27.3,85.0,80.0,67.5,87.5,1,25.6,27.2,20.8,26.4,80.0,85.0,65.0,82.5,1,25.6,27.4,20.5,26.5,75.0,80.0,60.0,77.5,1,25.7,27.5,20.2,26.6,70.0,75.0,55.0,72.5,2,24.0,25.0,28.0,23.0,60.0,62.5,70.0,57.5,2,24.1,25.0,27.8,23.1,65.0,67.5,75.0,62.5,2,24.1,25.0,27.6,23.3,70.0,72.5,80.0,67.5,1,23.0,27.4,27.4,22.1,65.0,77.5,77.5,62.5,1,22.9,27.6,27.6,21.9,60.0,72.5,72.5,57.5,1,22.7,27.8,27.8,21.6,55.0,67.5,67.5,52.5,2,24.1,25.0,27.8,23.1,65.0,67.5,75.0,62.5,2,24.1,25.0,27.6,23.3,70.0,72.5,80.0,67.5,2,24.2,25.0,27.4,23.4,75.0,77.5,85.0,72.5,1,23.1,27.3,27.3,22.3,70.0,82.5,82.5,67.5,1,23.0,27.4,27.4,22.1,65.0,77.5,77.5,62.5,1,22.9,27.6,27.6,21.9,60.0,72.5,72.5,57.5,2,24.6,25.4,26.3,23.7,70.0,72.5,75.0,67.5,2,24.6,25.4,26.2,23.8,75.0,77.5,80.0,72.5,2,24.6,25.4,26.2,23.8,80.0,82.5,85.0,77.5,1,23.6,27.6,26.0,22.8,75.0,87.5,82.5,72.5,1,23.5,27.7,26.1,22.7,70.0,82.5,77.5,67.5,1,23.4,27.9,26.1,22.5,65.0,77.5,72.5,62.5,1,25.4,26.3,23.7,24.6,75.0,77.5,70.0,72.5,1,25.4,26.2,23.8,24.6,80.0,82.5,75.0,77.5,1,25.4,26.1,23.9,24.6,85.0,87.5,80.0,82.5,1,24.4,28.2,23.7,23.7,80.0,92.5,77.5,77.5,1,24.4,28.5,23.6,23.6,75.0,87.5,72.5,72.5,1,24.3,28.7,23.5,23.5,70.0,82.5,67.5,67.5,1,25.2,26.9,21.8,26.1,75.0,80.0,65.0,77.5,1,25.2,26.8,22.0,26.0,80.0,85.0,70.0,82.5,1,25.2,26.7,22.2,25.9,85.0,90.0,75.0,87.5,1,24.2,28.8,22.0,25.0,80.0,95.0,72.5,82.5,1,24.2,29.0,21.8,25.0,75.0,90.0,67.5,77.5,1,24.1,29.3,21.6,25.0,70.0,85.0,62.5,72.5,1,25.2,27.0,21.6,26.1,70.0,75.0,60.0,72.5,1,25.2,26.9,21.8,26.1,75.0,80.0,65.0,77.5,1,25.2,26.8,22.0,26.0,80.0,85.0,70.0,82.5,1,24.2,29.0,21.8,25.0,75.0,90.0,67.5,77.5,1,24.1,29.3,21.6,25.0,70.0,85.0,62.5,72.5,1,24.1,29.6,21.3,25.0,65.0,80.0,57.5,67.5,2,23.7,25.8,28.0,22.6,55.0,60.0,65.0,52.5,2,23.8,25.7,27.7,22.8,60.0,65.0,70.0,57.5,2,23.9,25.7,27.5,22.9,65.0,70.0,75.0,62.5,1,22.6,28.3,27.4,21.7,60.0,75.0,72.5,57.5,1,22.4,28.6,27.6,21.4,55.0,70.0,67.5,52.5,1,22.2,28.9,27.8,21.1,50.0,65.0,62.5,47.5,2,23.8,25.7,27.7,22.8,60.0,65.0,70.0,57.5,2,23.9,25.7,27.5,22.9,65.0,70.0,75.0,62.5,2,23.9,25.6,27.4,23.1,70.0,75.0,80.0,67.5,1,22.8,28.1,27.2,21.9,65.0,80.0,77.5,62.5,1,22.6,28.3,27.4,21.7,60.0,75.0,72.5,57.5,1,22.4,28.6,27.6,21.4,55.0,70.0,67.5,52.5,1,24.3,26.2,26.2,23.4,65.0,70.0,70.0,62.5,1,24.3,26.1,26.1,23.5,70.0,75.0,75.0,67.5,1,24.4,26.0,26.0,23.6,75.0,80.0,80.0,72.5,1,23.3,28.3,25.8,22.5,70.0,85.0,77.5,67.5,1,23.2,28.6,25.9,22.3,65.0,80.0,72.5,62.5,1,23.1,28.8,26.0,22.1,60.0,75.0,67.5,57.5,1,25.2,27.0,23.4,24.3,70.0,75.0,65.0,67.5,1,25.2,26.9,23.5,24.4,75.0,80.0,70.0,72.5,1,25.2,26.8,23.6,24.4,80.0,85.0,75.0,77.5,1,24.2,29.0,23.4,23.4,75.0,90.0,72.5,72.5,1,24.1,29.3,23.3,23.3,70.0,85.0,67.5,67.5,1,24.1,29.6,23.1,23.1,65.0,80.0,62.5,62.5,1,25.0,27.7,21.4,25.9,70.0,77.5,60.0,72.5,1,25.0,27.5,21.7,25.8,75.0,82.5,65.0,77.5,1,25.0,27.3,21.9,25.8,80.0,87.5,70.0,82.5,1,24.0,29.6,21.6,24.8,75.0,92.5,67.5,77.5,1,23.9,29.9,21.4,24.8,70.0,87.5,62.5,72.5,1,23.9,30.3,21.1,24.8,65.0,82.5,57.5,67.5,1,25.0,27.9,21.2,26.0,65.0,72.5,55.0,67.5,1,25.0,27.7,21.4,25.9,70.0,77.5,60.0,72.5,1,25.0,27.5,21.7,25.8,75.0,82.5,65.0,77.5,1,23.9,29.9,21.4,24.8,70.0,87.5,62.5,72.5,1,23.9,30.3,21.1,24.8,65.0,82.5,57.5,67.5,1,23.8,30.7,20.8,24.8,60.0,77.5,52.5,62.5,0,29.6,18.5,23.5,28.4,60.0,37.5,47.5,57.5,0,29.2,19.1,23.6,28.1,65.0,42.5,52.5,62.5,0,28.9,19.6,23.7,27.8,70.0,47.5,57.5,67.5,0,27.7,22.3,23.4,26.6,65.0,52.5,55.0,62.5,0,27.9,22.1,23.3,26.7,60.0,47.5,50.0,57.5,0,28.2,21.8,23.1,26.9,55.0,42.5,45.0,52.5,0,29.2,19.1,23.6,28.1,65.0,42.5,52.5,62.5,0,28.9,19.6,23.7,27.8,70.0,47.5,57.5,67.5,0,28.6,20.0,23.8,27.6,75.0,52.5,62.5,72.5,0,27.5,22.5,23.5,26.5,70.0,57.5,60.0,67.5,0,27.7,22.3,23.4,26.6,65.0,52.5,55.0,62.5,0,27.9,22.1,23.3,26.7,60.0,47.5,50.0,57.5,0,29.5,20.0,22.1,28.4,70.0,47.5,52.5,67.5,0,29.1,20.4,22.3,28.2,75.0,52.5,57.5,72.5,0,28.8,20.7,22.5,27.9,80.0,57.5,62.5,77.5,0,27.8,23.1,22.2,26.9,75.0,62.5,60.0,72.5,0,28.0,23.0,22.0,27.0,70.0,57.5,55.0,67.5,0,28.3,22.8,21.7,27.2,65.0,52.5,50.0,62.5,0,30.3,21.2,19.2,29.3,75.0,52.5,47.5,72.5,0,29.9,21.5,19.6,29.0,80.0,57.5,52.5,77.5,0,29.6,21.7,20.0,28.7,85.0,62.5,57.5,82.5,0,28.6,24.1,19.6,27.7,80.0,67.5,55.0,77.5,0,28.8,24.0,19.2,27.9,75.0,62.5,50.0,72.5,0,29.2,24.0,18.8,28.1,70.0,57.5,45.0,67.5,3,30.0,22.0,17.0,31.0,75.0,55.0,42.5,77.5,3,29.6,22.2,17.6,30.6,80.0,60.0,47.5,82.5,3,29.3,22.4,18.1,30.2,85.0,65.0,52.5,87.5,3,28.3,24.8,17.7,29.2,80.0,70.0,50.0,82.5,3,28.6,24.8,17.1,29.5,75.0,65.0,45.0,77.5,3,28.9,24.7,16.5,29.9,70.0,60.0,40.0,72.5,3,30.4,21.7,16.3,31.5,70.0,50.0,37.5,72.5,3,30.0,22.0,17.0,31.0,75.0,55.0,42.5,77.5,3,29.6,22.2,17.6,30.6,80.0,60.0,47.5,82.5,3,28.6,24.8,17.1,29.5,75.0,65.0,45.0,77.5,3,28.9,24.7,16.5,29.9,70.0,60.0,40.0,72.5,3,29.2,24.7,15.7,30.3,65.0,55.0,35.0,67.5,0,29.2,19.1,23.6,28.1,65.0,42.5,52.5,62.5,0,28.9,19.6,23.7,27.8,70.0,47.5,57.5,67.5,0,28.6,20.0,23.8,27.6,75.0,52.5,62.5,72.5,0,27.5,22.5,23.5,26.5,70.0,57.5,60.0,67.5,0,27.7,22.3,23.4,26.6,65.0,52.5,55.0,62.5,0,27.9,22.1,23.3,26.7,60.0,47.5,50.0,57.5,0,28.9,19.6,23.7,27.8,70.0,47.5,57.5,67.5,0,28.6,20.0,23.8,27.6,75.0,52.5,62.5,72.5,0,28.3,20.4,23.9,27.4,80.0,57.5,67.5,77.5,0,27.3,22.7,23.6,26.4,75.0,62.5,65.0,72.5,0,27.5,22.5,23.5,26.5,70.0,57.5,60.0,67.5,0,27.7,22.3,23.4,26.6,65.0,52.5,55.0,62.5,0,29.1,20.4,22.3,28.2,75.0,52.5,57.5,72.5,0,28.8,20.7,22.5,27.9,80.0,57.5,62.5,77.5,0,28.6,21.0,22.7,27.7,85.0,62.5,67.5,82.5,0,27.6,23.3,22.4,26.7,80.0,67.5,65.0,77.5,0,27.8,23.1,22.2,26.9,75.0,62.5,60.0,72.5,0,28.0,23.0,22.0,27.0,70.0,57.5,55.0,67.5,0,29.9,21.5,19.6,29.0,80.0,57.5,52.5,77.5,0,29.6,21.7,20.0,28.7,85.0,62.5,57.5,82.5,0,29.3,22.0,20.3,28.5,90.0,67.5,62.5,87.5,0,28.3,24.2,20.0,27.5,85.0,72.5,60.0,82.5,0,28.6,24.1,19.6,27.7,80.0,67.5,55.0,77.5,0,28.8,24.0,19.2,27.9,75.0,62.5,50.0,72.5,3,29.6,22.2,17.6,30.6,80.0,60.0,47.5,82.5,3,29.3,22.4,18.1,30.2,85.0,65.0,52.5,87.5,3,29.0,22.6,18.5,29.8,90.0,70.0,57.5,92.5,3,28.1,24.8,18.2,28.9,85.0,75.0,55.0,87.5,3,28.3,24.8,17.7,29.2,80.0,70.0,50.0,82.5,3,28.6,24.8,17.1,29.5,75.0,65.0,45.0,77.5,3,30.0,22.0,17.0,31.0,75.0,55.0,42.5,77.5,3,29.6,22.2,17.6,30.6,80.0,60.0,47.5,82.5,3,29.3,22.4,18.1,30.2,85.0,65.0,52.5,87.5,3,28.3,24.8,17.7,29.2,80.0,70.0,50.0,82.5,3,28.6,24.8,17.1,29.5,75.0,65.0,45.0,77.5,3,28.9,24.7,16.5,29.9,70.0,60.0,40.0,72.5,0,28.7,20.2,24.5,26.6,67.5,47.5,57.5,62.5,0,28.4,20.6,24.5,26.5,72.5,52.5,62.5,67.5,0,28.2,20.9,24.5,26.4,77.5,57.5,67.5,72.5,0,27.1,23.4,24.3,25.2,72.5,62.5,65.0,67.5,0,27.3,23.2,24.2,25.3,67.5,57.5,60.0,62.5,0,27.5,23.1,24.2,25.3,62.5,52.5,55.0,57.5,0,28.4,20.6,24.5,26.5,72.5,52.5,62.5,67.5,0,28.2,20.9,24.5,26.4,77.5,57.5,67.5,72.5,0,28.0,21.2,24.6,26.3,82.5,62.5,72.5,77.5,0,27.0,23.5,24.3,25.2,77.5,67.5,70.0,72.5,0,27.1,23.4,24.3,25.2,72.5,62.5,65.0,67.5,0,27.3,23.2,24.2,25.3,67.5,57.5,60.0,62.5,0,28.7,21.3,23.1,26.9,77.5,57.5,62.5,72.5,0,28.4,21.6,23.3,26.7,82.5,62.5,67.5,77.5,0,28.2,21.8,23.4,26.6,87.5,67.5,72.5,82.5,0,27.3,24.0,23.1,25.6,82.5,72.5,70.0,77.5,0,27.4,23.9,23.0,25.7,77.5,67.5,65.0,72.5,0,27.6,23.8,22.9,25.7,72.5,62.5,60.0,67.5,0,29.5,22.3,20.5,27.7,82.5,62.5,57.5,77.5,0,29.2,22.5,20.8,27.5,87.5,67.5,62.5,82.5,0,28.9,22.7,21.1,27.3,92.5,72.5,67.5,87.5,0,28.0,24.8,20.8,26.4,87.5,77.5,65.0,82.5,0,28.2,24.8,20.5,26.5,82.5,72.5,60.0,77.5,0,28.4,24.8,20.2,26.6,77.5,67.5,55.0,72.5,0,29.2,23.0,18.6,29.2,82.5,65.0,52.5,82.5,0,28.9,23.1,19.0,28.9,87.5,70.0,57.5,87.5,0,28.7,23.3,19.4,28.7,92.5,75.0,62.5,92.5,0,27.8,25.4,19.0,27.8,87.5,80.0,60.0,87.5,0,28.0,25.4,18.6,28.0,82.5,75.0,55.0,82.5,0,28.2,25.5,18.2,28.2,77.5,70.0,50.0,77.5,0,29.5,22.9,18.1,29.5,77.5,60.0,47.5,77.5,0,29.2,23.0,18.6,29.2,82.5,65.0,52.5,82.5,0,28.9,23.1,19.0,28.9,87.5,70.0,57.5,87.5,0,28.0,25.4,18.6,28.0,82.5,75.0,55.0,82.5,0,28.2,25.5,18.2,28.2,77.5,70.0,50.0,77.5,0,28.4,25.5,17.6,28.4,72.5,65.0,45.0,72.5,0,26.6,22.3,26.6,24.5,62.5,52.5,62.5,57.5,0,26.5,22.5,26.5,24.5,67.5,57.5,67.5,62.5,0,26.4,22.7,26.4,24.5,72.5,62.5,72.5,67.5,2,25.2,25.2,26.2,23.4,67.5,67.5,70.0,62.5,2,25.3,25.3,26.3,23.2,62.5,62.5,65.0,57.5,2,25.3,25.3,26.4,23.1,57.5,57.5,60.0,52.5,0,26.5,22.5,26.5,24.5,67.5,57.5,67.5,62.5,0,26.4,22.7,26.4,24.5,72.5,62.5,72.5,67.5,0,26.3,22.9,26.3,24.6,77.5,67.5,77.5,72.5,2,25.2,25.2,26.1,23.5,72.5,72.5,75.0,67.5,2,25.2,25.2,26.2,23.4,67.5,67.5,70.0,62.5,2,25.3,25.3,26.3,23.2,62.5,62.5,65.0,57.5,0,26.9,23.1,25.0,25.0,72.5,62.5,67.5,67.5,0,26.7,23.3,25.0,25.0,77.5,67.5,72.5,72.5,0,26.6,23.4,25.0,25.0,82.5,72.5,77.5,77.5,0,25.6,25.6,24.8,24.0,77.5,77.5,75.0,72.5,0,25.7,25.7,24.8,23.9,72.5,72.5,70.0,67.5,0,25.7,25.7,24.8,23.8,67.5,67.5,65.0,62.5,0,27.7,24.1,22.3,25.9,77.5,67.5,62.5,72.5,0,27.5,24.2,22.5,25.8,82.5,72.5,67.5,77.5,0,27.3,24.2,22.7,25.8,87.5,77.5,72.5,82.5,0,26.4,26.4,22.4,24.8,82.5,82.5,70.0,77.5,0,26.5,26.5,22.2,24.8,77.5,77.5,65.0,72.5,0,26.6,26.6,22.0,24.8,72.5,72.5,60.0,67.5,0,27.4,24.8,20.4,27.4,77.5,70.0,57.5,77.5,0,27.3,24.8,20.7,27.3,82.5,75.0,62.5,82.5,0,27.1,24.8,20.9,27.1,87.5,80.0,67.5,87.5,1,26.2,27.0,20.6,26.2,82.5,85.0,65.0,82.5,1,26.3,27.1,20.3,26.3,77.5,80.0,60.0,77.5,1,26.4,27.3,20.0,26.4,72.5,75.0,55.0,72.5,0,27.6,24.8,20.0,27.6,72.5,65.0,52.5,72.5,0,27.4,24.8,20.4,27.4,77.5,70.0,57.5,77.5,0,27.3,24.8,20.7,27.3,82.5,75.0,62.5,82.5,1,26.3,27.1,20.3,26.3,77.5,80.0,60.0,77.5,1,26.4,27.3,20.0,26.4,72.5,75.0,55.0,72.5,1,26.5,27.5,19.6,26.5,67.5,70.0,50.0,67.5,2,24.7,24.7,28.0,22.6,57.5,57.5,65.0,52.5,2,24.8,24.8,27.7,22.8,62.5,62.5,70.0,57.5,2,24.8,24.8,27.5,22.9,67.5,67.5,75.0,62.5,1,23.6,27.4,27.4,21.7,62.5,72.5,72.5,57.5,1,23.5,27.6,27.6,21.4,57.5,67.5,67.5,52.5,1,23.3,27.8,27.8,21.1,52.5,62.5,62.5,47.5,2,24.8,24.8,27.7,22.8,62.5,62.5,70.0,57.5,2,24.8,24.8,27.5,22.9,67.5,67.5,75.0,62.5,2,24.8,24.8,27.4,23.1,72.5,72.5,80.0,67.5,1,23.7,27.2,27.2,21.9,67.5,77.5,77.5,62.5,1,23.6,27.4,27.4,21.7,62.5,72.5,72.5,57.5,1,23.5,27.6,27.6,21.4,57.5,67.5,67.5,52.5,2,25.2,25.2,26.2,23.4,67.5,67.5,70.0,62.5,2,25.2,25.2,26.1,23.5,72.5,72.5,75.0,67.5,2,25.2,25.2,26.0,23.6,77.5,77.5,80.0,72.5,1,24.2,27.5,25.8,22.5,72.5,82.5,77.5,67.5,1,24.1,27.7,25.9,22.3,67.5,77.5,72.5,62.5,1,24.0,27.9,26.0,22.1,62.5,72.5,67.5,57.5,0,26.1,26.1,23.4,24.3,72.5,72.5,65.0,67.5,0,26.1,26.1,23.5,24.4,77.5,77.5,70.0,72.5,0,26.0,26.0,23.6,24.4,82.5,82.5,75.0,77.5,1,25.0,28.2,23.4,23.4,77.5,87.5,72.5,72.5,1,25.0,28.4,23.3,23.3,72.5,82.5,67.5,67.5,1,25.0,28.7,23.1,23.1,67.5,77.5,62.5,62.5,1,25.9,26.8,21.4,25.9,72.5,75.0,60.0,72.5,1,25.8,26.7,21.7,25.8,77.5,80.0,65.0,77.5,1,25.8,26.6,21.9,25.8,82.5,85.0,70.0,82.5,1,24.8,28.8,21.6,24.8,77.5,90.0,67.5,77.5,1,24.8,29.1,21.4,24.8,72.5,85.0,62.5,72.5,1,24.8,29.4,21.1,24.8,67.5,80.0,57.5,67.5,1,26.0,26.9,21.2,26.0,67.5,70.0,55.0,67.5,1,25.9,26.8,21.4,25.9,72.5,75.0,60.0,72.5,1,25.8,26.7,21.7,25.8,77.5,80.0,65.0,77.5,1,24.8,29.1,21.4,24.8,72.5,85.0,62.5,72.5,1,24.8,29.4,21.1,24.8,67.5,80.0,57.5,67.5,1,24.8,29.7,20.8,24.8,62.5,75.0,52.5,62.5,2,24.4,25.6,27.9,22.1,52.5,55.0,60.0,47.5,2,24.5,25.5,27.7,22.3,57.5,60.0,65.0,52.5,2,24.5,25.5,27.5,22.5,62.5,65.0,70.0,57.5,1,23.2,28.3,27.3,21.2,57.5,70.0,67.5,52.5,1,23.1,28.6,27.5,20.9,52.5,65.0,62.5,47.5,1,22.9,28.9,27.7,20.5,47.5,60.0,57.5,42.5,2,24.5,25.5,27.7,22.3,57.5,60.0,65.0,52.5,2,24.5,25.5,27.5,22.5,62.5,65.0,70.0,57.5,2,24.5,25.5,27.3,22.7,67.5,70.0,75.0,62.5,1,23.4,28.0,27.1,21.5,62.5,75.0,72.5,57.5,1,23.2,28.3,27.3,21.2,57.5,70.0,67.5,52.5,1,23.1,28.6,27.5,20.9,52.5,65.0,62.5,47.5,1,25.0,26.0,26.0,23.0,62.5,65.0,65.0,57.5,1,25.0,25.9,25.9,23.1,67.5,70.0,70.0,62.5,1,25.0,25.9,25.9,23.3,72.5,75.0,75.0,67.5,1,23.9,28.3,25.7,22.1,67.5,80.0,72.5,62.5,1,23.8,28.6,25.7,21.9,62.5,75.0,67.5,57.5,1,23.7,28.9,25.8,21.6,57.5,70.0,62.5,52.5,1,26.0,26.9,23.1,24.0,67.5,70.0,60.0,62.5,1,25.9,26.8,23.2,24.1,72.5,75.0,65.0,67.5,1,25.8,26.7,23.3,24.2,77.5,80.0,70.0,72.5,1,24.8,29.1,23.1,23.1,72.5,85.0,67.5,67.5,1,24.8,29.4,22.9,22.9,67.5,80.0,62.5,62.5,1,24.8,29.7,22.8,22.8,62.5,75.0,57.5,57.5,1,25.7,27.6,21.0,25.7,67.5,72.5,55.0,67.5,1,25.7,27.4,21.2,25.7,72.5,77.5,60.0,72.5,1,25.6,27.3,21.5,25.6,77.5,82.5,65.0,77.5,1,24.6,29.7,21.2,24.6,72.5,87.5,62.5,72.5,1,24.5,30.0,20.9,24.5,67.5,82.5,57.5,67.5,1,24.5,30.4,20.6,24.5,62.5,77.5,52.5,62.5,1,25.8,27.8,20.6,25.8,62.5,67.5,50.0,62.5,1,25.7,27.6,21.0,25.7,67.5,72.5,55.0,67.5,1,25.7,27.4,21.2,25.7,72.5,77.5,60.0,72.5,1,24.5,30.0,20.9,24.5,67.5,82.5,57.5,67.5,1,24.5,30.4,20.6,24.5,62.5,77.5,52.5,62.5,1,24.5,30.9,20.2,24.5,57.5,72.5,47.5,57.5]}
@@ -64,11 +64,11 @@ const Results = ({ result, onReset }) => {
         </div>
       </div>
 
-      {/* axis scores */}
+      {/* axis scores: /api/assess sends them flat in scores, next to overhead_index */}
       <div className="recommendations-section">
         <h3 className="recommendations-title">workstyle dimensions</h3>
         <div style={{ marginBottom: '48px' }}>
-          {Object.entries(result.scores.axes || {}).map(([axis, score]) => (
+          {Object.entries(result.scores || {}).filter(([axis]) => axis !== "overhead_index").map(([axis, score]) => (
             <div key={axis} style={{ marginBottom: '24px' }}>
               <div style={{ 
                 display: 'flex', 
@@ -98,7 +98,7 @@ export default function ResultsPage() {
         <div className="recommendations-section">
           <h3 className="recommendations-title">workstyle dimensions</h3>
           <div style={{ marginBottom: '48px' }}>
-            {Object.entries(result.scores?.axes || {}).map(([axis, score]) => (
+            {Object.entries(result.scores || {}).filter(([axis]) => axis !== "overhead_index").map(([axis, score]) => (
               <div key={axis} style={{ marginBottom: '24px' }}>
                 <div style={{ 
                   display: 'flex', 
@@ -1,15 +1,28 @@
 #!/usr/bin/env python3
 """
 generate sample diagnostic report pdf from assessment data
+
+    python generate_sample_report.py assessment.json               # one report
+    python generate_sample_report.py --dir exports/ --out reports/  # batch, one pdf per assessment_id
+    python generate_sample_report.py --ndjson - --out reports/ < assessments.ndjson
+    python generate_sample_report.py --db --since 2025-09-01 --out reports/
 """
 
+import argparse
+import hashlib
 import json
 import os
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-import weasyprint
-from jinja2 import Template
+
+# the report template and renderer live with the api (calm_profile_api/templates)
+API_DIR = Path(__file__).resolve().parents[2] / "calm_profile_api"
+sys.path.insert(0, str(API_DIR))
+
+import assessment_export  # noqa: E402
+from report_renderer import render_pdf  # noqa: E402
 
 
 def load_assessment_data(json_path):
@@ -25,294 +38,9 @@ def load_assessment_data(json_path):
 
 def generate_pdf_report(assessment_data, output_path):
     """generate pdf report from assessment data"""
-
-    # template html
-    html_template = """
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>calm.profile diagnostic report</title>
-        <style>
-            @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500&display=swap');
-            
-            * {
-                margin: 0;
-                padding: 0;
-                box-sizing: border-box;
-            }
-            
-            body {
-                font-family: 'Inter', sans-serif;
-                line-height: 1.6;
-                color: #0a0a0a;
-                background: #ffffff;
-                font-size: 14px;
-            }
-            
-            .container {
-                max-width: 800px;
-                margin: 0 auto;
-                padding: 40px 20px;
-            }
-            
-            .header {
-                text-align: center;
-                margin-bottom: 40px;
-                border-bottom: 2px solid #00c9a7;
-                padding-bottom: 20px;
-            }
-            
-            .logo {
-                font-family: 'JetBrains Mono', monospace;
-                font-size: 24px;
-                font-weight: 500;
-                color: #0a0a0a;
-                margin-bottom: 10px;
-            }
-            
-            .logo .dot {
-                color: #00c9a7;
-            }
-            
-            .tagline {
-                font-size: 12px;
-                color: #666666;
-                text-transform: lowercase;
-            }
-            
-            .report-title {
-                font-size: 28px;
-                font-weight: 600;
-                color: #0a0a0a;
-                margin: 30px 0 10px 0;
-                text-transform: lowercase;
-            }
-            
-            .report-subtitle {
-                font-size: 16px;
-                color: #666666;
-                margin-bottom: 40px;
-            }
-            
-            .section {
-                margin-bottom: 40px;
-            }
-            
-            .section-title {
-                font-size: 20px;
-                font-weight: 600;
-                color: #0a0a0a;
-                margin-bottom: 20px;
-                text-transform: lowercase;
-                border-left: 4px solid #00c9a7;
-                padding-left: 15px;
-            }
-            
-            .archetype-card {
-                background: #f8f9fa;
-                border: 1px solid #e9ecef;
-                border-radius: 8px;
-                padding: 20px;
-                margin-bottom: 20px;
-            }
-            
-            .archetype-name {
-                font-size: 18px;
-                font-weight: 600;
-                color: #00c9a7;
-                margin-bottom: 10px;
-            }
-            
-            .archetype-tagline {
-                font-size: 14px;
-                color: #666666;
-                font-style: italic;
-                margin-bottom: 15px;
-            }
-            
-            .confidence-bar {
-                background: #e9ecef;
-                height: 8px;
-                border-radius: 4px;
-                overflow: hidden;
-                margin-bottom: 10px;
-            }
-            
-            .confidence-fill {
-                background: #00c9a7;
-                height: 100%;
-                width: {{ assessment_data.archetype.confidence }}%;
-                transition: width 0.3s ease;
-            }
-            
-            .confidence-text {
-                font-size: 12px;
-                color: #666666;
-                text-align: right;
-            }
-            
-            .metrics-grid {
-                display: grid;
-                grid-template-columns: 1fr 1fr;
-                gap: 20px;
-                margin-bottom: 20px;
-            }
-            
-            .metric-card {
-                background: #ffffff;
-                border: 1px solid #e9ecef;
-                border-radius: 6px;
-                padding: 15px;
-                text-align: center;
-            }
-            
-            .metric-value {
-                font-size: 24px;
-                font-weight: 600;
-                color: #00c9a7;
-                margin-bottom: 5px;
-            }
-            
-            .metric-label {
-                font-size: 12px;
-                color: #666666;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-            }
-            
-            .recommendations {
-                background: #f8f9fa;
-                border-radius: 8px;
-                padding: 20px;
-            }
-            
-            .recommendation-item {
-                margin-bottom: 15px;
-                padding-left: 20px;
-                position: relative;
-            }
-            
-            .recommendation-item::before {
-                content: "→";
-                position: absolute;
-                left: 0;
-                color: #00c9a7;
-                font-weight: bold;
-            }
-            
-            .strengths-list {
-                list-style: none;
-            }
-            
-            .strengths-list li {
-                margin-bottom: 8px;
-                padding-left: 20px;
-                position: relative;
-            }
-            
-            .strengths-list li::before {
-                content: "✓";
-                position: absolute;
-                left: 0;
-                color: #00c9a7;
-                font-weight: bold;
-            }
-            
-            .footer {
-                margin-top: 60px;
-                padding-top: 20px;
-                border-top: 1px solid #e9ecef;
-                text-align: center;
-                font-size: 12px;
-                color: #666666;
-            }
-            
-            .footer .logo {
-                font-size: 16px;
-                margin-bottom: 5px;
-            }
-            
-            @media print {
-                body { margin: 0; }
-                .container { padding: 20px; }
-            }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <div class="logo">syrıs<span class="dot">.</span></div>
-                <div class="tagline">calm in the chaos of creative work</div>
-            </div>
-            
-            <h1 class="report-title">calm.profile diagnostic report</h1>
-            <p class="report-subtitle">behavioral archetype analysis & productivity assessment</p>
-            
-            <div class="section">
-                <h2 class="section-title">archetype analysis</h2>
-                <div class="archetype-card">
-                    <div class="archetype-name">{{ assessment_data.archetype.primary.title() }}</div>
-                    <div class="archetype-tagline">{{ assessment_data.archetype.tagline }}</div>
-                    <div class="confidence-bar">
-                        <div class="confidence-fill"></div>
-                    </div>
-                    <div class="confidence-text">{{ assessment_data.archetype.confidence }}% confidence</div>
-                </div>
-            </div>
-            
-            <div class="section">
-                <h2 class="section-title">productivity metrics</h2>
-                <div class="metrics-grid">
-                    <div class="metric-card">
-                        <div class="metric-value">{{ assessment_data.metrics.hours_lost_ppw }}</div>
-                        <div class="metric-label">hours lost per week</div>
-                    </div>
-                    <div class="metric-card">
-                        <div class="metric-value">${{ "{:,}".format(assessment_data.metrics.annual_cost) }}</div>
-                        <div class="metric-label">annual productivity cost</div>
-                    </div>
-                </div>
-            </div>
-            
-            <div class="section">
-                <h2 class="section-title">recommendations</h2>
-                <div class="recommendations">
-                    <h3 style="margin-bottom: 15px; color: #0a0a0a;">quick wins</h3>
-                    {% for rec in assessment_data.recommendations.quick_wins %}
-                    <div class="recommendation-item">{{ rec }}</div>
-                    {% endfor %}
-                    
-                    <h3 style="margin-bottom: 15px; color: #0a0a0a; margin-top: 25px;">strengths to leverage</h3>
-                    <ul class="strengths-list">
-                        {% for strength in assessment_data.recommendations.strengths %}
-                        <li>{{ strength }}</li>
-                        {% endfor %}
-                    </ul>
-                </div>
-            </div>
-            
-            <div class="footer">
-                <div class="logo">syrıs<span class="dot">.</span></div>
-                <div>generated on {{ current_date }}</div>
-                <div>assessment id: {{ assessment_data.assessment_id }}</div>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-
     try:
-        # render template
-        template = Template(html_template)
-        current_date = datetime.now().strftime("%b %d, %Y at %I:%M %p")
-        html_content = template.render(
-            assessment_data=assessment_data, current_date=current_date
-        )
-
-        # generate pdf
-        pdf_bytes = weasyprint.HTML(string=html_content).write_pdf()
+        # template, stylesheet and fonts are loaded once per process by the shared renderer
+        pdf_bytes = render_pdf(assessment_data)
 
         # save to file
         with open(output_path, "wb") as f:
@@ -326,13 +54,190 @@ def generate_pdf_report(assessment_data, output_path):
         return False
 
 
+def content_key(*parts):
+    """hash of everything a report is rendered from"""
+    blob = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def iter_dir(path):
+    """(assessment_id, data, content_key) for every *.json in a directory"""
+    for json_path in sorted(Path(path).glob("*.json")):
+        data = load_assessment_data(json_path)
+        if data is None:
+            yield json_path.stem, None, None
+            continue
+        yield str(data.get("assessment_id") or json_path.stem), data, content_key(data)
+
+
+def iter_ndjson(path):
+    """one assessment per line; '-' reads stdin"""
+    stream = sys.stdin if path == "-" else open(path, "r")
+    with stream:
+        for lineno, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except ValueError as e:
+                print(f"error: line {lineno}: {e}")
+                yield f"line-{lineno}", None, None
+                continue
+            yield str(data.get("assessment_id") or f"line-{lineno}"), data, content_key(data)
+
+
+def iter_db(since=None, payment_status=(), chunk_size=500):
+    """
+    stored assessments (DATABASE_URL), streamed in chunks and filtered in SQL.
+    the report data is a callable, so rows whose pdf is up to date are never scored:
+    their key is the stored columns report_data reads plus the scoring version
+    (so a rescore, or a model with new copy, makes the pdf stale)
+    """
+    from functools import partial
+
+    from app import create_app, report_data, stream_chunks
+    from calm_profile_system import scoring_version
+    from models import Assessment
+    from assessment_storage import STORAGE_COLUMNS
+
+    t = Assessment.__table__
+    columns = [t.c.id, t.c.archetype_primary, t.c.overhead_index, t.c.hours_lost, t.c.annual_cost,
+               t.c.created_at, *(t.c[c] for c in STORAGE_COLUMNS)]
+    where = assessment_export.export_where(t, since=since, payment_status=payment_status)
+    # the app context stays pushed while run_batch consumes this generator (and calls report_data)
+    with create_app().app_context():
+        version = scoring_version()
+        for rows in stream_chunks(columns, chunk_size, where=where):
+            for r in rows:
+                yield r.id, partial(report_data, r), content_key(version, r._asdict())
+
+
+def _safe_name(assessment_id):
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in str(assessment_id))
+
+
+def _write_atomic(path, data):
+    tmp = path.with_suffix(".pdf.tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _key_path(pdf_path):
+    return pdf_path.with_name(pdf_path.name + ".key")
+
+
+def _stored_key(pdf_path):
+    try:
+        return _key_path(pdf_path).read_text()
+    except FileNotFoundError:
+        return None
+
+
+def run_batch(source, out_dir, workers, force=False, window=None):
+    """
+    render every assessment from source into out_dir/<assessment_id>.pdf across worker processes.
+    source yields (assessment_id, data, content_key); data is the report data, None if
+    unreadable, or a callable that builds it (only called for outputs that are stale).
+    each pdf gets a <name>.pdf.key file with the content key and template version it
+    was rendered from; it is up to date while both still match
+    """
+    from concurrent.futures import FIRST_COMPLETED, wait
+    from report_renderer import RenderPool, template_version
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    # template, stylesheet and font bundle: a change makes every existing output stale
+    template = template_version()
+    window = window or workers * 4
+
+    pool = RenderPool(workers=workers, queue_size=window)
+    in_flight = {}
+    rendered = skipped = 0
+    failures = []
+    started = time.perf_counter()
+
+    def collect(block):
+        nonlocal rendered
+        done, _ = wait(list(in_flight), timeout=None if block else 0, return_when=FIRST_COMPLETED)
+        for fut in done:
+            assessment_id, path, key = in_flight.pop(fut)
+            try:
+                _write_atomic(path, fut.result())
+                _key_path(path).write_text(key)
+                rendered += 1
+            except Exception as e:
+                failures.append((assessment_id, str(e)))
+
+    try:
+        for assessment_id, data, source_key in source:
+            if data is None:
+                failures.append((assessment_id, "unreadable input"))
+                continue
+            path = out_dir / f"{_safe_name(assessment_id)}.pdf"
+            key = f"{template}:{source_key}"
+            if not force and path.exists() and _stored_key(path) == key:
+                skipped += 1
+                continue
+            # bounded: never more than `window` reports held in memory
+            while len(in_flight) >= window:
+                collect(block=True)
+            if callable(data):
+                try:
+                    data = data()
+                except Exception as e:
+                    failures.append((assessment_id, str(e)))
+                    continue
+            in_flight[pool.submit(data, timeout=None)] = (assessment_id, path, key)
+            collect(block=False)
+        while in_flight:
+            collect(block=True)
+    finally:
+        pool.close()
+
+    elapsed = time.perf_counter() - started
+    total = rendered + skipped + len(failures)
+    print(f"{total} assessments: {rendered} rendered, {skipped} up to date, {len(failures)} failed in {elapsed:.1f}s "
+          f"({rendered / elapsed * 60 if elapsed else 0:,.0f} reports/min)")
+    for assessment_id, error in failures[:20]:
+        print(f"  failed {assessment_id}: {error}")
+    return not failures
+
+
 def main():
     """main function"""
-    if len(sys.argv) != 2:
-        print("usage: python generate_sample_report.py <assessment_json_path>")
+    parser = argparse.ArgumentParser(description="generate diagnostic report pdfs")
+    parser.add_argument("json_path", nargs="?", help="single assessment json (writes diagnostic-sample_<timestamp>.pdf)")
+    batch = parser.add_mutually_exclusive_group()
+    batch.add_argument("--dir", help="batch: directory of assessment json files")
+    batch.add_argument("--ndjson", help="batch: ndjson file of assessments ('-' for stdin)")
+    batch.add_argument("--db", action="store_true", help="batch: stored assessments from DATABASE_URL")
+    parser.add_argument("--since", type=assessment_export.parse_time,
+                        help="--db: only assessments created on/after this ISO date/time (UTC)")
+    parser.add_argument("--payment-status", action="append", default=[],
+                        help="--db: only assessments with this payment status (repeatable)")
+    parser.add_argument("--out", default="reports", help="batch output directory (default: reports)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--force", action="store_true", help="re-render outputs that are already up to date")
+    args = parser.parse_args()
+    if (args.since or args.payment_status) and not args.db:
+        parser.error("--since and --payment-status only apply to --db")
+
+    if args.dir or args.ndjson or args.db:
+        if args.dir:
+            source = iter_dir(args.dir)
+        elif args.ndjson:
+            source = iter_ndjson(args.ndjson)
+        else:
+            source = iter_db(since=args.since, payment_status=args.payment_status)
+        ok = run_batch(source, args.out, args.workers, force=args.force)
+        sys.exit(0 if ok else 1)
+
+    if not args.json_path:
+        parser.print_usage()
         sys.exit(1)
 
-    json_path = sys.argv[1]
+    json_path = args.json_path
     if not os.path.exists(json_path):
         print(f"error: file not found: {json_path}")
         sys.exit(1)
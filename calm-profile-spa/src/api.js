@@ -5,5 +5,9 @@ const API_URL = raw.replace(/\/+$/, '');
 export const submitAssessment = async ({ responses, context }) =>
   (await axios.post(`${API_URL}/api/assess`, { responses, context })).data;
 
+// partial answers -> odds of each primary archetype ({ probabilities, leading, decided, ... })
+export const fetchProgress = async (responses) =>
+  (await axios.post(`${API_URL}/api/assess/progress`, { responses })).data;
+
 export const createCheckout = async (email, assessmentId) =>
   (await axios.post(`${API_URL}/api/create-checkout`, { email, assessment_id: assessmentId })).data;
@@ -1,123 +1,375 @@
+"""
+Calm Profile API (Flask).
+
+create_app() builds the app: config from the environment (.env included),
+the database engine, the JSON provider and the per-process services
+(write-behind queue, result cache, metrics). It never touches the database;
+the schema is created or upgraded by `flask init-db` as a deploy step. Built
+once in the gunicorn master (preload_app in gunicorn.conf.py), the app and
+everything it warms up here are shared copy-on-write by the forked workers.
+
+    gunicorn -c gunicorn.conf.py
+    flask --app app init-db
+    python app.py                   # dev server (runs init-db first)
+"""
+
 import os
-from datetime import datetime
-from flask import Flask, request, jsonify
+import json
+import math
+import time
+import base64
+import logging
+from datetime import datetime, timedelta
+import click
+import atexit
+import threading
+from flask import Blueprint, Flask, current_app, request, jsonify, Response, stream_with_context
 from flask_cors import CORS
-from flask_sqlalchemy import SQLAlchemy
 from dotenv import load_dotenv
+from sqlalchemy import insert, select, bindparam, tuple_
 from uuid import uuid4
-import traceback
-
-load_dotenv()
-app = Flask(__name__)
-
-# CORS for local dev
-CORS(app, resources={
-    r"/api/*": {
-        "origins": ["http://localhost:*", "http://127.0.0.1:*", "http://localhost:3000", "http://localhost:5173"],
-        "methods": ["GET", "POST", "OPTIONS"],
-        "allow_headers": ["Content-Type"],
-        "supports_credentials": True
-    }
-})
-
-# db
-db_url = os.getenv("DATABASE_URL", "sqlite:///calm_profile.db")
-if db_url.startswith("postgres://"):
-    db_url = db_url.replace("postgres://", "postgresql+psycopg2://", 1)
-
-app.config["SQLALCHEMY_DATABASE_URI"] = db_url
-app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-db = SQLAlchemy(app)
-
-class Assessment(db.Model):
-    __tablename__ = "assessments"
-    id = db.Column(db.String(36), primary_key=True)
-    email = db.Column(db.String(255), index=True)
-    archetype_primary = db.Column(db.String(32))
-    archetype_mix = db.Column(db.JSON)
-    axis_scores = db.Column(db.JSON)
-    overhead_index = db.Column(db.Float)
-    hours_lost = db.Column(db.Float)
-    annual_cost = db.Column(db.Float)
-    raw_responses = db.Column(db.JSON)
-    context_data = db.Column(db.JSON)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    report_sent = db.Column(db.Boolean, default=False)
-    payment_status = db.Column(db.String(20), default="pending")
-
-from calm_profile_system import score_assessment, format_response
-
-with app.app_context():
-    db.create_all()
-
-@app.get("/api/health")
+
+from db_config import database_url, engine_options, configure_engine
+from json_provider import provider_class
+from models import db, Assessment, init_db
+from cost_model import COST_MODEL_VERSION, context_cost, cost_grid, OVERHEAD_MULTIPLIERS, TEAM_MULTIPLIERS
+from calm_profile_system import (
+    score_assessment, score_batch, format_response, responses_to_mask, scoring_version, current_model,
+    primary_odds,
+)
+from write_behind import WriteBehindQueue
+from report_renderer import RenderPool, RenderError
+from report_store import ReportStore, report_content
+from result_cache import ResultCache, CachedResult
+from assessment_storage import (
+    STORAGE_COLUMNS, CONTEXT_FIELDS, storage_row,
+    responses_of, axis_scores_of, archetype_mix_of, context_data_of,
+)
+import assessment_export
+import rollups
+from request_metrics import Metrics, default_directory, phase
+import request_metrics
+import query_log
+
+log = logging.getLogger(__name__)
+
+# routes and cli commands; registered on the app by create_app
+api = Blueprint("api", __name__, cli_group=None)
+
+# per-process services, set up by create_app (one app per process)
+write_behind = None
+rollup_writer = None
+result_cache = None
+metrics = None
+
+
+def create_app(config=None):
+    global write_behind, rollup_writer, result_cache, metrics
+    load_dotenv()
+    app = Flask(__name__)
+    # orjson encoding/parsing when installed; JSON_PROVIDER=stdlib for the standard library
+    app.json = provider_class(os.getenv("JSON_PROVIDER", "orjson"))(app)
+
+    # CORS for local dev
+    CORS(app, resources={
+        r"/api/*": {
+            "origins": ["http://localhost:*", "http://127.0.0.1:*", "http://localhost:3000", "http://localhost:5173"],
+            "methods": ["GET", "POST", "OPTIONS"],
+            "allow_headers": ["Content-Type"],
+            "supports_credentials": True
+        }
+    })
+
+    # db
+    db_url = database_url()
+    app.config["SQLALCHEMY_DATABASE_URI"] = db_url
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(db_url)
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    # largest cohort accepted by /api/assess/batch in one request
+    app.config["ASSESS_BATCH_MAX"] = int(os.getenv("ASSESS_BATCH_MAX", 5000))
+    # largest what-if grid (rates x team sizes x meeting loads) /api/assessments/<id>/scenarios evaluates
+    app.config["SCENARIO_MAX_CELLS"] = int(os.getenv("SCENARIO_MAX_CELLS", 100_000))
+    # largest page of /api/assessments
+    app.config["ASSESSMENTS_PAGE_MAX"] = int(os.getenv("ASSESSMENTS_PAGE_MAX", 200))
+    # render each new assessment's report right after /api/assess, before anyone asks for it.
+    # off by default: it starts the render workers (extra processes) in every web worker
+    app.config["REPORT_PRERENDER"] = os.getenv("REPORT_PRERENDER", "0") == "1"
+    app.config.update(config or {})
+    db.init_app(app)
+
+    with app.app_context():
+        # creating the engine doesn't connect
+        engine = db.engine
+        configure_engine(engine)
+        # statement counts/time per request, and SQL_SLOW_QUERY_MS=<ms> logs slower statements (calm.sql.slow)
+        query_log.instrument(
+            engine,
+            slow_query_ms=float(os.environ["SQL_SLOW_QUERY_MS"]) if os.getenv("SQL_SLOW_QUERY_MS") else None,
+        )
+
+        # committed assessment rows reach the analytics rollups through a batched consumer,
+        # never inside the insert's transaction (a rollup failure must not lose assessments).
+        # made first, so atexit (last registered, first run) drains write-behind into it before closing it
+        rollup_writer = rollup_queue(engine)
+
+        # optional group-commit persistence for /api/assess (ASSESS_WRITE_BEHIND=1)
+        write_behind = None
+        if os.getenv("ASSESS_WRITE_BEHIND", "0") == "1":
+            write_behind = WriteBehindQueue(
+                engine,
+                Assessment.__table__,
+                interval_ms=float(os.getenv("WRITE_BEHIND_INTERVAL_MS", 5)),
+                max_batch=int(os.getenv("WRITE_BEHIND_MAX_BATCH", 500)),
+                after_commit=rollup_writer.submit_many,
+            )
+
+        # read-only state every request uses: built here so preloaded workers share it
+        current_model().outcome_table
+
+    # finished /api/assess responses by (answers, context, model version); RESULT_CACHE_SIZE=0 turns it off
+    result_cache = None
+    if int(os.getenv("RESULT_CACHE_SIZE", 10000)) > 0:
+        result_cache = ResultCache(
+            max_entries=int(os.getenv("RESULT_CACHE_SIZE", 10000)),
+            redis_url=os.getenv("RESULT_CACHE_REDIS_URL"),
+        )
+
+    # per-request phase timing (Server-Timing header) and /api/metrics; REQUEST_METRICS=0 turns it off
+    metrics = None
+    if os.getenv("REQUEST_METRICS", "1") == "1":
+        metrics = Metrics(
+            os.getenv("METRICS_DIR") or default_directory(),
+            flush_interval=float(os.getenv("METRICS_FLUSH_INTERVAL", 5)),
+        )
+        request_metrics.init_app(app, metrics)
+
+    app.register_blueprint(api)
+    return app
+
+
+def rollup_queue(engine):
+    """rollups.apply() for committed assessment rows, batched on a background thread (nothing is inserted)"""
+    return WriteBehindQueue(
+        engine,
+        None,
+        interval_ms=float(os.getenv("ROLLUP_INTERVAL_MS", 1000)),
+        max_batch=int(os.getenv("ROLLUP_MAX_BATCH", 2000)),
+        after_insert=rollups.apply,
+        name="assessment-rollups",
+    )
+
+
+@api.cli.command("init-db")
+def init_db_command():
+    """create or upgrade the database schema (tables, new columns, indexes); safe to rerun"""
+    started = time.perf_counter()
+    for change in init_db(db.engine):
+        click.echo(change)
+    click.echo(f"schema ready in {time.perf_counter() - started:.2f}s")
+
+
+def health_payload(**services):
+    """
+    the /api/health body, shared with asgi.py: status, time, the scoring
+    model and its version, then stats() of each per-process service given
+    (None = not running in this process)
+    """
+    body = {"status": "healthy", "timestamp": datetime.utcnow().isoformat(),
+            "scoring_model": current_model().version, "scoring_version": scoring_version()}
+    for name, service in services.items():
+        if service:
+            body[name] = service.stats()
+    return body
+
+
+@api.get("/api/health")
 def health():
-    return jsonify({"status": "healthy", "timestamp": datetime.utcnow().isoformat()})
+    body = health_payload(write_behind=write_behind, rollups=rollup_writer, result_cache=result_cache)
+    if _report_store:
+        body["report_store"] = {**_report_store.stats(), "prerendering": len(_report_renders)}
+    return jsonify(body)
+
+
+def format_responses(responses):
+    # A/B -> 1/0
+    return {str(i): (1 if responses.get(str(i)) == "A" else 0) for i in range(20)}
 
-@app.post("/api/assess")
+
+def format_partial_responses(responses):
+    # A/B -> 1/0, anything else is still unanswered (left out)
+    return {str(i): (1 if v == "A" else 0) for i in range(20) if (v := responses.get(str(i))) in ("A", "B")}
+
+
+def result_cache_key(formatted, context):
+    """everything an /api/assess response depends on: answers, the context values context_cost reads, model versions"""
+    ctx = [context.get("teamSize", "solo"), context.get("meetingLoad", "light"),
+           float(context.get("hourlyRate", 85)), context.get("platform", "web")]
+    return f"{scoring_version()}.{COST_MODEL_VERSION}:{responses_to_mask(formatted)}:{json.dumps(ctx, separators=(',', ':'))}"
+
+
+def split_body(payload):
+    """jsonify(payload) bytes, split around the assessment id -> (head, tail)"""
+    marker = f"assessment-id-{uuid4().hex}"
+    body = current_app.json.response({**payload, "assessment_id": marker}).get_data()
+    head, _, tail = body.partition(marker.encode("utf-8"))
+    return head, tail
+
+
+def context_from_stored(context_data):
+    """stored context_data (snake_case) -> request-style context for context_cost"""
+    cd = context_data or {}
+    keys = {"team_size": "teamSize", "meeting_load": "meetingLoad", "hourly_rate": "hourlyRate", "platform": "platform"}
+    return {v: cd[k] for k, v in keys.items() if k in cd}
+
+
+def assessment_row(assessment_id, formatted, result, context):
+    context_data, overhead_index, hours_lost_ppw, annual_cost = context_cost(result["archetype"]["primary"], context)
+    return {
+        "id": assessment_id,
+        "email": None,
+        "archetype_primary": result["archetype"]["primary"],
+        "archetype_mix": result["archetype"]["mix"],
+        "axis_scores": result["scores"]["axes"],
+        "overhead_index": overhead_index,
+        "hours_lost": hours_lost_ppw,
+        "annual_cost": annual_cost,
+        "raw_responses": formatted,
+        "context_data": context_data,
+        "created_at": datetime.utcnow(),
+    }
+
+
+def assessment_payload(row, result):
+    return {
+        "success": True,
+        "assessment_id": row["id"],
+        "archetype": result["archetype"],
+        "scores": {**result["scores"]["axes"], "overhead_index": round(row["overhead_index"] * 100)},
+        "metrics": {"hours_lost_ppw": round(row["hours_lost"], 1), "annual_cost": round(row["annual_cost"])},
+        "recommendations": result["recommendations"],
+        "tagline": result["archetype"].get("tagline", "")
+    }
+
+
+@api.post("/api/assess")
 def assess():
     try:
-        data = request.get_json(force=True)
-        responses = data.get("responses", {})
-        context = data.get("context", {})
-
-        # A/B -> 1/0
-        formatted = {str(i): (1 if responses.get(str(i)) == "A" else 0) for i in range(20)}
-
-        # score
-        result = score_assessment(formatted)
-
-        # context
-        team_size = context.get("teamSize", "solo")
-        meeting_load = context.get("meetingLoad", "light")
-        hourly_rate = float(context.get("hourlyRate", 85))
-        platform = context.get("platform", "web")
-
-        overhead_multipliers = {"light": 0.6, "moderate": 0.8, "heavy": 1.0}
-        meeting_key = next((k for k in overhead_multipliers if k in str(meeting_load).lower()), "moderate")
-        overhead_base = overhead_multipliers[meeting_key]
-
-        arche_adj = {"architect": 0.9, "conductor": 0.85, "curator": 1.1, "craftsperson": 1.2}
-        primary = result["archetype"]["primary"].lower()
-        overhead_index = overhead_base * arche_adj.get(primary, 1.0)
-
-        team_mult = {"solo": 1, "2-5": 4, "6-15": 10, "16-50": 25, "50+": 55}
-        tm = next((v for k, v in team_mult.items() if k in str(team_size)), 1)
-
-        hours_lost_ppw = overhead_index * 5.0
-        annual_cost = hours_lost_ppw * 52 * hourly_rate * tm
-
-        # save
-        assessment_id = str(uuid4())
-        rec = Assessment(
-            id=assessment_id,
-            email=None,
-            archetype_primary=result["archetype"]["primary"],
-            archetype_mix=result["archetype"]["mix"],
-            axis_scores=result["scores"]["axes"],
-            overhead_index=overhead_index,
-            hours_lost=hours_lost_ppw,
-            annual_cost=annual_cost,
-            raw_responses=formatted,
-            context_data={"team_size": team_size, "meeting_load": meeting_load, "hourly_rate": hourly_rate, "platform": platform}
-        )
-        db.session.add(rec)
-        db.session.commit()
+        with phase("parse"):
+            data = request.get_json(force=True)
+            formatted = format_responses(data.get("responses", {}))
+            context = data.get("context", {})
+            assessment_id = str(uuid4())
 
-        return jsonify({
-            "success": True,
-            "assessment_id": assessment_id,
-            "archetype": result["archetype"],
-            "scores": {**result["scores"]["axes"], "overhead_index": round(overhead_index * 100)},
-            "metrics": {"hours_lost_ppw": round(hours_lost_ppw, 1), "annual_cost": round(annual_cost)},
-            "recommendations": result["recommendations"],
-            "tagline": result["archetype"].get("tagline", "")
-        })
+        with phase("cache"):
+            key = result_cache_key(formatted, context) if result_cache else None
+            cached = result_cache.get(key) if key else None
+        if cached:
+            # seen this answer pattern + context before: same row and body, new id
+            row = {**cached.row, "id": assessment_id, "created_at": datetime.utcnow()}
+        else:
+            with phase("score"):
+                result = score_assessment(formatted)
+            with phase("cost"):
+                row = assessment_row(assessment_id, formatted, result, context)
+
+        with phase("save"):
+            if write_behind:
+                write_behind.submit(storage_row(row))
+            else:
+                db.session.add(Assessment(**storage_row(row)))
+                db.session.commit()
+                rollup_writer.submit(row)
+
+        if cached:
+            # (its report was prerendered when the result was first computed)
+            return current_app.response_class(cached.body(assessment_id), mimetype=current_app.json.mimetype)
+
+        if current_app.config["REPORT_PRERENDER"]:
+            with phase("prerender"):
+                prerender(report_data_for(row, result))
+
+        with phase("serialize"):
+            payload = assessment_payload(row, result)
+            if key:
+                head, tail = split_body(payload)
+                template = {k: v for k, v in row.items() if k not in ("id", "created_at")}
+                result_cache.put(key, CachedResult(head, tail, template))
+                return current_app.response_class(head + assessment_id.encode("utf-8") + tail, mimetype=current_app.json.mimetype)
+            return jsonify(payload)
     except Exception as e:
-        print(traceback.format_exc())
+        current_app.logger.exception("assessment failed")
         return jsonify({"success": False, "error": str(e)}), 500
 
-@app.post("/api/create-checkout")
+@api.post("/api/assess/batch")
+def assess_batch():
+    """score a cohort in one pass and persist it with one bulk insert"""
+    try:
+        data = request.get_json(force=True) or {}
+        items = data.get("items")
+        if not isinstance(items, list) or not items:
+            return jsonify({"success": False, "error": "items must be a non-empty list"}), 400
+        max_batch = current_app.config["ASSESS_BATCH_MAX"]
+        if len(items) > max_batch:
+            return jsonify({"success": False, "error": f"batch too large (max {max_batch})"}), 413
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                return jsonify({"success": False, "error": f"items[{index}] must be an object"}), 400
+            for field in ("responses", "context"):
+                if not isinstance(item.get(field, {}), dict):
+                    return jsonify({"success": False, "error": f"items[{index}].{field} must be an object"}), 400
+
+        with phase("score"):
+            formatted = [format_responses(item.get("responses", {})) for item in items]
+            scores = score_batch([[f[str(i)] for i in range(20)] for f in formatted])
+
+        with phase("cost"):
+            rows, payloads = [], []
+            for item, f, result in zip(items, formatted, scores.results()):
+                row = assessment_row(str(uuid4()), f, result, item.get("context", {}))
+                rows.append(row)
+                payloads.append(assessment_payload(row, result))
+
+        with phase("save"):
+            db.session.execute(insert(Assessment), [storage_row(r) for r in rows])
+            db.session.commit()
+            rollup_writer.submit_many(rows)
+
+        with phase("serialize"):
+            return jsonify({"success": True, "count": len(rows), "results": payloads})
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.exception("batch assessment failed")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+@api.post("/api/assess/progress")
+def assess_progress():
+    """odds of each primary archetype over every completion of the unanswered questions; nothing is stored"""
+    try:
+        with phase("parse"):
+            data = request.get_json(force=True) or {}
+            responses = data.get("responses", {})
+            if not isinstance(responses, dict):
+                return jsonify({"success": False, "error": "responses must be an object"}), 400
+            partial = format_partial_responses(responses)
+
+        with phase("score"):
+            odds = primary_odds(partial)
+            leading = max(odds["counts"], key=odds["counts"].get)
+
+        with phase("serialize"):
+            return jsonify({
+                "success": True,
+                **odds,
+                "leading": leading,
+                # every completion ends on the same primary: its result page copy can be prefetched
+                "decided": odds["counts"][leading] == odds["completions"],
+                "scoring_version": scoring_version(),
+            })
+    except Exception as e:
+        current_app.logger.exception("progress scoring failed")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+@api.post("/api/create-checkout")
 def create_checkout():
     """dev: return stub link; prod: uncomment stripe block below"""
     try:
@@ -128,7 +380,10 @@ def create_checkout():
 
         # attach email if present
         if assessment_id and email:
-            a = Assessment.query.get(assessment_id)
+            a = db.session.get(Assessment, assessment_id)
+            if a is None and write_behind and write_behind.flush():
+                # row may still be queued
+                a = db.session.get(Assessment, assessment_id)
             if a:
                 a.email = email
                 db.session.commit()
@@ -162,10 +417,558 @@ def create_checkout():
         return jsonify({"success": True, "checkout_url": session.url})
         """
     except Exception as e:
-        print(f"Checkout error: {str(e)}")
+        current_app.logger.exception("checkout failed")
         return jsonify({"error": str(e)}), 500
 
+def report_data_for(row, result):
+    """template data: the /api/assess body plus match confidence"""
+    data = assessment_payload(row, result)
+    primary = row["archetype_primary"] or result["archetype"]["primary"]
+    data["archetype"] = {
+        **result["archetype"],
+        "primary": primary,
+        "mix": row["archetype_mix"] or result["archetype"]["mix"],
+        "confidence": result["scores"]["match"].get(primary, 0.0),
+    }
+    return data
+
+
+def report_data(a):
+    """template data for a stored assessment"""
+    result = score_assessment(responses_of(a) or {})
+    columns = ("id", "archetype_primary", "overhead_index", "hours_lost", "annual_cost")
+    return report_data_for({**{c: getattr(a, c) for c in columns}, "archetype_mix": archetype_mix_of(a)}, result)
+
+
+# warm pdf render workers, started on first use in each gunicorn worker
+_render_pool = None
+
+
+def render_pool():
+    global _render_pool
+    if _render_pool is None or _render_pool.pid != os.getpid():
+        _render_pool = RenderPool(
+            workers=int(os.getenv("REPORT_RENDER_WORKERS", 2)),
+            max_renders=int(os.getenv("REPORT_RENDER_MAX_RENDERS", 200)),
+            max_rss_mb=float(os.getenv("REPORT_RENDER_MAX_RSS_MB", 500)),
+        )
+        atexit.register(_render_pool.close)
+    return _render_pool
+
+
+# rendered pdfs shared by every assessment with the same report content
+_report_store = None
+# store key -> render future, so a request can wait on a render already under way
+_report_renders = {}
+_report_renders_lock = threading.Lock()
+
+
+def report_store():
+    global _report_store
+    if _report_store is None:
+        _report_store = ReportStore(
+            os.getenv("REPORT_STORE_DIR", os.path.join(current_app.instance_path, "reports")),
+            max_bytes=int(os.getenv("REPORT_STORE_MAX_MB", 512)) * 1024 * 1024,
+        )
+    return _report_store
+
+
+def _stored(key, fut):
+    try:
+        if fut.exception() is None:
+            report_store().put(key, fut.result())
+    except Exception:
+        log.exception("storing report %s failed", key)
+    finally:
+        with _report_renders_lock:
+            _report_renders.pop(key, None)
+
+
+def render_stored(key, content, queue_timeout=30.0):
+    """the render future for key: one already in flight, or a new one that lands in the store"""
+    with _report_renders_lock:
+        fut = _report_renders.get(key)
+        if fut is None:
+            # content only: no assessment id or date, so the pdf can be shared
+            fut = render_pool().submit(content, current_date="", timeout=queue_timeout)
+            _report_renders[key] = fut
+            fut.add_done_callback(lambda f: _stored(key, f))
+    return fut
+
+
+def prerender(data):
+    """queue a report render unless it's stored or already rendering; never blocks or fails the caller"""
+    try:
+        store = report_store()
+        content = report_content(data)
+        key = store.key(content)
+        if key not in _report_renders and not store.path(key).exists():
+            render_stored(key, content, queue_timeout=0)
+    except Exception as e:
+        # queue full or pool unavailable: the report renders on first request instead
+        current_app.logger.info("report prerender skipped: %s", e)
+
+
+@api.get("/api/report/<assessment_id>.pdf")
+def report_pdf(assessment_id):
+    """
+    the paid report: served once the assessment's checkout is paid, or to
+    callers with "Authorization: Bearer <REPORT_TOKEN>" (support, the mailer).
+    402 otherwise.
+    """
+    a = db.session.get(Assessment, assessment_id)
+    if a is None and write_behind and write_behind.flush():
+        a = db.session.get(Assessment, assessment_id)
+    if a is None:
+        return jsonify({"success": False, "error": "assessment not found"}), 404
+    if a.payment_status != "paid" and not (os.getenv("REPORT_TOKEN") and authorized("REPORT_TOKEN")):
+        return jsonify({"success": False, "error": "report not paid for"}), 402
+    store = report_store()
+    with phase("score"):
+        content = report_content(report_data(a))
+    key = store.key(content)
+    with phase("store"):
+        pdf = store.get(key)
+    if pdf is None:
+        try:
+            with phase("render"):
+                pdf = render_stored(key, content).result(timeout=float(os.getenv("REPORT_RENDER_TIMEOUT", 60)))
+        except (RenderError, TimeoutError) as e:
+            current_app.logger.warning("report %s: %s", assessment_id, e)
+            return jsonify({"success": False, "error": str(e)}), 503
+    return Response(pdf, mimetype="application/pdf", headers={
+        "Content-Disposition": f'inline; filename="calm-profile-{assessment_id}.pdf"',
+        "ETag": f'"{key}"',
+    })
+
+
+def scenario_rates(spec):
+    """'85,120' and/or 'start:stop:step' ranges (stop included) -> hourly rates"""
+    rates = []
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        if ":" in part:
+            start, stop, step = (float(x) for x in part.split(":"))
+            if not all(math.isfinite(x) for x in (start, stop, step)):
+                raise ValueError(f"hourly_rate range bounds must be finite numbers: {part}")
+            if step <= 0:
+                raise ValueError(f"hourly_rate range step must be positive: {part}")
+            count = max(int((stop - start) / step + 1e-9) + 1, 0)
+            # the total so far, not just this range: many ranges mustn't add up to a huge list
+            if len(rates) + count > current_app.config["SCENARIO_MAX_CELLS"]:
+                raise ValueError(f"hourly_rate ranges too long: {part}")
+            rates.extend(start + i * step for i in range(count))
+        else:
+            rates.append(float(part))
+    if not rates or not all(0 <= r < 1e9 for r in rates):
+        raise ValueError("hourly_rate needs at least one rate, each between 0 and 1e9")
+    return rates
+
+
+def scenario_labels(spec, default):
+    labels = [x.strip() for x in spec.split(",") if x.strip()] if spec is not None else list(default)
+    if not labels:
+        raise ValueError("team_size and meeting_load need at least one value")
+    return labels
+
+
+@api.get("/api/assessments/<assessment_id>/scenarios")
+def assessment_scenarios(assessment_id):
+    """
+    what-if annual cost of an assessment's archetype over a grid of contexts, e.g.
+    ?hourly_rate=60:200:10,250&team_size=2-5,16-50&meeting_load=light,heavy
+    (defaults: the assessment's own rate, every team size and meeting load). read-only.
+    """
+    t = Assessment.__table__
+    stmt = select(t.c.archetype_primary, t.c.schema_version, t.c.context_data,
+                  *(t.c[f] for f in CONTEXT_FIELDS)).where(t.c.id == assessment_id)
+    with phase("load"):
+        r = db.session.execute(stmt).first()
+        if r is None and write_behind and write_behind.flush():
+            r = db.session.execute(stmt).first()
+    if r is None:
+        return jsonify({"success": False, "error": "assessment not found"}), 404
+    stored = context_from_stored(context_data_of(r))
+
+    try:
+        rates = scenario_rates(request.args.get("hourly_rate") or str(float(stored.get("hourlyRate", 85))))
+        team_sizes = scenario_labels(request.args.get("team_size"), TEAM_MULTIPLIERS)
+        meeting_loads = scenario_labels(request.args.get("meeting_load"), OVERHEAD_MULTIPLIERS)
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+    cells = len(rates) * len(team_sizes) * len(meeting_loads)
+    if cells > current_app.config["SCENARIO_MAX_CELLS"]:
+        return jsonify({"success": False, "error": f"grid too large ({cells:,} cells, max {current_app.config['SCENARIO_MAX_CELLS']:,})"}), 413
+
+    with phase("cost"):
+        grid = cost_grid(r.archetype_primary, rates, team_sizes, meeting_loads)
+        _, _, _, current_cost = context_cost(r.archetype_primary, stored)
+
+    with phase("serialize"):
+        return jsonify({
+            "success": True,
+            "assessment_id": assessment_id,
+            "archetype": r.archetype_primary,
+            "cost_model_version": COST_MODEL_VERSION,
+            "current": {**stored, "annual_cost": round(current_cost)},
+            "hourly_rates": rates,
+            "team_sizes": team_sizes,
+            "meeting_loads": meeting_loads,
+            **grid.rounded(),
+        })
+
+
+def authorized(token_env):
+    """false if the env var is set and the request lacks "Authorization: Bearer <its value>" """
+    token = os.getenv(token_env)
+    return not token or request.headers.get("Authorization") == f"Bearer {token}"
+
+
+@api.get("/api/metrics")
+def metrics_endpoint():
+    """
+    request counters and latency histograms summed over all workers, in
+    Prometheus text format. set METRICS_TOKEN to require "Authorization: Bearer <token>".
+    """
+    if metrics is None:
+        return jsonify({"success": False, "error": "metrics disabled (REQUEST_METRICS=0)"}), 404
+    if not authorized("METRICS_TOKEN"):
+        return jsonify({"success": False, "error": "unauthorized"}), 401
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+
+@api.get("/api/analytics/summary")
+def analytics_summary():
+    """
+    dashboard numbers from the rollup tables (never scans assessments).
+    ?weeks=12 (0 = all time), optional ?team_size=2-5 and ?archetype=architect.
+    set ANALYTICS_TOKEN to require "Authorization: Bearer <token>".
+
+    counts and means are exact. p50/p90/p99 are the geometric middle of the
+    5%-wide histogram bucket the percentile falls in: within ~2.5% of the
+    true value, and so possibly a little above the largest value recorded.
+    new assessments show up within ROLLUP_INTERVAL_MS (the rollups are
+    written in batches, off the request path).
+    """
+    if not authorized("ANALYTICS_TOKEN"):
+        return jsonify({"success": False, "error": "unauthorized"}), 401
+    try:
+        weeks = int(request.args.get("weeks", 12))
+    except ValueError:
+        return jsonify({"success": False, "error": "weeks must be an integer"}), 400
+    since = rollups.week_start(datetime.utcnow() - timedelta(weeks=weeks - 1)) if weeks > 0 else None
+    with db.engine.connect() as conn:
+        body = rollups.summary(conn, since, request.args.get("team_size"), request.args.get("archetype"))
+    return jsonify({"success": True, "since": since.isoformat() if since else None, **body})
+
+
+def encode_cursor(created_at, assessment_id):
+    """opaque page cursor: the (created_at, id) of the last row served"""
+    raw = json.dumps([created_at.isoformat(), assessment_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        created_at, assessment_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return datetime.fromisoformat(created_at), str(assessment_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("invalid cursor") from e
+
+
+def parse_flag(value):
+    if value.lower() in ("1", "true", "yes"):
+        return True
+    if value.lower() in ("0", "false", "no"):
+        return False
+    raise ValueError(f"expected true or false, got {value!r}")
+
+
+@api.get("/api/assessments")
+def list_assessments():
+    """
+    stored assessments, newest first, filtered by any of ?email=, ?payment_status=
+    and ?report_sent=true|false. ?limit= rows per page (default 50, max
+    ASSESSMENTS_PAGE_MAX); pass a page's next_cursor as ?cursor= for the next one.
+    keyset pagination on (created_at, id): a page is one range scan of a
+    (filter, created_at, id) index, so page N costs what page 1 does. rows without
+    a created_at aren't listed. needs SUPPORT_TOKEN set and "Authorization: Bearer <token>".
+    """
+    if not os.getenv("SUPPORT_TOKEN"):
+        return jsonify({"success": False, "error": "assessment listing disabled (set SUPPORT_TOKEN)"}), 404
+    if not authorized("SUPPORT_TOKEN"):
+        return jsonify({"success": False, "error": "unauthorized"}), 401
+    t = Assessment.__table__
+    stmt = select(*assessment_export.export_columns(t)).where(t.c.created_at.is_not(None))
+    try:
+        limit = int(request.args.get("limit", 50))
+        if not 1 <= limit <= current_app.config["ASSESSMENTS_PAGE_MAX"]:
+            raise ValueError(f"limit must be between 1 and {current_app.config['ASSESSMENTS_PAGE_MAX']}")
+        if request.args.get("email"):
+            stmt = stmt.where(t.c.email == request.args["email"])
+        if request.args.get("payment_status"):
+            stmt = stmt.where(t.c.payment_status == request.args["payment_status"])
+        if request.args.get("report_sent"):
+            stmt = stmt.where(t.c.report_sent == parse_flag(request.args["report_sent"]))
+        if request.args.get("cursor"):
+            stmt = stmt.where(tuple_(t.c.created_at, t.c.id) < tuple_(*decode_cursor(request.args["cursor"])))
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+    with phase("load"):
+        # one extra row says whether there is a next page
+        rows = db.session.execute(stmt.order_by(t.c.created_at.desc(), t.c.id.desc()).limit(limit + 1)).all()
+    page = rows[:limit]
+    records = [assessment_export.export_record(r) for r in page]
+    for rec in records:
+        rec["created_at"] = rec["created_at"].isoformat()
+    next_cursor = encode_cursor(page[-1].created_at, page[-1].id) if len(rows) > limit else None
+    return jsonify({"success": True, "assessments": records, "next_cursor": next_cursor})
+
+
+@api.get("/api/assessments/export")
+def export_assessments():
+    """
+    stream the assessments table as gzip-compressed NDJSON (default) or CSV, e.g.
+    ?format=csv&since=2024-01-01&until=2024-04-01&payment_status=paid,pending
+    (since inclusive, until exclusive; ?gzip=0 for plain text). needs EXPORT_TOKEN
+    set and "Authorization: Bearer <token>"; parquet is `flask export` only.
+    """
+    if not os.getenv("EXPORT_TOKEN"):
+        return jsonify({"success": False, "error": "exports disabled (set EXPORT_TOKEN)"}), 404
+    if not authorized("EXPORT_TOKEN"):
+        return jsonify({"success": False, "error": "unauthorized"}), 401
+    fmt = request.args.get("format", "ndjson")
+    if fmt not in assessment_export.STREAM_FORMATS:
+        return jsonify({"success": False, "error": f"format must be one of {', '.join(assessment_export.STREAM_FORMATS)}"}), 400
+    t = Assessment.__table__
+    try:
+        where = assessment_export.export_where(
+            t, assessment_export.parse_time(request.args.get("since")), assessment_export.parse_time(request.args.get("until")),
+            [s for s in request.args.get("payment_status", "").split(",") if s])
+        chunk_size = int(request.args.get("chunk_size", 5000))
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+    compress = request.args.get("gzip", "1") != "0"
+
+    stats = assessment_export.ExportStats()
+
+    def generate():
+        row_chunks = stream_chunks(assessment_export.export_columns(t), max(1, min(chunk_size, 50_000)), where=where)
+        body = assessment_export.encoded(fmt, assessment_export.records(row_chunks, stats))
+        yield from assessment_export.counted(assessment_export.gzipped(body) if compress else body, stats)
+        current_app.logger.info("export %s: %s", fmt, stats.summary())
+
+    name = f"assessments-{datetime.utcnow():%Y%m%d}.{fmt}" + (".gz" if compress else "")
+    return Response(stream_with_context(generate()),
+                    mimetype="application/gzip" if compress else assessment_export.MEDIA_TYPES[fmt],
+                    headers={"Content-Disposition": f'attachment; filename="{name}"', "Cache-Control": "no-store"})
+
+
+def stream_chunks(columns, chunk_size, after=None, where=None):
+    """
+    yield lists of rows ordered by columns[0] (which must be unique), chunk_size at a time.
+    postgres reads through one server-side cursor; sqlite has none (and an open read
+    would block the writer) so it pages by key instead. either way memory stays flat.
+    """
+    key = columns[0]
+
+    def stmt_after(last):
+        stmt = select(*columns).order_by(key)
+        if where is not None:
+            stmt = stmt.where(where)
+        return stmt if last is None else stmt.where(key > last)
+
+    if db.engine.dialect.name == "sqlite":
+        last = after
+        while True:
+            with db.engine.connect() as conn:
+                rows = conn.execute(stmt_after(last).limit(chunk_size)).all()
+            if not rows:
+                return
+            yield rows
+            last = rows[-1][0]
+    else:
+        with db.engine.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=chunk_size).execute(stmt_after(after))
+            for rows in result.partitions():
+                yield rows
+
+
+def _write_checkpoint(path, state):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+
+def chunked_update(columns, convert, chunk_size, checkpoint, dry_run, where=None):
+    """
+    stream rows (see stream_chunks), turn each chunk into column updates with
+    convert(rows) -> [{"_id": ..., column: value}], and write them with one
+    executemany per chunk. progress goes to a checkpoint file so an interrupted
+    run resumes where it stopped; the file is removed once the run completes.
+    """
+    t = Assessment.__table__
+    state = {"last_id": None, "scanned": 0, "updated": 0}
+    if os.path.exists(checkpoint):
+        with open(checkpoint) as f:
+            state.update(json.load(f))
+        click.echo(f"resuming after {state['last_id']} ({state['scanned']} scanned, {state['updated']} updated)")
+
+    verb = "changed" if dry_run else "updated"
+    started, scanned = time.perf_counter(), 0
+    for rows in stream_chunks(columns, chunk_size, after=state["last_id"], where=where):
+        changes = convert(rows)
+        if changes and not dry_run:
+            stmt = t.update().where(t.c.id == bindparam("_id"))
+            with db.engine.begin() as conn:
+                conn.execute(stmt, changes)
+
+        scanned += len(rows)
+        state["last_id"] = rows[-1].id
+        state["scanned"] += len(rows)
+        state["updated"] += len(changes)
+        if not dry_run:
+            _write_checkpoint(checkpoint, state)
+        rate = scanned / max(time.perf_counter() - started, 1e-9)
+        click.echo(f"{state['scanned']} scanned, {state['updated']} {verb}, {rate:,.0f} rows/s")
+
+    if os.path.exists(checkpoint) and not dry_run:
+        os.remove(checkpoint)
+    click.echo(f"done: {state['scanned']} scanned, {state['updated']} {verb}")
+    return state
+
+
+@api.cli.command("rescore")
+@click.option("--chunk-size", default=1000, show_default=True, help="rows per fetch / bulk update")
+@click.option("--checkpoint", default="rescore.checkpoint.json", show_default=True, help="resume file, removed when the run completes")
+@click.option("--dry-run", is_flag=True, help="count changes without writing")
+def rescore(chunk_size, checkpoint, dry_run):
+    """rescore stored assessments from their responses + context"""
+    t = Assessment.__table__
+    scalars = ["archetype_primary", "overhead_index", "hours_lost", "annual_cost"]
+    columns = [t.c.id, *(t.c[f] for f in scalars), *(t.c[f] for f in STORAGE_COLUMNS)]
+    written = ["email", "created_at", "id"]
+
+    def convert(rows):
+        changes = []
+        for r in rows:
+            responses = responses_of(r)
+            if not responses:
+                continue
+            row = assessment_row(r.id, responses, score_assessment(responses), context_from_stored(context_data_of(r)))
+            current = {**{f: getattr(r, f) for f in scalars}, "axis_scores": axis_scores_of(r), "archetype_mix": archetype_mix_of(r)}
+            if any(row[f] != current[f] for f in current):
+                changes.append({"_id": r.id, **{k: v for k, v in storage_row(row).items() if k not in written}})
+        return changes
+
+    state = chunked_update(columns, convert, chunk_size, checkpoint, dry_run)
+    if state["updated"] and not dry_run:
+        click.echo(f"rollups rebuilt from {rebuild_rollups(chunk_size)} assessments")
+
+
+@api.cli.command("invalidate-result-cache")
+def invalidate_result_cache():
+    """drop cached /api/assess results in every worker (needs RESULT_CACHE_REDIS_URL)"""
+    if result_cache is None:
+        click.echo("result cache is disabled")
+        return
+    result_cache.invalidate()
+    if not result_cache.stats()["shared"]:
+        click.echo("no shared cache configured: each worker's local cache clears on restart or model version change")
+    else:
+        click.echo("result cache invalidated")
+
+
+@api.cli.command("migrate-storage")
+@click.option("--chunk-size", default=2000, show_default=True, help="rows per fetch / bulk update")
+@click.option("--checkpoint", default="migrate-storage.checkpoint.json", show_default=True, help="resume file, removed when the run completes")
+@click.option("--dry-run", is_flag=True, help="count convertible rows without writing")
+def migrate_storage(chunk_size, checkpoint, dry_run):
+    """convert JSON-blob rows (schema_version 1) to the typed schema_version 2 columns"""
+    t = Assessment.__table__
+    for change in init_db(db.engine):
+        click.echo(change)
+
+    skipped = 0
+
+    def convert(rows):
+        nonlocal skipped
+        changes = []
+        for r in rows:
+            compact = storage_row(r._asdict())
+            if compact["schema_version"] is None:
+                skipped += 1  # can't be stored exactly in typed columns; stays JSON
+                continue
+            changes.append({"_id": r.id, **{k: compact[k] for k in STORAGE_COLUMNS}})
+        return changes
+
+    columns = [t.c.id, *(t.c[c] for c in STORAGE_COLUMNS)]
+    chunked_update(columns, convert, chunk_size, checkpoint, dry_run, where=t.c.schema_version.is_(None))
+    click.echo(f"{skipped} rows kept as JSON (values the typed columns can't reproduce exactly)")
+    if not dry_run:
+        vacuum = "VACUUM" if db.engine.dialect.name == "sqlite" else "VACUUM FULL assessments (or pg_repack)"
+        click.echo(f"run {vacuum} to give the freed space back")
+
+
+def rebuild_rollups(chunk_size=5000):
+    t = Assessment.__table__
+    columns = [t.c.id, t.c.created_at, t.c.schema_version, t.c.team_size, t.c.context_data,
+               t.c.archetype_primary, t.c.annual_cost, t.c.hours_lost, t.c.overhead_index]
+    chunks = ([r._asdict() for r in rows] for rows in stream_chunks(columns, chunk_size))
+    return rollups.rebuild(db.engine, chunks)
+
+
+@api.cli.command("rebuild-rollups")
+@click.option("--chunk-size", default=5000, show_default=True, help="rows per fetch")
+def rebuild_rollups_command(chunk_size):
+    """recompute the analytics rollups from all stored assessments (backfill / repair)"""
+    started = time.perf_counter()
+    n = rebuild_rollups(chunk_size)
+    click.echo(f"rollups rebuilt from {n} assessments in {time.perf_counter() - started:.1f}s")
+
+
+@api.cli.command("export")
+@click.option("--format", "fmt", type=click.Choice(assessment_export.FORMATS), default="ndjson", show_default=True)
+@click.option("--output", "-o", default="-", show_default=True, help="file to write; - for stdout (ndjson/csv only)")
+@click.option("--since", help="only rows created at or after this ISO date/time (UTC)")
+@click.option("--until", help="only rows created before this ISO date/time (UTC)")
+@click.option("--payment-status", multiple=True, help="only rows with this payment status (repeatable)")
+@click.option("--chunk-size", default=5000, show_default=True, help="rows per fetch")
+@click.option("--row-group-size", default=50_000, show_default=True, help="rows per parquet row group")
+@click.option("--no-gzip", is_flag=True, help="write ndjson/csv uncompressed")
+@click.option("--compress-level", default=6, show_default=True, type=click.IntRange(1, 9), help="gzip level")
+def export_command(fmt, output, since, until, payment_status, chunk_size, row_group_size, no_gzip, compress_level):
+    """stream assessments to gzip NDJSON/CSV or Parquet in constant memory; throughput goes to stderr"""
+    t = Assessment.__table__
+    try:
+        where = assessment_export.export_where(t, assessment_export.parse_time(since),
+                                               assessment_export.parse_time(until), payment_status)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--since/--until")
+    stats = assessment_export.ExportStats()
+    chunks = assessment_export.records(stream_chunks(assessment_export.export_columns(t), chunk_size, where=where), stats)
+
+    if fmt == "parquet":
+        if output == "-":
+            raise click.UsageError("parquet needs --output FILE")
+        try:
+            assessment_export.write_parquet(chunks, output, row_group_size=row_group_size, stats=stats)
+        except ImportError:
+            raise click.UsageError("parquet exports need pyarrow (pip install pyarrow)")
+    else:
+        body = assessment_export.encoded(fmt, chunks)
+        if not no_gzip:
+            body = assessment_export.gzipped(body, compress_level)
+        with click.open_file(output, "wb") as f:
+            for block in assessment_export.counted(body, stats):
+                f.write(block)
+    click.echo(f"exported {stats.summary()}", err=True)
+
 if __name__ == "__main__":
+    app = create_app()
+    with app.app_context():
+        init_db(db.engine)
     port = int(os.getenv("PORT", 5000))
     debug = os.getenv("FLASK_ENV", "development") == "development"
     app.run(debug=debug, host="0.0.0.0", port=port)
@@ -0,0 +1,168 @@
+"""
+ASGI entry point for the hot API routes (/api/health, /api/assess, /api/create-checkout).
+
+Same JSON contracts as the Flask app, but request handling never blocks a
+worker: the database goes through an async SQLAlchemy engine (asyncpg on
+Postgres, aiosqlite locally) and Stripe through httpx, so one process can
+hold hundreds of in-flight requests.
+
+    uvicorn asgi:app --port 5000
+    gunicorn asgi:app -k uvicorn.workers.UvicornWorker
+"""
+
+import json
+import logging
+import os
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+import httpx
+from dotenv import load_dotenv
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import Response
+from starlette.routing import Route
+
+# shared with the flask app; the schema comes from `flask --app app init-db`
+from models import Assessment
+from app import format_responses, assessment_row, assessment_payload, health_payload, rollup_queue
+from assessment_storage import storage_row
+from calm_profile_system import score_assessment
+from db_config import async_database_url, async_engine_options, configure_engine, database_url, engine_options
+
+log = logging.getLogger(__name__)
+
+STRIPE_CHECKOUT_URL = "https://api.stripe.com/v1/checkout/sessions"
+
+load_dotenv()
+db_url = async_database_url(make_url(database_url()))
+engine = create_async_engine(db_url, **async_engine_options(db_url))
+configure_engine(engine.sync_engine)
+Session = async_sessionmaker(engine, expire_on_commit=False)
+# the rollup consumer runs on its own thread, so it gets a (blocking) engine of its own
+rollup_engine = create_engine(database_url(), **engine_options(database_url()))
+configure_engine(rollup_engine)
+rollup_writer = rollup_queue(rollup_engine)
+http = None
+
+
+class JSONResponse(Response):
+    """byte-compatible with flask's jsonify (sorted keys, compact, trailing newline)"""
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return (json.dumps(content, sort_keys=True, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+async def _json_body(request):
+    # flask's get_json(force=True): parse regardless of content type
+    return json.loads(await request.body() or b"null")
+
+
+async def health(request):
+    return JSONResponse(health_payload(rollups=rollup_writer))
+
+
+async def assess(request):
+    try:
+        data = await _json_body(request)
+        formatted = format_responses(data.get("responses", {}))
+        result = score_assessment(formatted)
+
+        row = assessment_row(str(uuid4()), formatted, result, data.get("context", {}))
+        async with Session() as session:
+            session.add(Assessment(**storage_row(row)))
+            await session.commit()
+        rollup_writer.submit(row)
+
+        return JSONResponse(assessment_payload(row, result))
+    except Exception as e:
+        log.exception("assess failed")
+        return JSONResponse({"success": False, "error": str(e)}, status_code=500)
+
+
+async def _stripe_checkout(email, assessment_id, frontend):
+    resp = await http.post(
+        STRIPE_CHECKOUT_URL,
+        auth=(os.getenv("STRIPE_SECRET_KEY"), ""),
+        data={
+            "payment_method_types[0]": "card",
+            "line_items[0][price_data][currency]": "usd",
+            "line_items[0][price_data][product_data][name]": "Calm Profile Assessment Report",
+            "line_items[0][price_data][product_data][description]": "Comprehensive workstyle analysis and recommendations",
+            "line_items[0][price_data][unit_amount]": 49500,
+            "line_items[0][quantity]": 1,
+            "mode": "payment",
+            "success_url": f"{frontend}/thank-you/?session_id={{CHECKOUT_SESSION_ID}}",
+            "cancel_url": f"{frontend}/assessment",
+            **({"customer_email": email} if email else {}),
+            **({"metadata[assessment_id]": assessment_id} if assessment_id else {}),
+        },
+    )
+    resp.raise_for_status()
+    return resp.json()["url"]
+
+
+async def create_checkout(request):
+    """CHECKOUT_MODE=stripe creates a real session; otherwise the dev stub link, as in app.py"""
+    try:
+        data = await _json_body(request) or {}
+        email = data.get("email")
+        assessment_id = data.get("assessment_id")
+        frontend = os.getenv("FRONTEND_URL", "http://localhost:3000")
+
+        # attach email if present
+        if assessment_id and email:
+            async with Session() as session:
+                a = await session.get(Assessment, assessment_id)
+                if a:
+                    a.email = email
+                    await session.commit()
+
+        if os.getenv("CHECKOUT_MODE", "stub") == "stripe":
+            if not os.getenv("STRIPE_SECRET_KEY"):
+                return JSONResponse({"error": "Stripe not configured"}, status_code=500)
+            return JSONResponse({"success": True, "checkout_url": await _stripe_checkout(email, assessment_id, frontend)})
+
+        # dev stub
+        return JSONResponse({"success": True, "checkout_url": f"{frontend}/thank-you/?session_id=mock_{assessment_id or 'dev'}"})
+    except Exception as e:
+        log.exception("checkout failed")
+        return JSONResponse({"error": str(e)}, status_code=500)
+
+
+@asynccontextmanager
+async def lifespan(_app):
+    global http
+    http = httpx.AsyncClient(timeout=httpx.Timeout(10.0, connect=5.0))
+    try:
+        yield
+    finally:
+        await http.aclose()
+        rollup_writer.close()
+        await engine.dispose()
+        rollup_engine.dispose()
+
+
+app = Starlette(
+    routes=[
+        Route("/api/health", health, methods=["GET"]),
+        Route("/api/assess", assess, methods=["POST"]),
+        Route("/api/create-checkout", create_checkout, methods=["POST"]),
+    ],
+    middleware=[
+        # same origins as the flask CORS config
+        Middleware(
+            CORSMiddleware,
+            allow_origin_regex=r"http://(localhost|127\.0\.0\.1)(:\d+)?",
+            allow_methods=["GET", "POST", "OPTIONS"],
+            allow_headers=["Content-Type"],
+            allow_credentials=True,
+        ),
+    ],
+    lifespan=lifespan,
+)
@@ -0,0 +1,273 @@
+"""
+Streaming exports of the assessments table for analysis.
+
+Rows arrive in chunks (app.stream_chunks: a server-side cursor on postgres,
+keyset pages on sqlite) and leave as encoded bytes chunk by chunk, so memory
+is bounded by the chunk size whatever the table size. No ORM objects are
+built, and filters are applied in SQL (export_where).
+
+Every format has the same flat columns (EXPORT_FIELDS). Values come from the
+assessment_storage readers, so JSON-blob and typed rows export alike:
+
+    ndjson    one JSON object per line, gzip-compressed by default
+    csv       a header line, then one line per row, gzip-compressed by default
+    parquet   typed columns written a row group at a time (needs pyarrow)
+
+responses is the 20 answers as a string in question order: A, B, or - for an
+answer that isn't stored.
+"""
+
+import csv
+import io
+import json
+import os
+import time
+import zlib
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from sqlalchemy import and_
+
+from assessment_storage import (
+    AXES, CONTEXT_FIELDS, MIX_ARCHETYPES, RESPONSE_KEYS, SCHEMA_VERSION, STORAGE_COLUMNS,
+    archetype_mix_of, axis_scores_of, context_data_of, responses_of,
+)
+
+try:
+    import orjson
+except ImportError:  # optional: the standard library encoder is used instead
+    orjson = None
+
+FORMATS = ("ndjson", "csv", "parquet")
+# formats that can be written to a stream (parquet needs a seekable file for its footer)
+STREAM_FORMATS = ("ndjson", "csv")
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+ROW_COLUMNS = ("id", "created_at", "email", "payment_status", "report_sent",
+               "archetype_primary", "overhead_index", "hours_lost", "annual_cost")
+EXPORT_FIELDS = (
+    *ROW_COLUMNS,
+    *(f"axis_{a}" for a in AXES),
+    *(f"mix_{a}" for a in MIX_ARCHETYPES),
+    *CONTEXT_FIELDS,
+    "responses",
+)
+
+
+def export_columns(table) -> list:
+    """the columns to select; id first, as stream_chunks pages by it"""
+    return [*(table.c[c] for c in ROW_COLUMNS), *(table.c[c] for c in STORAGE_COLUMNS)]
+
+
+def parse_time(value: Optional[str]) -> Optional[datetime]:
+    """ISO date or date-time -> naive UTC datetime (created_at is stored that way); ValueError if malformed"""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def export_where(table, since: Optional[datetime] = None, until: Optional[datetime] = None,
+                 payment_status: Sequence[str] = ()):
+    """the SQL filter: since <= created_at < until, payment_status in (...); None when unfiltered"""
+    clauses = []
+    if since is not None:
+        clauses.append(table.c.created_at >= since)
+    if until is not None:
+        clauses.append(table.c.created_at < until)
+    if payment_status:
+        clauses.append(table.c.payment_status.in_(list(payment_status)))
+    return and_(*clauses) if clauses else None
+
+
+_ANSWER_LETTERS = str.maketrans("10", "AB")
+
+
+def _answers(responses) -> str:
+    if not isinstance(responses, dict):
+        return "-" * len(RESPONSE_KEYS)
+    return "".join("A" if (v := responses.get(k)) == 1 else "B" if v == 0 else "-" for k in RESPONSE_KEYS)
+
+
+def export_record(r) -> Dict[str, Any]:
+    """one stored row (Core row or dict with the export_columns) -> an EXPORT_FIELDS dict"""
+    m = r if isinstance(r, dict) else r._asdict()
+    rec = {c: m.get(c) for c in ROW_COLUMNS}
+    if m.get("schema_version") == SCHEMA_VERSION:
+        # typed row: the columns as the *_of readers would give them, without their dicts
+        for a in AXES:
+            rec[f"axis_{a}"] = m[f"axis_{a}"]
+        for a in MIX_ARCHETYPES:
+            rec[f"mix_{a}"] = m[f"mix_{a}"] / 10
+        for f in CONTEXT_FIELDS:
+            rec[f] = m[f]
+        # bit i of the mask is question i
+        rec["responses"] = format(m["responses_mask"], f"0{len(RESPONSE_KEYS)}b")[::-1].translate(_ANSWER_LETTERS)
+        return rec
+    axes = axis_scores_of(m) or {}
+    mix = archetype_mix_of(m) or {}
+    context = context_data_of(m) or {}
+    for a in AXES:
+        rec[f"axis_{a}"] = axes.get(a)
+    for a in MIX_ARCHETYPES:
+        rec[f"mix_{a}"] = mix.get(a)
+    for f in CONTEXT_FIELDS:
+        rec[f] = context.get(f)
+    rec["responses"] = _answers(responses_of(m))
+    return rec
+
+
+class ExportStats:
+    """rows and bytes produced so far, for throughput reporting"""
+
+    def __init__(self):
+        self.rows = 0
+        self.bytes = 0
+        self.started = time.perf_counter()
+
+    @property
+    def seconds(self) -> float:
+        return time.perf_counter() - self.started
+
+    def summary(self) -> str:
+        s = max(self.seconds, 1e-9)
+        return (f"{self.rows:,} rows, {self.bytes / 1e6:,.1f} MB in {s:.1f}s "
+                f"({self.rows / s:,.0f} rows/s, {self.bytes / 1e6 / s:,.1f} MB/s)")
+
+
+def records(row_chunks: Iterable[Sequence[Any]], stats: Optional[ExportStats] = None) -> Iterator[List[Dict[str, Any]]]:
+    """chunks of stored rows -> chunks of export records"""
+    for rows in row_chunks:
+        chunk = [export_record(r) for r in rows]
+        if stats is not None:
+            stats.rows += len(chunk)
+        yield chunk
+
+
+def _json_default(v):
+    if isinstance(v, datetime):
+        return v.isoformat()
+    raise TypeError(f"not JSON serializable: {type(v).__name__}")
+
+
+def ndjson_chunks(record_chunks: Iterable[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    for chunk in record_chunks:
+        if orjson is not None:
+            # naive datetimes come out as isoformat() does
+            yield b"".join(orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+                           for rec in chunk)
+        else:
+            yield "".join(json.dumps(rec, separators=(",", ":"), ensure_ascii=False, default=_json_default) + "\n"
+                          for rec in chunk).encode("utf-8")
+
+
+def csv_chunks(record_chunks: Iterable[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+    writer.writerow(EXPORT_FIELDS)
+    for chunk in record_chunks:
+        for rec in chunk:
+            created = rec["created_at"]
+            if isinstance(created, datetime):
+                rec = {**rec, "created_at": created.isoformat()}
+            writer.writerow([rec[f] for f in EXPORT_FIELDS])
+        yield buf.getvalue().encode("utf-8")
+        buf.seek(0)
+        buf.truncate()
+    if buf.tell():
+        yield buf.getvalue().encode("utf-8")
+
+
+def encoded(fmt: str, record_chunks: Iterable[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    if fmt == "ndjson":
+        return ndjson_chunks(record_chunks)
+    if fmt == "csv":
+        return csv_chunks(record_chunks)
+    raise ValueError(f"{fmt} can't be streamed; formats: {', '.join(STREAM_FORMATS)}")
+
+
+def gzipped(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """one gzip member over all the chunks, compressed as they come"""
+    z = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        out = z.compress(chunk)
+        if out:
+            yield out
+    yield z.flush()
+
+
+def counted(chunks: Iterable[bytes], stats: ExportStats) -> Iterator[bytes]:
+    for chunk in chunks:
+        stats.bytes += len(chunk)
+        yield chunk
+
+
+# --- parquet ---
+
+def parquet_schema():
+    import pyarrow as pa  # optional: only needed for parquet exports
+
+    types = {
+        "created_at": pa.timestamp("us"),
+        "report_sent": pa.bool_(),
+        "overhead_index": pa.float64(),
+        "hours_lost": pa.float64(),
+        "annual_cost": pa.float64(),
+        "hourly_rate": pa.float64(),
+        **{f"axis_{a}": pa.float64() for a in AXES},
+        **{f"mix_{a}": pa.float64() for a in MIX_ARCHETYPES},
+    }
+    return pa.schema([(f, types.get(f, pa.string())) for f in EXPORT_FIELDS])
+
+
+def _typed(value, kind: str):
+    """a value the parquet column type accepts; legacy values that don't fit become null"""
+    if value is None:
+        return None
+    if kind == "string":
+        return value if isinstance(value, str) else str(value)
+    if kind == "double":
+        if isinstance(value, bool):
+            return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+    if kind == "bool":
+        return bool(value)
+    return value if isinstance(value, datetime) else None
+
+
+def write_parquet(record_chunks: Iterable[List[Dict[str, Any]]], path: str, row_group_size: int = 50_000,
+                  compression: str = "zstd", stats: Optional[ExportStats] = None) -> None:
+    """write the records to path, one row group per row_group_size records (at most that many held at once)"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = parquet_schema()
+    kinds = {f.name: ("string" if pa.types.is_string(f.type) else "double" if pa.types.is_floating(f.type)
+                      else "bool" if pa.types.is_boolean(f.type) else "timestamp") for f in schema}
+    columns = {f: [] for f in EXPORT_FIELDS}
+
+    def flush(writer):
+        arrays = [pa.array(columns[f], type=schema.field(f).type) for f in EXPORT_FIELDS]
+        writer.write_table(pa.Table.from_arrays(arrays, schema=schema), row_group_size=row_group_size)
+        for values in columns.values():
+            values.clear()
+
+    with pq.ParquetWriter(path, schema, compression=compression) as writer:
+        pending = 0
+        for chunk in record_chunks:
+            for rec in chunk:
+                for f in EXPORT_FIELDS:
+                    columns[f].append(_typed(rec[f], kinds[f]))
+            pending += len(chunk)
+            if pending >= row_group_size:
+                flush(writer)
+                pending = 0
+        if pending:
+            flush(writer)
+    if stats is not None:
+        stats.bytes = os.path.getsize(path)
@@ -0,0 +1,200 @@
+"""
+Compact storage layout for assessment rows (schema_version 2).
+
+Version 1 rows keep responses, axis scores, archetype mix and context as
+JSON blobs. Version 2 stores the same values in typed columns:
+
+    responses_mask   20-bit integer, bit i = answer to question i
+    axis_<name>      0-100 integer per axis
+    mix_<name>       archetype mix in tenths of a percent (23.4% -> 234)
+    team_size, meeting_load, hourly_rate, platform
+
+The *_of() readers return the v1-shaped dicts for either version, with the
+same keys, order and value types, so everything built from them (API
+bodies, reports, exports) is unchanged. A row whose values can't be
+reproduced exactly from typed columns (odd legacy data, long free-text
+context) simply stays version 1.
+"""
+
+from typing import Any, Dict, Optional
+
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateColumn
+
+SCHEMA_VERSION = 2
+
+RESPONSE_KEYS = tuple(str(i) for i in range(20))
+AXES = ("structure", "collaboration", "scope", "tempo")
+MIX_ARCHETYPES = ("architect", "conductor", "curator", "craftsperson")
+CONTEXT_TEXT_FIELDS = ("team_size", "meeting_load", "platform")
+CONTEXT_FIELDS = ("team_size", "meeting_load", "hourly_rate", "platform")
+CONTEXT_TEXT_LENGTH = 32
+
+JSON_COLUMNS = ("raw_responses", "axis_scores", "archetype_mix", "context_data")
+COMPACT_COLUMNS = (
+    "schema_version",
+    "responses_mask",
+    *(f"axis_{a}" for a in AXES),
+    *(f"mix_{a}" for a in MIX_ARCHETYPES),
+    *CONTEXT_FIELDS,
+)
+# every column whose value depends on the layout
+STORAGE_COLUMNS = JSON_COLUMNS + COMPACT_COLUMNS
+
+
+def _is_int(v) -> bool:
+    return isinstance(v, int) and not isinstance(v, bool)
+
+
+def encode(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """compact columns for a row's JSON values, or None if decoding wouldn't give them back exactly"""
+    responses = row.get("raw_responses")
+    axes = row.get("axis_scores")
+    mix = row.get("archetype_mix")
+    context = row.get("context_data")
+    if not (isinstance(responses, dict) and isinstance(axes, dict) and isinstance(mix, dict) and isinstance(context, dict)):
+        return None
+    if tuple(responses) != RESPONSE_KEYS or tuple(axes) != AXES or tuple(mix) != MIX_ARCHETYPES or tuple(context) != CONTEXT_FIELDS:
+        return None
+
+    mask = 0
+    for i, key in enumerate(RESPONSE_KEYS):
+        v = responses[key]
+        if not _is_int(v) or v not in (0, 1):
+            return None
+        mask |= v << i
+    if not all(_is_int(v) and 0 <= v <= 100 for v in axes.values()):
+        return None
+    tenths = {}
+    for name, v in mix.items():
+        if not isinstance(v, float) or not 0.0 <= v <= 100.0 or round(v * 10) / 10 != v:
+            return None
+        tenths[name] = round(v * 10)
+    for field in CONTEXT_TEXT_FIELDS:
+        v = context[field]
+        if not isinstance(v, str) or len(v) > CONTEXT_TEXT_LENGTH:
+            return None
+    if not isinstance(context["hourly_rate"], float):
+        return None
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "responses_mask": mask,
+        **{f"axis_{a}": axes[a] for a in AXES},
+        **{f"mix_{a}": tenths[a] for a in MIX_ARCHETYPES},
+        **{f: context[f] for f in CONTEXT_FIELDS},
+    }
+
+
+def storage_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    assessment_row() output -> column values to insert/update. Always carries
+    every STORAGE_COLUMNS key (unused ones None), so rows batch together.
+    """
+    compact = encode(row)
+    out = {k: v for k, v in row.items() if k not in JSON_COLUMNS}
+    if compact is None:
+        out.update(dict.fromkeys(COMPACT_COLUMNS))
+        out.update({k: row.get(k) for k in JSON_COLUMNS})
+    else:
+        out.update(compact)
+        out.update(dict.fromkeys(JSON_COLUMNS))
+    return out
+
+
+# --- readers: ORM objects, Core rows or dicts with the needed columns ---
+
+def _get(r, name):
+    return r.get(name) if isinstance(r, dict) else getattr(r, name, None)
+
+
+def is_compact(r) -> bool:
+    return _get(r, "schema_version") == SCHEMA_VERSION
+
+
+def responses_of(r) -> Optional[Dict[str, int]]:
+    if not is_compact(r):
+        return _get(r, "raw_responses")
+    mask = _get(r, "responses_mask")
+    return {key: (mask >> i) & 1 for i, key in enumerate(RESPONSE_KEYS)}
+
+
+def axis_scores_of(r) -> Optional[Dict[str, int]]:
+    if not is_compact(r):
+        return _get(r, "axis_scores")
+    return {a: _get(r, f"axis_{a}") for a in AXES}
+
+
+def archetype_mix_of(r) -> Optional[Dict[str, float]]:
+    if not is_compact(r):
+        return _get(r, "archetype_mix")
+    return {a: _get(r, f"mix_{a}") / 10 for a in MIX_ARCHETYPES}
+
+
+def context_data_of(r) -> Optional[Dict[str, Any]]:
+    if not is_compact(r):
+        return _get(r, "context_data")
+    return {f: _get(r, f) for f in CONTEXT_FIELDS}
+
+
+def team_size_of(r):
+    """cheap path for grouping: no dict built for compact rows"""
+    if is_compact(r):
+        return _get(r, "team_size")
+    return (_get(r, "context_data") or {}).get("team_size")
+
+
+# --- schema upgrade ---
+
+def add_missing_columns(conn, table) -> list:
+    """ALTER TABLE ... ADD COLUMN for model columns an existing table lacks (all nullable, so cheap)"""
+    existing = {c["name"] for c in inspect(conn).get_columns(table.name)}
+    added = []
+    for column in table.columns:
+        if column.name in existing:
+            continue
+        ddl = CreateColumn(column).compile(dialect=conn.dialect)
+        conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {ddl}"))
+        added.append(column.name)
+    return added
+
+
+def create_missing_indexes(engine, table) -> list:
+    """
+    create the table's indexes the database lacks; returns their names. postgres
+    builds them CONCURRENTLY (outside a transaction) so writes to a large table
+    carry on meanwhile; a build that fails there leaves an INVALID index to drop by hand.
+    """
+    with engine.connect() as conn:
+        existing = {ix["name"] for ix in inspect(conn).get_indexes(table.name)}
+    missing = sorted((ix for ix in table.indexes if ix.name not in existing), key=lambda ix: ix.name)
+    if not missing:
+        return []
+    if engine.dialect.name == "postgresql":
+        quote = engine.dialect.identifier_preparer.quote
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            for ix in missing:
+                columns = ", ".join(quote(c.name) for c in ix.columns)
+                unique = "UNIQUE " if ix.unique else ""
+                conn.execute(text(f"CREATE {unique}INDEX CONCURRENTLY IF NOT EXISTS {quote(ix.name)} "
+                                  f"ON {quote(table.name)} ({columns})"))
+    else:
+        with engine.begin() as conn:
+            for ix in missing:
+                ix.create(conn, checkfirst=True)
+    return [ix.name for ix in missing]
+
+
+def drop_indexes(engine, table, names) -> list:
+    """drop the named indexes where they exist (superseded ones); returns those dropped"""
+    with engine.connect() as conn:
+        existing = {ix["name"] for ix in inspect(conn).get_indexes(table.name)}
+    dropped = [n for n in names if n in existing]
+    if not dropped:
+        return []
+    quote = engine.dialect.identifier_preparer.quote
+    concurrently = "CONCURRENTLY " if engine.dialect.name == "postgresql" else ""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for name in dropped:
+            conn.execute(text(f"DROP INDEX {concurrently}IF EXISTS {quote(name)}"))
+    return dropped
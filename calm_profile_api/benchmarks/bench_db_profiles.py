@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+inserts/sec per database engine profile.
+
+each of --workers processes commits one assessment row per transaction (the
+/api/assess write pattern) for --seconds; lock errors are counted, not fatal.
+
+usage:
+    python benchmarks/bench_db_profiles.py                          # sqlite, default vs tuned
+    python benchmarks/bench_db_profiles.py --url postgresql+psycopg2://.../bench --workers 4
+"""
+
+import argparse
+import multiprocessing as mp
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from uuid import uuid4
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import MetaData, create_engine  # noqa: E402
+
+from assessment_storage import storage_row  # noqa: E402
+from db_config import configure_engine, engine_options  # noqa: E402
+
+
+def _table():
+    from models import Assessment
+    return Assessment.__table__.to_metadata(MetaData())
+
+
+def _engine(url, profile):
+    engine = create_engine(url, **engine_options(url, profile))
+    configure_engine(engine, profile)
+    return engine
+
+
+def _row():
+    return storage_row({
+        "id": str(uuid4()),
+        "archetype_primary": "conductor",
+        "archetype_mix": {"architect": 24.5, "conductor": 30.9, "curator": 20.2, "craftsperson": 24.5},
+        "axis_scores": {"structure": 100, "collaboration": 100, "scope": 100, "tempo": 100},
+        "overhead_index": 0.68,
+        "hours_lost": 3.4,
+        "annual_cost": 70720.0,
+        "raw_responses": {str(i): 1 for i in range(20)},
+        "context_data": {"team_size": "2-5", "meeting_load": "moderate", "hourly_rate": 85.0, "platform": "web"},
+        "created_at": datetime.utcnow(),
+    })
+
+
+def _writer(url, profile, seconds, out):
+    table = _table()
+    engine = _engine(url, profile)
+    ok = errors = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        try:
+            with engine.begin() as conn:
+                conn.execute(table.insert(), [_row()])
+            ok += 1
+        except Exception:
+            errors += 1
+    engine.dispose()
+    out.put((ok, errors))
+
+
+def run(url, profile, workers, seconds):
+    table = _table()
+    engine = _engine(url, profile)
+    table.drop(engine, checkfirst=True)
+    table.create(engine)
+    engine.dispose()
+
+    out = mp.Queue()
+    procs = [mp.Process(target=_writer, args=(url, profile, seconds, out)) for _ in range(workers)]
+    started = time.perf_counter()
+    for p in procs:
+        p.start()
+    results = [out.get() for _ in procs]
+    for p in procs:
+        p.join()
+    elapsed = time.perf_counter() - started
+    ok = sum(r[0] for r in results)
+    errors = sum(r[1] for r in results)
+    return ok / elapsed, ok, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="database url (default: temporary sqlite file per profile)")
+    parser.add_argument("--profiles", default="default,tuned")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    os.environ["WEB_CONCURRENCY"] = str(args.workers)
+    print(f"{'profile':<10} {'inserts/s':>10} {'rows':>8} {'errors':>7}")
+    for profile in args.profiles.split(","):
+        with tempfile.TemporaryDirectory() as tmp:
+            url = args.url or f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+            rate, ok, errors = run(url, profile, args.workers, args.seconds)
+        print(f"{profile:<10} {rate:>10,.0f} {ok:>8} {errors:>7}")
+
+
+if __name__ == "__main__":
+    main()
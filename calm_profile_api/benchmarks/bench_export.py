@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+`flask export` memory and throughput as the table grows.
+
+for each --rows size, fills a temporary sqlite database with synthetic
+assessments (every tenth row in the JSON-blob layout), then runs in a fresh
+child process each:
+
+    export-<format>     the streaming export (stream_chunks -> records -> gzip)
+    query.all()         the naive dump it replaces: every ORM object loaded,
+                        then written as gzip NDJSON
+
+and reports the child's peak resident memory (linux /proc) and rows/s. the
+export's peak should not move with the row count; query.all()'s grows with it.
+
+usage:
+    python benchmarks/bench_export.py --rows 20000,100000
+    python benchmarks/bench_export.py --rows 50000 --formats ndjson,csv,parquet
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, API_DIR)
+
+CHILD = r"""
+import gzip, json, sys, time
+from app import create_app, stream_chunks
+import assessment_export
+from models import Assessment
+
+mode, out = sys.argv[1], sys.argv[2]
+
+
+def peak_mb():
+    # VmHWM, not ru_maxrss: that one keeps the (forking) parent's peak across exec
+    with open("/proc/self/status") as f:
+        return next(int(line.split()[1]) for line in f if line.startswith("VmHWM:")) / 1024
+
+
+app = create_app()
+with app.app_context():
+    base_mb = peak_mb()
+    stats = assessment_export.ExportStats()
+    if mode == "all":
+        items = Assessment.query.all()
+        with gzip.open(out, "wb", compresslevel=6) as f:
+            for a in items:
+                rec = assessment_export.export_record({c.name: getattr(a, c.name) for c in Assessment.__table__.columns})
+                f.write(json.dumps(rec, default=str).encode() + b"\n")
+        stats.rows = len(items)
+    else:
+        chunks = assessment_export.records(
+            stream_chunks(assessment_export.export_columns(Assessment.__table__), 5000), stats)
+        if mode == "parquet":
+            assessment_export.write_parquet(chunks, out, stats=stats)
+        else:
+            with open(out, "wb") as f:
+                for block in assessment_export.gzipped(assessment_export.encoded(mode, chunks)):
+                    f.write(block)
+    seconds = stats.seconds
+print(json.dumps({"rows": stats.rows, "seconds": seconds, "base_mb": base_mb,
+                  "peak_mb": peak_mb()}))
+"""
+
+
+def fill(path, n):
+    from sqlalchemy import create_engine
+
+    from bench_storage import as_version_1, synthetic_rows
+    from assessment_storage import storage_row
+    from models import Assessment, init_db
+
+    engine = create_engine(f"sqlite:///{path}")
+    init_db(engine)
+    t = Assessment.__table__
+    batch = []
+    with engine.begin() as conn:
+        for i, row in enumerate(synthetic_rows(n)):
+            batch.append(as_version_1(row) if i % 10 == 0 else storage_row(row))
+            if len(batch) == 5000:
+                conn.execute(t.insert(), batch)
+                batch = []
+        if batch:
+            conn.execute(t.insert(), batch)
+    engine.dispose()
+
+
+def run(mode, db_path, out):
+    # no sqlite mmap: mapped database pages would count as resident memory and grow with the file
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{db_path}", "SQLITE_MMAP_BYTES": "0",
+           "REQUEST_METRICS": "0", "FLASK_ENV": "production"}
+    proc = subprocess.run([sys.executable, "-c", CHILD, mode, out], cwd=API_DIR, env=env, capture_output=True, text=True)
+    if proc.returncode:
+        return {"error": proc.stderr.strip().splitlines()[-1]}
+    return {**json.loads(proc.stdout.strip().splitlines()[-1]), "bytes": os.path.getsize(out)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", default="20000,100000", help="comma-separated table sizes")
+    parser.add_argument("--formats", default="ndjson,csv", help="comma-separated export formats")
+    parser.add_argument("--out", help="write results as json")
+    args = parser.parse_args()
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    modes = [m for m in args.formats.split(",") if m] + ["all"]
+    results = {}
+    print(f"{'rows':>9} {'mode':<14} {'rows/s':>10} {'MB out':>8} {'peak MB':>8} {'over base':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in (int(x) for x in args.rows.split(",")):
+            db_path = os.path.join(tmp, f"{n}.db")
+            fill(db_path, n)
+            for mode in modes:
+                r = results[f"{n}:{mode}"] = run(mode, db_path, os.path.join(tmp, f"out.{mode}"))
+                label = "query.all()" if mode == "all" else f"export-{mode}"
+                if "error" in r:
+                    print(f"{n:>9,} {label:<14} {r['error']}")
+                    continue
+                print(f"{n:>9,} {label:<14} {r['rows'] / r['seconds']:>10,.0f} {r['bytes'] / 1e6:>8.1f} "
+                      f"{r['peak_mb']:>8.1f} {r['peak_mb'] - r['base_mb']:>10.1f}")
+            os.remove(db_path)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
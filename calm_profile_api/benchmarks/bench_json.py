@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+JSON encode/decode for /api/assess: Flask's default provider vs ours.
+
+for each provider (flask = DefaultJSONProvider, which JSON_PROVIDER=stdlib
+uses, and orjson = OrjsonProvider) it times, per call:
+
+    decode          parsing a request body (what request.get_json does)
+    encode          app.json.response(payload) for an /api/assess payload
+
+and checks the orjson body parses back to the same object as Flask's. --e2e
+also times POST /api/assess through the test client with the result cache
+off, so the JSON share of a whole request is visible.
+
+usage:
+    python benchmarks/bench_json.py
+    python benchmarks/bench_json.py --e2e 3000 --out json.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, API_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from workload import Workload  # noqa: E402
+
+
+def best_ns(fn, inputs, repeat, min_time):
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            for x in inputs:
+                fn(x)
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+        loops *= 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(loops):
+            for x in inputs:
+                fn(x)
+        best = min(best, time.perf_counter() - started)
+    return best / (loops * len(inputs)) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=500, help="distinct request bodies / payloads")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per timing run")
+    parser.add_argument("--e2e", type=int, default=0, help="also time this many POST /api/assess per provider")
+    parser.add_argument("--out", help="write results as json")
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp.name, 'bench.db')}"
+    os.environ["RESULT_CACHE_SIZE"] = "0"
+    os.environ.setdefault("REQUEST_METRICS", "0")
+    import app as app_module
+    from flask.json.provider import DefaultJSONProvider
+    from json_provider import PROVIDERS, orjson
+    from calm_profile_system import score_assessment
+    from models import db, init_db
+    app = app_module.create_app()
+    with app.app_context():
+        init_db(db.engine)
+
+    wl = Workload(seed=7)
+    bodies = [wl.assess_body() for _ in range(args.samples)]
+    raw = [json.dumps(b).encode("utf-8") for b in bodies]
+    rows, results = [], []
+    for b in bodies:
+        formatted = app_module.format_responses(b["responses"])
+        result = score_assessment(formatted)
+        rows.append(app_module.assessment_row("00000000-0000-4000-8000-000000000000", formatted, result, b["context"]))
+        results.append(result)
+
+    providers = {"flask": DefaultJSONProvider}
+    if orjson is not None:
+        providers["orjson"] = PROVIDERS["orjson"]
+    out = {}
+    reference = None
+    print(f"{'provider':<10} {'decode ns':>10} {'encode ns':>10}  {'e2e req/s':>10}")
+    for name, cls in providers.items():
+        app.json = cls(app)
+        with app.app_context():
+            plain = [app_module.assessment_payload(r, res) for r, res in zip(rows, results)]
+            decode = best_ns(app.json.loads, raw, args.repeat, args.min_time)
+            encode = best_ns(lambda p: app.json.response(p).get_data(), plain, args.repeat, args.min_time)
+            res = {"decode_ns": round(decode, 1), "encode_ns": round(encode, 1)}
+            bodies_out = [app.json.response(p).get_data() for p in plain]
+
+        # same JSON as flask's encoder
+        if reference is None:
+            reference = bodies_out
+        else:
+            assert [json.loads(b) for b in bodies_out] == [json.loads(b) for b in reference], f"{name} differs"
+
+        if args.e2e:
+            client = app.test_client()
+            for b in bodies[:50]:
+                client.post("/api/assess", json=b)
+            started = time.perf_counter()
+            for i in range(args.e2e):
+                client.post("/api/assess", data=raw[i % len(raw)], content_type="application/json")
+            res["e2e_rps"] = round(args.e2e / (time.perf_counter() - started), 1)
+        out[name] = res
+        print(f"{name:<10} {res['decode_ns']:>10,.0f} {res['encode_ns']:>10,.0f}  {res.get('e2e_rps', float('nan')):>10,.1f}")
+
+    base = out["flask"]
+    for name, res in out.items():
+        if name != "flask":
+            print(f"{name}: decode {base['decode_ns'] / res['decode_ns']:.2f}x, encode {base['encode_ns'] / res['encode_ns']:.2f}x vs flask")
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(out, f, indent=2)
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+/api/assessments page time by depth: keyset cursors vs OFFSET.
+
+fills a temporary sqlite database with --rows synthetic assessments (emails
+drawn from --emails addresses, payment status and report_sent mixed), runs
+init-db (the composite indexes), then walks every page of each listing
+through the test client, following next_cursor. for the same page positions
+it times the endpoint's keyset query, the OFFSET query support staff ran by
+hand, and the whole request:
+
+    SELECT ... WHERE <filter> AND (created_at, id) < (:cursor) ORDER BY created_at DESC, id DESC LIMIT :limit
+    SELECT ... WHERE <filter> ORDER BY created_at DESC, id DESC LIMIT :limit OFFSET :n
+
+medians over --repeat runs, in ms, for page 1, the middle page and the last.
+
+usage:
+    python benchmarks/bench_listing.py --rows 200000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, API_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+LISTINGS = {
+    "all": {},
+    "payment_status=paid": {"payment_status": "paid"},
+    "report_sent=false": {"report_sent": "false"},
+    "one email": None,  # filled in with a busy address
+}
+
+
+def fill(engine, n, emails, seed=3):
+    from bench_storage import synthetic_rows
+    from assessment_storage import storage_row
+    from models import Assessment, init_db
+
+    rnd = random.Random(seed)
+    init_db(engine)
+    t = Assessment.__table__
+    batch = []
+    with engine.begin() as conn:
+        for row in synthetic_rows(n):
+            batch.append({**storage_row(row), "email": f"user{rnd.randrange(emails)}@example.com",
+                          "payment_status": rnd.choice(["pending", "pending", "paid"]), "report_sent": rnd.random() < 0.3})
+            if len(batch) == 5000:
+                conn.execute(t.insert(), batch)
+                batch = []
+        if batch:
+            conn.execute(t.insert(), batch)
+        conn.exec_driver_sql("ANALYZE")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--emails", type=int, default=20, help="distinct email addresses")
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    os.environ.update({"DATABASE_URL": f"sqlite:///{os.path.join(tmp.name, 'listing.db')}", "SUPPORT_TOKEN": "bench",
+                       "REQUEST_METRICS": "0", "FLASK_ENV": "production"})
+    from sqlalchemy import select, text, tuple_
+
+    import assessment_export
+    from app import create_app, decode_cursor
+    from models import Assessment, db
+
+    app = create_app()
+    client = app.test_client()
+    headers = {"Authorization": "Bearer bench"}
+    t = Assessment.__table__
+    with app.app_context():
+        fill(db.engine, args.rows, args.emails)
+        with db.engine.connect() as conn:
+            busy = conn.execute(text("SELECT email FROM assessments GROUP BY email ORDER BY count(*) DESC LIMIT 1")).scalar()
+    LISTINGS["one email"] = {"email": busy}
+
+    print(f"{args.rows:,} rows, {args.limit} per page")
+    print(f"{'listing':<22} {'pages':>6} {'page':>6} {'keyset ms':>10} {'offset ms':>10} {'endpoint ms':>12}")
+    for name, params in LISTINGS.items():
+        query = "&".join(f"{k}={v}" for k, v in params.items())
+        # the cursors of one walk, so every page can be requested again
+        cursors, cursor = [None], None
+        while True:
+            body = client.get(f"/api/assessments?limit={args.limit}&{query}" + (f"&cursor={cursor}" if cursor else ""),
+                              headers=headers).get_json()
+            cursor = body["next_cursor"]
+            if not cursor:
+                break
+            cursors.append(cursor)
+
+        stmt = select(*assessment_export.export_columns(t)).where(t.c.created_at.is_not(None))
+        for k, v in params.items():
+            stmt = stmt.where(t.c[k] == (v == "true" if k == "report_sent" else v))
+        stmt = stmt.order_by(t.c.created_at.desc(), t.c.id.desc()).limit(args.limit)
+
+        pages = len(cursors)
+        for label, i in (("1", 0), ("mid", pages // 2), ("last", pages - 1)):
+            keyset_stmt = stmt if cursors[i] is None else stmt.where(
+                tuple_(t.c.created_at, t.c.id) < tuple_(*decode_cursor(cursors[i])))
+            url = f"/api/assessments?limit={args.limit}&{query}" + (f"&cursor={cursors[i]}" if cursors[i] else "")
+            times = {"keyset": [], "offset": [], "endpoint": []}
+            with app.app_context():
+                for _ in range(args.repeat):
+                    for kind, run in (("keyset", lambda: db.session.execute(keyset_stmt).all()),
+                                      ("offset", lambda: db.session.execute(stmt.offset(i * args.limit)).all()),
+                                      ("endpoint", lambda: client.get(url, headers=headers))):
+                        started = time.perf_counter()
+                        run()
+                        times[kind].append((time.perf_counter() - started) * 1000)
+                db.session.remove()
+            ms = {k: statistics.median(v) for k, v in times.items()}
+            print(f"{name:<22} {pages:>6,} {label:>6} {ms['keyset']:>10.2f} {ms['offset']:>10.2f} {ms['endpoint']:>12.2f}")
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+report render time and pdf size per font source.
+
+    google  the previous path: remote @import from fonts.googleapis.com (needs network)
+    bundle  local subset fonts from fonts/build_fonts.py, no network
+    system  whatever fontconfig resolves for Inter / JetBrains Mono, no network
+
+usage:
+    python benchmarks/bench_report_fonts.py [--renders 20] [--sources google,bundle,system]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from report_renderer import SAMPLE_DATA, ReportRenderer  # noqa: E402
+
+# fixed date so repeated renders are comparable byte for byte
+CURRENT_DATE = "Jan 01, 2025 at 09:00 AM"
+
+
+def bench(source, renders):
+    started = time.perf_counter()
+    renderer = ReportRenderer(font_source=source)
+    first = renderer.render(SAMPLE_DATA, CURRENT_DATE)
+    cold_ms = (time.perf_counter() - started) * 1000
+
+    times, outputs = [], set()
+    for _ in range(renders):
+        t = time.perf_counter()
+        outputs.add(renderer.render(SAMPLE_DATA, CURRENT_DATE))
+        times.append((time.perf_counter() - t) * 1000)
+    return {
+        "cold_ms": cold_ms,
+        "warm_ms": statistics.mean(times),
+        "p95_ms": sorted(times)[int(0.95 * (len(times) - 1))],
+        "pdf_bytes": len(first),
+        "distinct_outputs": len(outputs),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--renders", type=int, default=20)
+    parser.add_argument("--sources", default="google,bundle,system")
+    args = parser.parse_args()
+
+    print(f"{'source':<8} {'cold ms':>9} {'warm ms':>9} {'p95 ms':>9} {'pdf bytes':>10} {'distinct':>9}")
+    for source in args.sources.split(","):
+        try:
+            r = bench(source, args.renders)
+        except Exception as e:
+            print(f"{source:<8} failed: {e}")
+            continue
+        print(f"{source:<8} {r['cold_ms']:>9.1f} {r['warm_ms']:>9.1f} {r['p95_ms']:>9.1f} {r['pdf_bytes']:>10,} {r['distinct_outputs']:>9}")
+
+
+if __name__ == "__main__":
+    main()
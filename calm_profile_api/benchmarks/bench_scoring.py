@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+scoring microbenchmarks and regression gate.
+
+for the current model and synthetically enlarged ones (more archetypes, more
+axes) it measures, per function:
+
+    ns/call         best of --repeat timing runs
+    norm            ns/call divided by a fixed pure-python calibration loop
+                    timed in the same run, so baselines carry across machines
+    blocks, bytes   memory still allocated per call once the result is kept
+                    (tracemalloc); 0 for results shared from the outcome table
+    peak            transient bytes allocated during one call
+
+plus score_batch throughput (rows/s) and the outcome table build time.
+primary_odds runs on questionnaires at every stage of completion.
+models past OUTCOME_TABLE_MAX_ENTRIES have no table, so score_assessment
+there is the direct path: one vectorized match against the centroid matrix.
+
+--save-baseline writes benchmarks/baselines/scoring.json; otherwise the run is
+compared with that file and exits 1 if any norm or allocation figure grew by
+more than --threshold (default 25%).
+
+usage:
+    python benchmarks/bench_scoring.py                      # compare with the stored baseline
+    python benchmarks/bench_scoring.py --save-baseline      # after an intended change
+    python benchmarks/bench_scoring.py --models current --threshold 0.5 --out scoring.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import calm_profile_system as cps  # noqa: E402
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "scoring.json")
+
+# name -> (archetypes, axes); None keeps the shipped model
+MODELS = {
+    "current": None,
+    "wide": (16, 4),   # 4x the archetypes, same 1296-entry outcome table
+    "deep": (8, 6),    # 2x archetypes, 30 questions, 46656-entry outcome table
+    "many": (64, 4),   # dozens of sub-archetypes, 1296-entry outcome table
+    "broad": (32, 10), # 50 questions, no outcome table (6^10 combinations)
+}
+QUESTIONS_PER_AXIS = 5
+BATCH_ROWS = 10_000
+
+
+# --- models ---
+
+def synthetic_model(n_archetypes, n_axes, seed=0):
+    rnd = random.Random(seed)
+    axis_names = list(cps.AXIS_QUESTIONS)[:n_axes] + [f"axis{k}" for k in range(len(cps.AXIS_QUESTIONS), n_axes)]
+    axis_questions = {name: list(range(a * QUESTIONS_PER_AXIS, (a + 1) * QUESTIONS_PER_AXIS)) for a, name in enumerate(axis_names)}
+    archetypes = {}
+    for k in range(n_archetypes):
+        base = list(cps.ARCHETYPES.values())[k] if k < len(cps.ARCHETYPES) else None
+        key = list(cps.ARCHETYPES)[k] if base else f"synthetic{k}"
+        archetypes[key] = {
+            **(base or {"name": key.title(), "tagline": f"synthetic archetype {k}",
+                        "strengths": [f"strength {i}" for i in range(4)],
+                        "quick_wins": [f"quick win {i}" for i in range(3)]}),
+            "axes": {a: (base["axes"][a] if base and a in base["axes"] else rnd.randrange(0, 101, 5)) for a in axis_names},
+        }
+    return archetypes, axis_questions
+
+
+@contextmanager
+def use_model(name):
+    saved = cps.ARCHETYPES, cps.AXIS_QUESTIONS
+    if MODELS[name] is not None:
+        cps.ARCHETYPES, cps.AXIS_QUESTIONS = synthetic_model(*MODELS[name])
+    try:
+        yield
+    finally:
+        cps.ARCHETYPES, cps.AXIS_QUESTIONS = saved
+        cps.rebuild_outcome_table()
+
+
+def sample_inputs(n=1000, seed=1):
+    rnd = random.Random(seed)
+    n_questions = max(i for idxs in cps.AXIS_QUESTIONS.values() for i in idxs) + 1
+    responses = [{str(i): rnd.randint(0, 1) for i in range(n_questions)} for _ in range(n)]
+    axis_scores = [cps.calculate_axis_scores(r) for r in responses]
+    matches = [cps.calculate_archetype_match(a) for a in axis_scores]
+    # questionnaires at every stage, from nothing answered to everything
+    partial = [{k: v for k, v in r.items() if rnd.random() < stage} for r, stage in
+               zip(responses, (i / (n - 1) for i in range(n)))]
+    return {"responses": responses, "axis_scores": axis_scores, "matches": matches, "partial": partial}
+
+
+# --- measurement ---
+
+def ns_per_call(fn, inputs, repeat, min_time):
+    n = len(inputs)
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            for x in inputs:
+                fn(x)
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+        loops *= 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(loops):
+            for x in inputs:
+                fn(x)
+        best = min(best, time.perf_counter() - started)
+    return best / (loops * n) * 1e9
+
+
+def allocations_per_call(fn, inputs):
+    """(blocks, bytes) still allocated per call with every result kept, and peak transient bytes"""
+    results = [None] * len(inputs)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for i, x in enumerate(inputs):
+            results[i] = fn(x)
+        after = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        fn(inputs[0])
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    stats = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "filename")
+    n = len(inputs)
+    blocks = sum(s.count_diff for s in stats) / n
+    size = sum(s.size_diff for s in stats) / n
+    del results
+    return round(max(blocks, 0.0), 2), round(max(size, 0.0), 1), max(peak - current, 0)
+
+
+def calibration_ns(repeat, min_time):
+    """a fixed dict/float workload shaped like scoring, as the unit for normalized timings"""
+    data = [{str(i): (i * 7919 + k) % 2 for i in range(20)} for k in range(100)]
+
+    def unit(d):
+        return {k: round(sum(v for v in d.values()) * 1.5, 1) for k in ("a", "b", "c", "d")}
+    return ns_per_call(unit, data, repeat, min_time)
+
+
+def run_model(name, repeat, min_time, calibration):
+    out = {}
+    with use_model(name):
+        started = time.perf_counter()
+        table = cps.rebuild_outcome_table()
+        out["outcome_table"] = {"entries": len(table.entries) if table else 0,
+                                "build_ms": round((time.perf_counter() - started) * 1000, 1)}
+
+        inputs = sample_inputs()
+        cases = {
+            "calculate_axis_scores": (cps.calculate_axis_scores, inputs["responses"]),
+            "calculate_archetype_match": (cps.calculate_archetype_match, inputs["axis_scores"]),
+            "determine_archetype_mix": (cps.determine_archetype_mix, inputs["matches"]),
+            "score_assessment_reference": (cps._score_assessment_reference, inputs["responses"]),
+            "score_assessment": (cps.score_assessment, inputs["responses"]),
+        }
+        if table is not None:
+            # exact odds need one weight per remaining count combination; without a table that can explode
+            cases["primary_odds"] = (cps.primary_odds, inputs["partial"])
+        for case, (fn, xs) in cases.items():
+            ns = ns_per_call(fn, xs, repeat, min_time)
+            blocks, size, peak = allocations_per_call(fn, xs)
+            out[case] = {"ns_per_call": round(ns, 1), "norm": round(ns / calibration, 4),
+                         "blocks": blocks, "bytes": size, "peak": peak}
+
+        import numpy as np
+        n_questions = max(i for idxs in cps.AXIS_QUESTIONS.values() for i in idxs) + 1
+        matrix = np.random.default_rng(2).integers(0, 2, size=(BATCH_ROWS, n_questions))
+        best = min(_timed(lambda: cps.score_batch(matrix)) for _ in range(repeat))
+        ns_row = best / BATCH_ROWS * 1e9
+        out["score_batch"] = {"rows_per_s": round(BATCH_ROWS / best), "ns_per_row": round(ns_row, 1),
+                              "norm": round(ns_row / calibration, 4)}
+    return out
+
+
+def _timed(fn):
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+# --- gate ---
+
+GATED = ("norm", "blocks", "bytes")
+
+
+def regressions(baseline, current, threshold):
+    found = []
+    for model, cases in current["models"].items():
+        for case, metrics in cases.items():
+            base = baseline.get("models", {}).get(model, {}).get(case)
+            if not base:
+                continue
+            for metric in GATED:
+                if metric not in metrics or metric not in base:
+                    continue
+                b, c = base[metric], metrics[metric]
+                # allocations: allow half a block / 64 bytes of noise on top of the ratio
+                slack = {"blocks": 0.5, "bytes": 64}.get(metric, 0)
+                if c > b * (1 + threshold) + slack:
+                    found.append((model, case, metric, b, c))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--models", default=",".join(MODELS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.1, help="seconds per timing run")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed growth vs baseline (0.25 = +25%%)")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--out", help="also write this run's results here")
+    args = parser.parse_args()
+
+    calibration = calibration_ns(args.repeat, args.min_time)
+    result = {"calibration_ns": round(calibration, 1), "models": {}}
+    print(f"calibration: {calibration:,.0f} ns")
+    print(f"{'model':<8} {'case':<28} {'ns/call':>10} {'norm':>8} {'blocks':>7} {'bytes':>8} {'peak':>7}")
+    for name in args.models.split(","):
+        res = result["models"][name] = run_model(name, args.repeat, args.min_time, calibration)
+        tbl = res["outcome_table"]
+        for case, m in res.items():
+            if case == "outcome_table":
+                continue
+            if case == "score_batch":
+                print(f"{name:<8} {case:<28} {m['ns_per_row']:>10,.1f} {m['norm']:>8.3f} {'':>7} {'':>8} {'':>7}  ({m['rows_per_s']:,} rows/s)")
+            else:
+                print(f"{name:<8} {case:<28} {m['ns_per_call']:>10,.1f} {m['norm']:>8.3f} {m['blocks']:>7} {m['bytes']:>8} {m['peak']:>7}")
+        if tbl["entries"]:
+            print(f"{name:<8} {'outcome table':<28} {tbl['entries']:>10,} entries, built in {tbl['build_ms']:,} ms")
+        else:
+            print(f"{name:<8} {'outcome table':<28} {'none':>10} (over {cps.OUTCOME_TABLE_MAX_ENTRIES:,} entries)")
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(result, f, indent=2)
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(result, f, indent=2)
+        print(f"baseline saved to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}; run with --save-baseline first")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    found = regressions(baseline, result, args.threshold)
+    for model, case, metric, b, c in found:
+        print(f"REGRESSION {model}/{case} {metric}: {b} -> {c} (+{(c - b) / b * 100 if b else float('inf'):.0f}%)")
+    print(f"{len(found)} regressions over {args.threshold:.0%}" if found else f"no regressions over {args.threshold:.0%}")
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
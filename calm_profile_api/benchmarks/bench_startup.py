@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+startup cost of the Flask app, measured in fresh processes.
+
+each of --runs child processes reports, in ms:
+
+    interpreter     python itself (a bare `python -c pass`, measured separately)
+    import          `import app`
+    create_app      building the app (for revisions without a factory: nothing,
+                    the import already built it, including schema DDL)
+    first_request   GET /api/health + POST /api/assess through the test client
+    init_db         the schema step on its own (now `flask init-db`, once per deploy)
+    maxrss_mb       peak resident memory of the child
+
+medians are printed. --rev REV runs the same children against that git
+revision's calm_profile_api (exported to a temp dir) for a before/after.
+--database-url points every run at a real database, where the DDL round
+trips of the old import-time create_all show up.
+
+--gunicorn N starts `gunicorn -c gunicorn.conf.py -w N` with and without
+preload and reports time until all N workers answer, plus the workers'
+private (unshared) memory from /proc (linux), i.e. what copy-on-write saves.
+
+usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --rev HEAD~1 --runs 15
+    python benchmarks/bench_startup.py --gunicorn 4
+"""
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = r"""
+import json, resource, sys, time
+started = time.perf_counter()
+import app as m
+imported = time.perf_counter()
+factory = hasattr(m, "create_app")
+flask_app = m.create_app() if factory else m.app
+created = time.perf_counter()
+client = flask_app.test_client()
+if sys.argv[1] == "init":
+    if not factory:
+        sys.exit(0)  # the import created the schema
+    from models import db, init_db
+    with flask_app.app_context():
+        init_db(db.engine)
+    sys.exit(0)
+client.get("/api/health")
+status = client.post("/api/assess", json={"responses": {str(i): "AB"[i % 2] for i in range(20)}, "context": {}}).status_code
+served = time.perf_counter()
+init_ms = None
+if factory:
+    from models import db, init_db
+    with flask_app.app_context():
+        t = time.perf_counter()
+        init_db(db.engine)
+        init_ms = (time.perf_counter() - t) * 1000
+print(json.dumps({
+    "import": (imported - started) * 1000,
+    "create_app": (created - imported) * 1000,
+    "first_request": (served - created) * 1000,
+    "init_db": init_ms,
+    "maxrss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "status": status,
+}))
+"""
+
+
+def child_env(database_url, tmp):
+    return {**os.environ, "DATABASE_URL": database_url or f"sqlite:///{os.path.join(tmp, 'startup.db')}",
+            "FLASK_ENV": "production", "METRICS_DIR": os.path.join(tmp, "metrics")}
+
+
+def measure(api_dir, runs, database_url):
+    with tempfile.TemporaryDirectory() as tmp:
+        env = child_env(database_url, tmp)
+        # the schema exists before the timed runs, as it does for a deployed worker
+        subprocess.run([sys.executable, "-c", CHILD, "init"], cwd=api_dir, env=env, check=True,
+                       stdout=subprocess.DEVNULL)
+        samples = []
+        for _ in range(runs):
+            out = subprocess.run([sys.executable, "-c", CHILD, "run"], cwd=api_dir, env=env, check=True,
+                                 capture_output=True, text=True).stdout
+            samples.append(json.loads(out.strip().splitlines()[-1]))
+    keys = ("import", "create_app", "first_request", "init_db", "maxrss_mb")
+    return {k: (round(statistics.median(s[k] for s in samples), 1) if samples[0][k] is not None else None)
+            for k in keys}
+
+
+def interpreter_ms(runs):
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        times.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(times), 1)
+
+
+def export_revision(rev, dest):
+    root = subprocess.check_output(["git", "rev-parse", "--show-toplevel"], cwd=API_DIR, text=True).strip()
+    prefix = os.path.relpath(API_DIR, root)
+    archive = subprocess.run(["git", "archive", rev, prefix], cwd=root, check=True, capture_output=True).stdout
+    subprocess.run(["tar", "-x", "-C", dest], input=archive, check=True)
+    return os.path.join(dest, prefix)
+
+
+# --- gunicorn ---
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _children(pid):
+    kids = []
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    if int(f.read().rsplit(")", 1)[1].split()[1]) == pid:
+                        kids.append(int(entry))
+            except (OSError, IndexError, ValueError):
+                pass
+    return kids
+
+
+def _private_mb(pid):
+    total = 0
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                total += int(line.split()[1])
+    return total / 1024
+
+
+def gunicorn_boot(workers, preload, database_url):
+    with tempfile.TemporaryDirectory() as tmp:
+        env = child_env(database_url, tmp)
+        subprocess.run([sys.executable, "-m", "flask", "--app", "app", "init-db"], cwd=API_DIR, env=env, check=True,
+                       stdout=subprocess.DEVNULL)
+        port = _free_port()
+        cmd = [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "-w", str(workers),
+               "--bind", f"127.0.0.1:{port}", *([] if preload else ["--no-preload"])]
+        started = time.perf_counter()
+        proc = subprocess.Popen(cmd, cwd=API_DIR, env=env, stderr=subprocess.DEVNULL)
+        try:
+            seen = set()
+            deadline = time.time() + 120
+            # every worker has booted once it answers; new connections spread over the workers
+            while len(_children(proc.pid)) < workers or len(seen) < workers:
+                if time.time() > deadline or proc.poll() is not None:
+                    raise SystemExit(f"gunicorn did not come up: {' '.join(cmd)}")
+                try:
+                    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+                    conn.request("GET", "/api/health")
+                    if conn.getresponse().status == 200:
+                        seen.update(_children(proc.pid))
+                except OSError:
+                    time.sleep(0.05)
+            ready_ms = (time.perf_counter() - started) * 1000
+            private = [_private_mb(pid) for pid in _children(proc.pid)]
+        finally:
+            proc.terminate()
+            proc.wait(timeout=30)
+    return {"ready_ms": round(ready_ms, 1), "worker_private_mb": round(statistics.mean(private), 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=9)
+    parser.add_argument("--rev", help="also measure this git revision, e.g. HEAD~1")
+    parser.add_argument("--database-url", help="default: a fresh temporary sqlite db per target")
+    parser.add_argument("--gunicorn", type=int, metavar="WORKERS", help="measure gunicorn worker boot, preload vs not")
+    parser.add_argument("--out", help="write results as json")
+    args = parser.parse_args()
+
+    results = {"interpreter_ms": interpreter_ms(args.runs), "targets": {}}
+    targets = {"working tree": API_DIR}
+    tmp = tempfile.TemporaryDirectory()
+    if args.rev:
+        targets[args.rev] = export_revision(args.rev, tmp.name)
+
+    print(f"interpreter: {results['interpreter_ms']} ms")
+    print(f"{'target':<16} {'import':>9} {'create_app':>11} {'1st request':>12} {'init_db':>9} {'rss MB':>8}")
+    for name, path in targets.items():
+        r = results["targets"][name] = measure(path, args.runs, args.database_url)
+        init = f"{r['init_db']:>9.1f}" if r["init_db"] is not None else f"{'(import)':>9}"
+        print(f"{name:<16} {r['import']:>9.1f} {r['create_app']:>11.1f} {r['first_request']:>12.1f} {init} {r['maxrss_mb']:>8.1f}")
+    tmp.cleanup()
+
+    if args.gunicorn:
+        for preload in (True, False):
+            g = results[f"gunicorn_{'preload' if preload else 'no_preload'}"] = gunicorn_boot(
+                args.gunicorn, preload, args.database_url)
+            print(f"gunicorn -w {args.gunicorn} {'--preload' if preload else '--no-preload':<13} "
+                  f"all workers up in {g['ready_ms']:,.0f} ms, {g['worker_private_mb']:.1f} MB private per worker")
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+table size and analytical query time: JSON-blob rows (schema_version 1) vs typed columns (2).
+
+fills one temporary sqlite database per layout with the same --rows synthetic
+assessments, vacuums it, then times dashboard-style queries.
+
+usage:
+    python benchmarks/bench_storage.py --rows 200000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import MetaData, create_engine, text  # noqa: E402
+
+from assessment_storage import COMPACT_COLUMNS, JSON_COLUMNS, storage_row  # noqa: E402
+
+QUERIES = {
+    "team size x archetype, last 4 weeks": {
+        1: "SELECT json_extract(context_data, '$.team_size') ts, archetype_primary, count(*) FROM assessments "
+           "WHERE created_at >= :since GROUP BY ts, archetype_primary",
+        2: "SELECT team_size, archetype_primary, count(*) FROM assessments "
+           "WHERE created_at >= :since GROUP BY team_size, archetype_primary",
+    },
+    "mean structure score per archetype": {
+        1: "SELECT archetype_primary, avg(json_extract(axis_scores, '$.structure')) FROM assessments GROUP BY archetype_primary",
+        2: "SELECT archetype_primary, avg(axis_structure) FROM assessments GROUP BY archetype_primary",
+    },
+    "cost of one team size band": {
+        1: "SELECT sum(annual_cost) FROM assessments WHERE json_extract(context_data, '$.team_size') = '16-50'",
+        2: "SELECT sum(annual_cost) FROM assessments WHERE team_size = '16-50'",
+    },
+}
+
+
+def synthetic_rows(n, seed=7):
+    from app import assessment_row, format_responses
+    from calm_profile_system import score_batch
+
+    rnd = random.Random(seed)
+    formatted = [format_responses({str(i): rnd.choice("AB") for i in range(20)}) for _ in range(n)]
+    scores = score_batch([[f[str(i)] for i in range(20)] for f in formatted])
+    start = datetime.utcnow() - timedelta(days=365)
+    for f, result in zip(formatted, scores.results()):
+        context = {
+            "teamSize": rnd.choice(["solo", "2-5", "6-15", "16-50", "50+"]),
+            "meetingLoad": rnd.choice(["light", "moderate", "heavy"]),
+            "hourlyRate": rnd.choice([50, 75, 100, 125, 150, 200]),
+            "platform": rnd.choice(["google", "microsoft", "slack", "mixed"]),
+        }
+        row = assessment_row(str(uuid4()), f, result, context)
+        row["created_at"] = start + timedelta(seconds=rnd.randrange(365 * 86400))
+        yield row
+
+
+def as_version_1(row):
+    compact = storage_row(row)
+    return {**compact, **dict.fromkeys(COMPACT_COLUMNS), **{k: row[k] for k in JSON_COLUMNS}}
+
+
+def build(path, version, rows):
+    from models import Assessment
+
+    table = Assessment.__table__.to_metadata(MetaData())
+    engine = create_engine(f"sqlite:///{path}")
+    table.create(engine)
+    convert = storage_row if version == 2 else as_version_1
+    with engine.begin() as conn:
+        for i in range(0, len(rows), 5000):
+            conn.execute(table.insert(), [convert(r) for r in rows[i:i + 5000]])
+    with engine.connect() as conn:
+        conn.exec_driver_sql("VACUUM")
+        conn.exec_driver_sql("ANALYZE")
+    return engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = list(synthetic_rows(args.rows))
+    since = datetime.utcnow() - timedelta(weeks=4)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for version in (1, 2):
+            path = os.path.join(tmp, f"v{version}.db")
+            engine = build(path, version, rows)
+            timings = {}
+            with engine.connect() as conn:
+                for name, sql in QUERIES.items():
+                    best = float("inf")
+                    for _ in range(args.repeat):
+                        started = time.perf_counter()
+                        conn.execute(text(sql[version]), {"since": since}).all()
+                        best = min(best, time.perf_counter() - started)
+                    timings[name] = best * 1000
+            engine.dispose()
+            results[version] = (os.path.getsize(path), timings)
+
+    (size1, t1), (size2, t2) = results[1], results[2]
+    print(f"{args.rows:,} rows")
+    print(f"{'':<38} {'json (v1)':>12} {'typed (v2)':>12} {'ratio':>7}")
+    print(f"{'database size (MB)':<38} {size1 / 2**20:>12.1f} {size2 / 2**20:>12.1f} {size1 / size2:>6.1f}x")
+    for name in QUERIES:
+        print(f"{name + ' (ms)':<38} {t1[name]:>12.1f} {t2[name]:>12.1f} {t1[name] / t2[name]:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+closed-loop load test for /api/assess and /api/create-checkout.
+
+--concurrency workers each send a request, wait for the answer, and send the
+next one, for --requests in total (repeatable: each worker has its own seeded
+workload) or for --duration seconds. checkouts reuse an assessment id the
+same worker created. the run writes throughput, p50/p95/p99 latency, status
+counts and error rates per endpoint to a json artifact.
+
+targets:
+    (default)          flask test client in this process, on a fresh temporary sqlite db
+    --url URL          a running server, e.g. http://127.0.0.1:8000
+    --serve "ARGS"     run init-db, start gunicorn on a free port with ARGS (and --app), then load it
+
+usage:
+    python benchmarks/loadtest.py --requests 5000 --concurrency 8
+    python benchmarks/loadtest.py --serve "-w 4 -k gthread --threads 4" --duration 30 --out gthread.json
+    python benchmarks/loadtest.py --serve "-c gunicorn.conf.py -w 4" --duration 30     # preloaded, as deployed
+    python benchmarks/loadtest.py --serve "-w 4 -k uvicorn.workers.UvicornWorker" --app asgi:app --mix assess=1
+    DB_PROFILE=default python benchmarks/loadtest.py --database-url postgresql+psycopg2://localhost/calm_load
+    python benchmarks/loadtest.py --compare baseline.json --out candidate.json
+"""
+
+import argparse
+import http.client
+import json
+import math
+import os
+import platform
+import shlex
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+from urllib.parse import urlsplit
+
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, API_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from workload import Workload  # noqa: E402
+
+ENDPOINTS = {"assess": "/api/assess", "checkout": "/api/create-checkout"}
+# settings that change what is being measured; recorded with every run
+RECORDED_ENV = ("DB_PROFILE", "WEB_CONCURRENCY", "ASSESS_WRITE_BEHIND", "RESULT_CACHE_SIZE", "REPORT_PRERENDER", "DB_POOL_SIZE")
+
+
+# --- clients: post(path, body) -> (status, parsed json or None) ---
+
+class TestClientTarget:
+    def __init__(self):
+        from app import create_app
+        from models import db, init_db
+        self.app = create_app()
+        with self.app.app_context():
+            init_db(db.engine)
+
+    def client(self):
+        c = self.app.test_client()
+
+        def post(path, body):
+            r = c.post(path, json=body)
+            return r.status_code, r.get_json(silent=True)
+        return post
+
+
+class HTTPTarget:
+    def __init__(self, url):
+        parts = urlsplit(url)
+        self.host, self.port = parts.hostname, parts.port or 80
+
+    def client(self):
+        state = {"conn": None}
+
+        def post(path, body):
+            if state["conn"] is None:
+                state["conn"] = http.client.HTTPConnection(self.host, self.port, timeout=30)
+            try:
+                state["conn"].request("POST", path, json.dumps(body), {"Content-Type": "application/json"})
+                r = state["conn"].getresponse()
+                data = r.read()
+            except (OSError, http.client.HTTPException):
+                state["conn"].close()
+                state["conn"] = None  # reconnect on the next request
+                raise
+            try:
+                return r.status, json.loads(data)
+            except ValueError:
+                return r.status, None
+        return post
+
+
+# --- run ---
+
+def worker(index, post, args, deadline, quota, samples, lock):
+    wl = Workload(seed=args.seed * 1000 + index, personas=args.personas)
+    mix_rnd = wl.rnd
+    last_id = None
+    local = defaultdict(list)
+    done = 0
+    while (quota is None or done < quota) and (deadline is None or time.perf_counter() < deadline):
+        name = "checkout" if last_id and mix_rnd.random() < args.mix["checkout"] else "assess"
+        body = wl.checkout_body(last_id) if name == "checkout" else wl.assess_body()
+        started = time.perf_counter()
+        try:
+            status, data = post(ENDPOINTS[name], body)
+        except Exception as e:
+            status, data = f"exception:{type(e).__name__}", None
+        elapsed = (time.perf_counter() - started) * 1000.0
+        local[name].append((elapsed, status))
+        if name == "assess" and status == 200 and data:
+            last_id = data.get("assessment_id")
+        done += 1
+    with lock:
+        for name, rows in local.items():
+            samples[name].extend(rows)
+
+
+def percentile(sorted_values, q):
+    """nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = min(max(1, math.ceil(q * len(sorted_values))), len(sorted_values))
+    return sorted_values[rank - 1]
+
+
+def summarize(rows, elapsed):
+    latencies = sorted(ms for ms, _ in rows)
+    statuses = Counter(str(status) for _, status in rows)
+    errors = sum(n for status, n in statuses.items() if not status.startswith("2"))
+    return {
+        "requests": len(rows),
+        "errors": errors,
+        "error_rate": round(errors / len(rows), 5) if rows else 0.0,
+        "throughput_rps": round(len(rows) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(sum(latencies) / len(latencies), 3) if latencies else None,
+            **{f"p{q}": round(percentile(latencies, q / 100), 3) if latencies else None for q in (50, 95, 99)},
+            "max": round(latencies[-1], 3) if latencies else None,
+        },
+        "status": dict(sorted(statuses.items())),
+    }
+
+
+def run(target, args):
+    # warm-up: imports, connections, caches, workers
+    post = target.client()
+    wl = Workload(seed=args.seed + 10**6, personas=args.personas)
+    for _ in range(args.warmup):
+        post(ENDPOINTS["assess"], wl.assess_body())
+
+    samples, lock = defaultdict(list), threading.Lock()
+    # a request count is split evenly over the workers; otherwise run for --duration
+    quota = math.ceil(args.requests / args.concurrency) if args.requests else None
+    threads = []
+    started = time.perf_counter()
+    deadline = None if quota else started + args.duration
+    for i in range(args.concurrency):
+        t = threading.Thread(target=worker, args=(i, target.client(), args, deadline, quota, samples, lock))
+        t.start()
+        threads.append(t)
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    endpoints = {name: summarize(rows, elapsed) for name, rows in sorted(samples.items())}
+    return elapsed, endpoints, summarize([r for rows in samples.values() for r in rows], elapsed)
+
+
+# --- gunicorn for --serve ---
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(args, env):
+    port = free_port()
+    subprocess.run([sys.executable, "-m", "flask", "--app", "app", "init-db"], cwd=API_DIR, env=env, check=True)
+    cmd = [sys.executable, "-m", "gunicorn", args.app, "--bind", f"127.0.0.1:{port}", *shlex.split(args.serve)]
+    proc = subprocess.Popen(cmd, cwd=API_DIR, env=env)
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise SystemExit(f"server exited with code {proc.returncode}: {' '.join(cmd)}")
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/api/health")
+            if conn.getresponse().status == 200:
+                return proc, f"http://127.0.0.1:{port}"
+        except OSError:
+            time.sleep(0.2)
+    proc.terminate()
+    raise SystemExit("server did not become healthy within 60s")
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=API_DIR, text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline, current):
+    print(f"\n{'vs ' + (baseline['meta'].get('label') or 'baseline'):<24} {'rps':>10} {'p50':>9} {'p95':>9} {'p99':>9} {'errors':>8}")
+    for name, cur in current["endpoints"].items():
+        base = baseline["endpoints"].get(name)
+        if not base:
+            continue
+
+        def delta(a, b):
+            return f"{(b - a) / a * 100:+.1f}%" if a and b is not None else "n/a"
+        lat_b, lat_c = base["latency_ms"], cur["latency_ms"]
+        print(f"{name:<24} {delta(base['throughput_rps'], cur['throughput_rps']):>10} "
+              f"{delta(lat_b['p50'], lat_c['p50']):>9} {delta(lat_b['p95'], lat_c['p95']):>9} "
+              f"{delta(lat_b['p99'], lat_c['p99']):>9} {cur['error_rate'] - base['error_rate']:>+8.3%}")
+
+
+def parse_mix(value):
+    mix = {"assess": 1.0, "checkout": 0.0}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight)
+    total = mix["assess"] + mix["checkout"]
+    return {"assess": mix["assess"] / total, "checkout": mix["checkout"] / total}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="load a running server instead of the in-process test client")
+    parser.add_argument("--serve", help="start gunicorn with these arguments and load it")
+    parser.add_argument("--app", default="app:create_app()", help="wsgi/asgi app for --serve")
+    parser.add_argument("--database-url", help="database for the test client / --serve (default: fresh temporary sqlite)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=0, help="total requests (repeatable); overrides --duration")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--warmup", type=int, default=50, help="requests before measuring")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("assess=0.9,checkout=0.1"))
+    parser.add_argument("--personas", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--label", help="name for this run in the artifact")
+    parser.add_argument("--out", default="loadtest.json", help="json artifact path")
+    parser.add_argument("--compare", help="earlier artifact to print deltas against")
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    db_url = args.database_url or f"sqlite:///{os.path.join(tmp.name, 'load.db')}"
+    server = None
+    if args.url:
+        target, target_name = HTTPTarget(args.url), args.url
+    elif args.serve:
+        env = {**os.environ, "DATABASE_URL": db_url, "FLASK_ENV": "production"}
+        server, url = start_server(args, env)
+        target, target_name = HTTPTarget(url), f"gunicorn {args.app} {args.serve}"
+    else:
+        os.environ["DATABASE_URL"] = db_url
+        target, target_name = TestClientTarget(), "flask test client"
+
+    try:
+        elapsed, endpoints, total = run(target, args)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+        tmp.cleanup()
+
+    result = {
+        "meta": {
+            "label": args.label,
+            "started_at": datetime.utcnow().isoformat(timespec="seconds"),
+            "target": target_name,
+            "database": None if args.url else db_url.split("@")[-1],
+            "concurrency": args.concurrency,
+            "requests": args.requests or None,
+            "duration_s": round(elapsed, 3),
+            "mix": args.mix,
+            "seed": args.seed,
+            "personas": args.personas,
+            "warmup": args.warmup,
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "env": {k: os.environ[k] for k in RECORDED_ENV if k in os.environ},
+        },
+        "endpoints": endpoints,
+        "total": total,
+    }
+    with open(args.out, "w") as f:
+        json.dump(result, f, indent=2)
+
+    print(f"{target_name}: {args.concurrency} concurrent, {elapsed:.1f}s")
+    print(f"{'endpoint':<24} {'requests':>9} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>8}")
+    for name, s in [*endpoints.items(), ("total", total)]:
+        lat = s["latency_ms"]
+        print(f"{name:<24} {s['requests']:>9} {s['throughput_rps']:>9.1f} {lat['p50']:>9.2f} {lat['p95']:>9.2f} "
+              f"{lat['p99']:>9.2f} {s['error_rate']:>8.2%}")
+    print(f"wrote {args.out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+seeded synthetic /api/assess traffic.
+
+answers come from a pool of personas: each persona leans towards A or B per
+axis, and personas are drawn with a zipf-like skew, so popular answer
+patterns repeat the way they do in production. context values follow rough
+production proportions. the same seed always gives the same request stream.
+"""
+
+import random
+from typing import Any, Dict, Iterator, List
+
+AXIS_QUESTIONS = [range(0, 5), range(5, 10), range(10, 15), range(15, 20)]
+
+TEAM_SIZES = (("solo", 25), ("2-5", 35), ("6-15", 20), ("16-50", 12), ("50+", 8))
+MEETING_LOADS = (("light", 30), ("moderate", 45), ("heavy", 25))
+HOURLY_RATES = (("50", 15), ("75", 25), ("100", 25), ("125", 15), ("150", 12), ("200", 8))
+PLATFORMS = (("google", 40), ("microsoft", 30), ("slack", 15), ("mixed", 15))
+
+
+def _pick(rnd: random.Random, weighted):
+    values, weights = zip(*weighted)
+    return rnd.choices(values, weights)[0]
+
+
+class Workload:
+    def __init__(self, seed: int = 1, personas: int = 2000, skew: float = 1.1):
+        self.rnd = random.Random(seed)
+        self.personas = [self._persona() for _ in range(personas)]
+        # zipf-like popularity: persona k drawn with weight 1 / (k+1)^skew
+        self.weights = [1.0 / (k + 1) ** skew for k in range(personas)]
+
+    def _persona(self) -> List[float]:
+        # probability of answering A, per question, from a per-axis lean
+        leans = [self.rnd.betavariate(0.7, 0.7) for _ in AXIS_QUESTIONS]
+        return [min(max(lean + self.rnd.gauss(0, 0.08), 0.0), 1.0) for lean, qs in zip(leans, AXIS_QUESTIONS) for _ in qs]
+
+    def responses(self) -> Dict[str, str]:
+        persona = self.rnd.choices(self.personas, self.weights)[0]
+        # personas answer deterministically most of the time, with a little noise
+        return {str(i): ("A" if p >= 0.5 else "B") if self.rnd.random() > 0.1 else self.rnd.choice("AB")
+                for i, p in enumerate(persona)}
+
+    def context(self) -> Dict[str, str]:
+        return {
+            "teamSize": _pick(self.rnd, TEAM_SIZES),
+            "meetingLoad": _pick(self.rnd, MEETING_LOADS),
+            "hourlyRate": _pick(self.rnd, HOURLY_RATES),
+            "platform": _pick(self.rnd, PLATFORMS),
+        }
+
+    def assess_body(self) -> Dict[str, Any]:
+        return {"responses": self.responses(), "context": self.context()}
+
+    def checkout_body(self, assessment_id: str) -> Dict[str, Any]:
+        return {"email": f"load+{self.rnd.randrange(10**9)}@example.com", "assessment_id": assessment_id}
+
+    def stream(self, n: int) -> Iterator[Dict[str, Any]]:
+        for _ in range(n):
+            yield self.assess_body()
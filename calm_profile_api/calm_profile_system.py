@@ -1,136 +1,254 @@
 """
 Calm Profile Scoring System
 Binary A/B responses mapped to behavioral axes and archetypes
+
+The model (axes, their questions, archetype targets and copy) is data:
+scoring_models/<version>.json, compiled on load into a ScoringModel with a
+centroid matrix and a question -> axis index. Any number of versions can be
+loaded side by side (load_model); SCORING_MODEL picks the one the module
+functions use by default. ARCHETYPES and AXIS_QUESTIONS are that model's
+definitions; rebinding them switches the default to a model compiled from
+the new dicts.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
+import hashlib
+import itertools
+import json
 import math
+import os
 
+import numpy as np
 
-# Question to axis mapping (0–19 by quintiles)
-AXIS_QUESTIONS = {
-    "structure": [0, 1, 2, 3, 4],
-    "collaboration": [5, 6, 7, 8, 9],
-    "scope": [10, 11, 12, 13, 14],
-    "tempo": [15, 16, 17, 18, 19]
-}
-
-# Archetype definitions with axis target values (0-100 scale)
-ARCHETYPES = {
-    "architect": {
-        "name": "Architect",
-        "axes": {
-            "structure": 85,
-            "collaboration": 35,
-            "scope": 70,
-            "tempo": 40
-        },
-        "tagline": "systematic builders of scalable foundations",
-        "strengths": [
-            "Framework design",
-            "Process optimization",
-            "Long-term planning",
-            "System integration"
-        ],
-        "quick_wins": [
-            "Implement project templates",
-            "Create workflow documentation",
-            "Set up automation tools"
-        ]
-    },
-    "conductor": {
-        "name": "Conductor",
-        "axes": {
-            "structure": 70,
-            "collaboration": 85,
-            "scope": 75,
-            "tempo": 60
-        },
-        "tagline": "orchestrators of collaborative excellence",
-        "strengths": [
-            "Team coordination",
-            "Meeting facilitation",
-            "Stakeholder alignment",
-            "Resource orchestration"
-        ],
-        "quick_wins": [
-            "Reduce status meetings with async updates",
-            "Define decision owners",
-            "Weekly cadence dashboard"
-        ]
-    },
-    "curator": {
-        "name": "Curator",
-        "axes": {
-            "structure": 40,
-            "collaboration": 75,
-            "scope": 30,
-            "tempo": 45
-        },
-        "tagline": "quality guardians and creative refiners",
-        "strengths": [
-            "Quality assurance",
-            "Detail orientation",
-            "Creative curation",
-            "Standard maintenance"
-        ],
-        "quick_wins": [
-            "Develop review checklists",
-            "Create style guides",
-            "Set up quality gates"
-        ]
-    },
-    "craftsperson": {
-        "name": "Craftsperson",
-        "axes": {
-            "structure": 80,
-            "collaboration": 30,
-            "scope": 80,
-            "tempo": 40
-        },
-        "tagline": "deep work and quality at the edges",
-        "strengths": [
-            "Detail execution",
-            "Technical craft",
-            "Quality control",
-            "Repeatable delivery"
-        ],
-        "quick_wins": [
-            "Protect maker time",
-            "Limit WIP",
-            "Definition of ready"
-        ]
-    }
-}
+MODELS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scoring_models")
+
+# models with more count combinations than this score directly instead of through an outcome table
+OUTCOME_TABLE_MAX_ENTRIES = 50_000
+
+# single responses are matched with numpy from this many archetype x axis cells on
+_VECTOR_MIN_CELLS = 48
 
 
 def clamp(v: float, lo: float = 0, hi: float = 100) -> float:
     return max(lo, min(hi, v))
 
 
-def calculate_axis_scores(responses: Dict[str, int]) -> Dict[str, float]:
+def distance(a: float, b: float) -> float:
+    return abs(a - b)
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict for results shared between callers.
+    Still a dict, so jsonify / JSON columns serialise it unchanged.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("scoring results are shared and read-only; copy before modifying")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return FrozenDict((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True, eq=False)
+class ScoringModel:
+    """
+    A compiled scoring model. The definitions are kept as loaded; the
+    compiled fields index them positionally (axis a, archetype k).
+    """
+    version: str
+    axis_questions: Dict[str, List[int]]
+    archetypes: Dict[str, Any]
+    axes: Tuple[str, ...]
+    names: Tuple[str, ...]                 # archetype keys, in definition order
+    axis_sizes: Tuple[int, ...]
+    question_axis: Tuple[int, ...]         # axis index per question number, -1 if unused
+    bits: Tuple[Tuple[str, int], ...]      # (response key, bit) per question
+    centroids: Tuple[Tuple[float, ...], ...]
+
+    @cached_property
+    def centroid_matrix(self) -> np.ndarray:
+        """(archetypes, axes) target values"""
+        return np.array(self.centroids, dtype=np.float64).reshape(len(self.names), len(self.axes))
+
+    @cached_property
+    def centroids_by_axis(self) -> np.ndarray:
+        """(axes, archetypes), the layout match_row reduces over"""
+        return np.ascontiguousarray(self.centroid_matrix.T)
+
+    @cached_property
+    def membership(self) -> np.ndarray:
+        """(questions, axes) 0/1, so response matrix @ membership = A answers per axis"""
+        m = np.zeros((len(self.question_axis), len(self.axes)), dtype=np.int64)
+        for q, a in enumerate(self.question_axis):
+            if a >= 0:
+                m[q, a] = 1
+        return m
+
+    @property
+    def n_questions(self) -> int:
+        return len(self.question_axis)
+
+    def match(self, axis_scores: Any) -> np.ndarray:
+        """
+        (N, axes) axis scores -> (N, archetypes) match percentages: 100 minus
+        the mean L1 distance to each centroid. Accumulated one axis at a time
+        over the whole (N, archetypes) block, in the same order as match_row,
+        so both give identical floats and no (N, archetypes, axes) temporary
+        is needed.
+        """
+        S = np.asarray(axis_scores, dtype=np.float64)
+        C = self.centroid_matrix
+        dist = np.zeros((S.shape[0], C.shape[0]))
+        for a in range(C.shape[1]):
+            dist += np.abs(S[:, a, None] - C[None, :, a])
+        return np.clip(100.0 - dist / len(self.axes), 0.0, 100.0)
+
+    def match_row(self, values: Sequence[float]) -> List[float]:
+        """match() for one row of axis scores"""
+        n = len(self.axes)
+        if len(self.centroids) * n >= _VECTOR_MIN_CELLS:
+            # reducing over the outer axis adds axis by axis too, so the floats match match()
+            d = np.abs(np.asarray(values, dtype=np.float64)[:, None] - self.centroids_by_axis).sum(axis=0)
+            return np.clip(100.0 - d / n, 0.0, 100.0).tolist()
+        out = []
+        for centroid in self.centroids:
+            d = 0.0
+            for s, t in zip(values, centroid):
+                d += abs(s - t)
+            out.append(min(max(100.0 - d / n, 0.0), 100.0))
+        return out
+
+    @cached_property
+    def frozen_recommendations(self) -> Dict[str, FrozenDict]:
+        """per archetype, shared by every result with that primary"""
+        return {k: _freeze({"strengths": a["strengths"], "quick_wins": a["quick_wins"]})
+                for k, a in self.archetypes.items()}
+
+    @cached_property
+    def outcome_table(self) -> Optional["OutcomeTable"]:
+        """every outcome, or None when the model has more than OUTCOME_TABLE_MAX_ENTRIES"""
+        return _build_outcome_table(self)
+
+    @cached_property
+    def digest(self) -> str:
+        """hash of the definitions, for models scored without an outcome table"""
+        canonical = json.dumps({"axis_questions": self.axis_questions, "archetypes": self.archetypes}, sort_keys=True)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def compile_model(version: str, axis_questions: Dict[str, List[int]], archetypes: Dict[str, Any]) -> ScoringModel:
+    """Validate definitions and compile them; the dicts are kept by reference."""
+    def invalid(msg):
+        return ValueError(f"scoring model {version}: {msg}")
+
+    if not axis_questions or not archetypes:
+        raise invalid("needs at least one axis and one archetype")
+    axes = tuple(axis_questions)
+    question_axis: Dict[int, int] = {}
+    for a, idxs in enumerate(axis_questions.values()):
+        if not idxs:
+            raise invalid(f"axis {axes[a]!r} has no questions")
+        for q in idxs:
+            if not isinstance(q, int) or q < 0:
+                raise invalid(f"question {q!r} on axis {axes[a]!r} is not a question number")
+            if q in question_axis:
+                raise invalid(f"question {q} is on both {axes[question_axis[q]]!r} and {axes[a]!r}")
+            question_axis[q] = a
+    centroids = []
+    for name, arche in archetypes.items():
+        targets = arche.get("axes", {})
+        missing = [k for k in axes if k not in targets]
+        if missing:
+            raise invalid(f"archetype {name!r} has no target for {', '.join(missing)}")
+        if any(not 0 <= targets[k] <= 100 for k in axes):
+            raise invalid(f"archetype {name!r} has targets outside 0-100")
+        centroids.append(tuple(float(targets[k]) for k in axes))
+    questions = sorted(question_axis)
+    return ScoringModel(
+        version=version,
+        axis_questions=axis_questions,
+        archetypes=archetypes,
+        axes=axes,
+        names=tuple(archetypes),
+        axis_sizes=tuple(len(idxs) for idxs in axis_questions.values()),
+        question_axis=tuple(question_axis.get(q, -1) for q in range(questions[-1] + 1)),
+        bits=tuple((str(i), 1 << i) for i in questions),
+        centroids=tuple(centroids),
+    )
+
+
+_MODELS: Dict[str, ScoringModel] = {}
+
+
+def available_models() -> List[str]:
+    return sorted(f[:-5] for f in os.listdir(MODELS_DIR) if f.endswith(".json"))
+
+
+def load_model(version: str) -> ScoringModel:
+    """The compiled model from scoring_models/<version>.json, loaded once per process."""
+    model = _MODELS.get(version)
+    if model is None:
+        path = os.path.join(MODELS_DIR, f"{version}.json")
+        if not os.path.exists(path):
+            raise ValueError(f"unknown scoring model {version!r} (available: {', '.join(available_models())})")
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != version:
+            raise ValueError(f"{path} declares version {data.get('version')!r}")
+        model = _MODELS[version] = compile_model(version, data["axis_questions"], data["archetypes"])
+    return model
+
+
+_default = load_model(os.getenv("SCORING_MODEL", "v1"))
+
+# the default model's definitions (see module docstring)
+AXIS_QUESTIONS = _default.axis_questions
+ARCHETYPES = _default.archetypes
+
+_CURRENT: ScoringModel = _default
+
+
+def current_model() -> ScoringModel:
+    """The default model: the one ARCHETYPES / AXIS_QUESTIONS currently belong to."""
+    global _CURRENT
+    model = _CURRENT
+    if model.archetypes is not ARCHETYPES or model.axis_questions is not AXIS_QUESTIONS:
+        model = next((m for m in _MODELS.values()
+                      if m.archetypes is ARCHETYPES and m.axis_questions is AXIS_QUESTIONS), None)
+        _CURRENT = model = model or compile_model("custom", AXIS_QUESTIONS, ARCHETYPES)
+    return model
+
+
+def calculate_axis_scores(responses: Dict[str, int], model: Optional[ScoringModel] = None) -> Dict[str, float]:
     """
     Calculate axis scores from binary responses.
     1 = A (high on axis), 0 = B (low on axis)
     """
+    model = model or current_model()
     axis_scores = {}
-    for axis_name, idxs in AXIS_QUESTIONS.items():
+    for axis_name, idxs in model.axis_questions.items():
         total = sum(responses.get(str(i), 0) for i in idxs)
         axis_scores[axis_name] = (total / len(idxs)) * 100.0
     return axis_scores
 
 
-def distance(a: float, b: float) -> float:
-    return abs(a - b)
-
-
-def calculate_archetype_match(axis_scores: Dict[str, float]) -> Dict[str, float]:
-    matches = {}
-    for name, arche in ARCHETYPES.items():
-        d = sum(distance(axis_scores[k], arche["axes"][k]) for k in ["structure", "collaboration", "scope", "tempo"])
-        matches[name] = clamp(100 - d / 4)
-    return matches
+def calculate_archetype_match(axis_scores: Dict[str, float], model: Optional[ScoringModel] = None) -> Dict[str, float]:
+    model = model or current_model()
+    return dict(zip(model.names, model.match_row([axis_scores[k] for k in model.axes])))
 
 
 def determine_archetype_mix(matches: Dict[str, float]) -> Dict[str, float]:
@@ -138,27 +256,296 @@ def determine_archetype_mix(matches: Dict[str, float]) -> Dict[str, float]:
     return {k: round(100.0 * v / total, 1) for k, v in matches.items()}
 
 
-def score_assessment(responses: Dict[str, int]) -> Dict[str, Any]:
-    axis_scores = calculate_axis_scores(responses)
-    matches = calculate_archetype_match(axis_scores)
+def _assemble(model: ScoringModel, axis_scores: Dict[str, float], matches: Dict[str, float]) -> Dict[str, Any]:
     primary = max(matches, key=lambda k: matches[k])
+    arche = model.archetypes[primary]
     return {
         "archetype": {
             "primary": primary,
             "mix": determine_archetype_mix(matches),
-            "tagline": ARCHETYPES[primary].get("tagline", "")
+            "tagline": arche.get("tagline", "")
         },
         "scores": {
             "axes": {k: round(v) for k, v in axis_scores.items()},
             "match": {k: round(v, 1) for k, v in matches.items()}
         },
         "recommendations": {
-            "strengths": ARCHETYPES[primary]["strengths"],
-            "quick_wins": ARCHETYPES[primary]["quick_wins"],
+            "strengths": arche["strengths"],
+            "quick_wins": arche["quick_wins"],
         }
     }
 
 
+def _frozen_result(model: ScoringModel, axis_scores: Dict[str, float], matches: Dict[str, float]) -> FrozenDict:
+    """_freeze(_assemble(...)), sharing the model's frozen recommendations"""
+    primary = max(matches, key=lambda k: matches[k])
+    return FrozenDict(
+        archetype=FrozenDict(
+            primary=primary,
+            mix=FrozenDict(determine_archetype_mix(matches)),
+            tagline=model.archetypes[primary].get("tagline", ""),
+        ),
+        scores=FrozenDict(
+            axes=FrozenDict((k, round(v)) for k, v in axis_scores.items()),
+            match=FrozenDict((k, round(v, 1)) for k, v in matches.items()),
+        ),
+        recommendations=model.frozen_recommendations[primary],
+    )
+
+
+def _score_assessment_reference(responses: Dict[str, int], model: Optional[ScoringModel] = None) -> Dict[str, Any]:
+    """Uncached scoring path; the outcome table is checked against this."""
+    model = model or current_model()
+    axis_scores = calculate_axis_scores(responses, model)
+    return _assemble(model, axis_scores, calculate_archetype_match(axis_scores, model))
+
+
+@dataclass(frozen=True)
+class OutcomeTable:
+    """
+    Every scoring outcome of a model, indexed by per-axis answer counts.
+    The result only depends on how many A answers each axis got, so
+    len(entries) == prod(len(questions) + 1 for each axis), e.g. 6^4 = 1296.
+    """
+    model: ScoringModel
+    axis_masks: Tuple[int, ...]
+    strides: Tuple[int, ...]
+    entries: Tuple[FrozenDict, ...]
+    primaries: Any                         # (entries,) int, archetype index of each entry's primary
+    version: str                           # hash of every outcome; changes with any scoring change
+
+    def index(self, mask: int) -> int:
+        return sum((mask & m).bit_count() * s for m, s in zip(self.axis_masks, self.strides))
+
+    def lookup(self, mask: int) -> FrozenDict:
+        return self.entries[self.index(mask)]
+
+
+def _build_outcome_table(model: ScoringModel) -> Optional[OutcomeTable]:
+    radix = [n + 1 for n in model.axis_sizes]
+    if math.prod(radix) > OUTCOME_TABLE_MAX_ENTRIES:
+        return None
+    strides = []
+    step = 1
+    for r in reversed(radix):
+        strides.append(step)
+        step *= r
+    strides.reverse()
+
+    # every count combination scored in one pass, in index order
+    counts = np.array(list(itertools.product(*(range(r) for r in radix))), dtype=np.int64)
+    axis_scores = counts / np.array(model.axis_sizes, dtype=np.float64) * 100.0
+    matches = model.match(axis_scores)
+    entries = tuple(
+        _frozen_result(model, dict(zip(model.axes, s)), dict(zip(model.names, m)))
+        for s, m in zip(axis_scores.tolist(), matches.tolist())
+    )
+    return OutcomeTable(
+        model=model,
+        axis_masks=tuple(sum(1 << i for i in idxs) for idxs in model.axis_questions.values()),
+        strides=tuple(strides),
+        entries=entries,
+        primaries=matches.argmax(axis=1),
+        version=hashlib.sha256(json.dumps(entries, sort_keys=True).encode("utf-8")).hexdigest()[:16],
+    )
+
+
+def rebuild_outcome_table() -> Optional[OutcomeTable]:
+    """
+    Recompile the default model from the current ARCHETYPES / AXIS_QUESTIONS
+    and rebuild its outcome table. Rebinding either name is picked up
+    automatically; call this after mutating them in place.
+    """
+    global _CURRENT
+    old = current_model()
+    _CURRENT = compile_model(old.version, AXIS_QUESTIONS, ARCHETYPES)
+    if _MODELS.get(old.version) is old:
+        _MODELS[old.version] = _CURRENT
+    return _CURRENT.outcome_table
+
+
+def outcome_table(model: Optional[ScoringModel] = None) -> Optional[OutcomeTable]:
+    return (model or current_model()).outcome_table
+
+
+def scoring_version(model: Optional[ScoringModel] = None) -> str:
+    """Identifies the scoring outputs, for cache keys."""
+    model = model or current_model()
+    table = model.outcome_table
+    return table.version if table is not None else model.digest
+
+
+def responses_to_mask(responses: Dict[str, int], model: Optional[ScoringModel] = None) -> Optional[int]:
+    """Pack 0/1 responses into a bitmask (bit i = question i); None if any value isn't 0/1."""
+    mask = 0
+    for key, bit in (model or current_model()).bits:
+        v = responses.get(key, 0)
+        if v == 1:
+            mask |= bit
+        elif v:
+            return None
+    return mask
+
+
+def score_assessment(responses: Dict[str, int], model: Optional[ScoringModel] = None) -> Dict[str, Any]:
+    """
+    Score binary responses, via the model's precomputed outcome table when it
+    has one. The returned dict is shared between calls and read-only.
+    """
+    model = model or current_model()
+    table = model.outcome_table
+    mask = responses_to_mask(responses, model) if table is not None else None
+    if mask is None:
+        axis_scores = calculate_axis_scores(responses, model)
+        return _frozen_result(model, axis_scores, calculate_archetype_match(axis_scores, model))
+    return table.lookup(mask)
+
+
+def verify_outcome_table(model: Optional[ScoringModel] = None) -> List[Tuple[int, ...]]:
+    """Check every table entry against the reference path; returns mismatching count tuples."""
+    model = model or current_model()
+    table = model.outcome_table
+    if table is None:
+        return []
+    radix = [n + 1 for n in model.axis_sizes]
+    mismatches = []
+    for counts in itertools.product(*(range(r) for r in radix)):
+        # place the A answers at the end of each axis so the bitmask indexing is exercised too
+        responses = {}
+        for idxs, c in zip(model.axis_questions.values(), counts):
+            for j, i in enumerate(idxs):
+                responses[str(i)] = 1 if j >= len(idxs) - c else 0
+        if score_assessment(responses, model) != _freeze(_score_assessment_reference(responses, model)):
+            mismatches.append(counts)
+    if len(table.entries) != math.prod(radix):
+        mismatches.append(tuple(radix))
+    return mismatches
+
+
+@lru_cache(maxsize=None)
+def _binomial_row(n: int) -> np.ndarray:
+    return np.array([math.comb(n, j) for j in range(n + 1)], dtype=np.int64)
+
+
+def primary_odds(responses: Dict[str, Optional[int]], model: Optional[ScoringModel] = None) -> Dict[str, Any]:
+    """
+    Odds of each primary archetype for a partly answered questionnaire:
+    responses holds 1 (A) / 0 (B) for answered questions, unanswered ones
+    are missing or None. Every completion of the unanswered questions is
+    counted once (all 2^remaining equally likely), exactly: the primary
+    only depends on each axis' final A count, and an axis with `a` A answers
+    and `u` open questions ends at a + j in comb(u, j) completions. So the
+    work is one weight per count combination (at most the outcome table's
+    size), never one per completion.
+    """
+    model = model or current_model()
+    answered_a, open_counts = [], []
+    for idxs in model.axis_questions.values():
+        a = u = 0
+        for i in idxs:
+            v = responses.get(str(i))
+            if v is None:
+                u += 1
+            elif v == 1:
+                a += 1
+            elif v != 0:
+                raise ValueError(f"response {i} must be 0, 1 or unanswered, got {v!r}")
+        answered_a.append(a)
+        open_counts.append(u)
+
+    # per count combination: the completions reaching it, and its outcome table index
+    table = model.outcome_table
+    combinations = math.prod(u + 1 for u in open_counts)
+    if table is None and combinations > OUTCOME_TABLE_MAX_ENTRIES:
+        raise ValueError(f"{combinations:,} count combinations left; answer more questions for exact odds")
+    finals = [a + np.arange(u + 1) for a, u in zip(answered_a, open_counts)]
+    weights = np.ones(1, dtype=np.int64)
+    for u in open_counts:
+        weights = np.multiply.outer(weights, _binomial_row(u)).ravel()
+
+    if table is not None:
+        index = np.zeros(1, dtype=np.int64)
+        for final, stride in zip(finals, table.strides):
+            index = np.add.outer(index, final * stride).ravel()
+        primaries = table.primaries[index]
+    else:
+        counts = np.stack(np.meshgrid(*finals, indexing="ij"), axis=-1).reshape(-1, len(model.axes))
+        primaries = model.match(counts / np.array(model.axis_sizes, dtype=np.float64) * 100.0).argmax(axis=1)
+    by_archetype = np.zeros(len(model.names), dtype=np.int64)
+    np.add.at(by_archetype, primaries, weights)
+
+    remaining = sum(open_counts)
+    completions = 1 << remaining
+    return {
+        "answered": sum(model.axis_sizes) - remaining,
+        "remaining": remaining,
+        "completions": completions,
+        "counts": dict(zip(model.names, by_archetype.tolist())),
+        "probabilities": {k: c / completions for k, c in zip(model.names, by_archetype.tolist())},
+    }
+
+
+@dataclass
+class BatchScores:
+    """Vectorised scores for N respondents; row i matches score_assessment on row i."""
+    axes: List[str]
+    archetypes: List[str]
+    counts: Any          # (N, axes) int, A answers per axis
+    axis_scores: Any     # (N, axes) float, 0-100
+    matches: Any         # (N, archetypes) float, 0-100
+    mix: Any             # (N, archetypes) float, percent rounded to 0.1
+    primary: Any         # (N,) int index into archetypes
+    outcome_index: Any   # (N,) int index into the model's outcome table entries, None without one
+    model: Optional[ScoringModel] = None
+
+    def primary_names(self) -> List[str]:
+        return [self.archetypes[i] for i in self.primary.tolist()]
+
+    def results(self) -> List[FrozenDict]:
+        """Per-row results in the score_assessment shape (shared outcome table entries when there is a table)."""
+        model = self.model or current_model()
+        if self.outcome_index is not None:
+            entries = model.outcome_table.entries
+            return [entries[i] for i in self.outcome_index.tolist()]
+        return [_frozen_result(model, dict(zip(model.axes, s)), dict(zip(model.names, m)))
+                for s, m in zip(self.axis_scores.tolist(), self.matches.tolist())]
+
+
+def score_batch(responses: Any, model: Optional[ScoringModel] = None) -> BatchScores:
+    """
+    Score an (N, questions) 0/1 matrix in one pass; column i is question i.
+    Axis sums are a single matmul against the question->axis membership
+    matrix, and archetype matching is one (N, archetypes) distance block.
+    """
+    model = model or current_model()
+    R = np.asarray(responses)
+    if R.ndim != 2 or R.shape[1] < model.n_questions:
+        raise ValueError(f"expected an (N, {model.n_questions}) response matrix, got shape {R.shape}")
+    if not np.isin(R, (0, 1)).all():
+        raise ValueError("batch scoring expects 0/1 responses")
+
+    counts = R[:, :model.n_questions].astype(np.int64) @ model.membership
+    axis_scores = counts / np.array(model.axis_sizes, dtype=np.float64) * 100.0
+    matches = model.match(axis_scores)
+    primary = matches.argmax(axis=1)
+    total = matches.sum(axis=1, keepdims=True)
+    total[total == 0] = 1.0
+    mix = np.round(100.0 * matches / total, 1)
+
+    table = model.outcome_table
+    return BatchScores(
+        axes=list(model.axes),
+        archetypes=list(model.names),
+        counts=counts,
+        axis_scores=axis_scores,
+        matches=matches,
+        mix=mix,
+        primary=primary,
+        outcome_index=counts @ np.array(table.strides, dtype=np.int64) if table is not None else None,
+        model=model,
+    )
+
+
 def format_response(result: Dict[str, Any], platform: str = "google") -> Dict[str, Any]:
     # placeholder for platform-specific tool stack mapping if needed
     return result
@@ -167,3 +554,10 @@ def format_response(result: Dict[str, Any], platform: str = "google") -> Dict[st
 if __name__ == "__main__":
     test_responses = {str(i): 1 for i in range(20)}
     print(score_assessment(test_responses))
+    for version in available_models():
+        model = load_model(version)
+        bad = verify_outcome_table(model)
+        table = model.outcome_table
+        size = f"{len(table.entries)} entries" if table else "no outcome table"
+        print(f"model {version}: {len(model.names)} archetypes x {len(model.axes)} axes, {size}, "
+              f"{len(bad)} mismatches, scoring version {scoring_version(model)}")
@@ -0,0 +1,103 @@
+"""
+Cost model: the time and money a profile's coordination overhead costs,
+from the respondent's context (team size, meeting load, hourly rate).
+
+The parameters are module data so the edge scoring artifact
+(edge/build_artifact.py) can carry them to the JS handlers unchanged.
+Labels resolve to multipliers through cached lookups, so the string scans
+run once per distinct label; cost_grid() evaluates whole what-if grids
+(hourly rates x team sizes x meeting loads) in one broadcast, cell for cell
+equal to context_cost().
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Sequence
+
+import numpy as np
+
+# bump when the cost model changes, so cached /api/assess results stop matching
+COST_MODEL_VERSION = 1
+
+DEFAULTS = {"teamSize": "solo", "meetingLoad": "light", "hourlyRate": 85, "platform": "web"}
+
+# first key contained in the (lowercased) meeting load wins; no match -> DEFAULT_MEETING_LOAD
+OVERHEAD_MULTIPLIERS = {"light": 0.6, "moderate": 0.8, "heavy": 1.0}
+DEFAULT_MEETING_LOAD = "moderate"
+
+ARCHETYPE_ADJUST = {"architect": 0.9, "conductor": 0.85, "curator": 1.1, "craftsperson": 1.2}
+
+# first key contained in the team size wins; no match -> 1
+TEAM_MULTIPLIERS = {"solo": 1, "2-5": 4, "6-15": 10, "16-50": 25, "50+": 55}
+
+HOURS_PER_OVERHEAD = 5.0
+WEEKS_PER_YEAR = 52
+
+
+@lru_cache(maxsize=1024)
+def _meeting_multiplier(label: str) -> float:
+    key = next((k for k in OVERHEAD_MULTIPLIERS if k in label.lower()), DEFAULT_MEETING_LOAD)
+    return OVERHEAD_MULTIPLIERS[key]
+
+
+@lru_cache(maxsize=1024)
+def _team_multiplier(label: str) -> int:
+    return next((v for k, v in TEAM_MULTIPLIERS.items() if k in label), 1)
+
+
+def meeting_multiplier(meeting_load) -> float:
+    return _meeting_multiplier(str(meeting_load))
+
+
+def team_multiplier(team_size) -> int:
+    return _team_multiplier(str(team_size))
+
+
+def overhead_index(primary, meeting_load) -> float:
+    return meeting_multiplier(meeting_load) * ARCHETYPE_ADJUST.get(primary.lower(), 1.0)
+
+
+def context_cost(primary, context):
+    """context parse + cost model; returns (context_data, overhead_index, hours_lost_ppw, annual_cost)"""
+    team_size = context.get("teamSize", DEFAULTS["teamSize"])
+    meeting_load = context.get("meetingLoad", DEFAULTS["meetingLoad"])
+    hourly_rate = float(context.get("hourlyRate", DEFAULTS["hourlyRate"]))
+    platform = context.get("platform", DEFAULTS["platform"])
+
+    oi = overhead_index(primary, meeting_load)
+    hours_lost_ppw = oi * HOURS_PER_OVERHEAD
+    annual_cost = hours_lost_ppw * WEEKS_PER_YEAR * hourly_rate * team_multiplier(team_size)
+
+    context_data = {"team_size": team_size, "meeting_load": meeting_load, "hourly_rate": hourly_rate, "platform": platform}
+    return context_data, oi, hours_lost_ppw, annual_cost
+
+
+@dataclass
+class CostGrid:
+    """context_cost over every (hourly rate, team size, meeting load) for one primary archetype"""
+    hourly_rates: Any      # (R,) float
+    team_sizes: list       # T labels
+    meeting_loads: list    # M labels
+    overhead_index: Any    # (M,)
+    hours_lost_ppw: Any    # (M,)
+    annual_cost: Any       # (R, T, M)
+
+    def rounded(self) -> dict:
+        """the figures rounded as /api/assess rounds them; annual_cost nested [rate][team size][meeting load]"""
+        return {
+            "overhead_index": [round(x * 100) for x in self.overhead_index.tolist()],
+            "hours_lost_ppw": [round(x, 1) for x in self.hours_lost_ppw.tolist()],
+            # np.rint rounds half to even, as round() does
+            "annual_cost": np.rint(self.annual_cost).astype(np.int64).tolist(),
+        }
+
+
+def cost_grid(primary: str, hourly_rates: Sequence[float], team_sizes: Sequence[str],
+              meeting_loads: Sequence[str]) -> CostGrid:
+    rates = np.asarray(hourly_rates, dtype=np.float64)
+    oi = np.array([overhead_index(primary, m) for m in meeting_loads], dtype=np.float64)
+    tm = np.array([team_multiplier(t) for t in team_sizes], dtype=np.float64)
+    hours = oi * HOURS_PER_OVERHEAD
+    # same operation order as context_cost, so every cell equals it exactly
+    annual = hours * WEEKS_PER_YEAR * rates[:, None, None] * tm[None, :, None]
+    return CostGrid(rates, list(team_sizes), list(meeting_loads), oi, hours, annual)
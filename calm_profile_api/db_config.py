@@ -0,0 +1,110 @@
+"""
+Database engine profiles picked from the environment.
+
+postgres: a per-worker pool sized so that all gunicorn workers together stay
+under DB_MAX_CONNECTIONS, with pre-ping, recycle and a statement timeout.
+sqlite: WAL journal, synchronous=NORMAL, mmap and a busy timeout so several
+workers can write one file without "database is locked".
+"""
+
+import os
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+def database_url() -> str:
+    url = os.getenv("DATABASE_URL", "sqlite:///calm_profile.db")
+    if url.startswith("postgres://"):
+        url = url.replace("postgres://", "postgresql+psycopg2://", 1)
+    return url
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, default))
+
+
+def worker_count() -> int:
+    """gunicorn workers sharing the database (WEB_CONCURRENCY is what gunicorn itself reads)"""
+    return max(1, _env_int("WEB_CONCURRENCY", 1))
+
+
+def postgres_engine_options() -> Dict[str, Any]:
+    max_conns = _env_int("DB_MAX_CONNECTIONS", 20)
+    per_worker = max(1, max_conns // worker_count())
+    pool_size = _env_int("DB_POOL_SIZE", max(1, per_worker // 2))
+    timeout_ms = _env_int("DB_STATEMENT_TIMEOUT_MS", 5000)
+    return {
+        "pool_size": pool_size,
+        "max_overflow": _env_int("DB_MAX_OVERFLOW", max(0, per_worker - pool_size)),
+        "pool_timeout": _env_int("DB_POOL_TIMEOUT", 10),
+        "pool_recycle": _env_int("DB_POOL_RECYCLE", 1800),
+        "pool_pre_ping": True,
+        "connect_args": {"options": f"-c statement_timeout={timeout_ms}"},
+    }
+
+
+def async_database_url(sync_url) -> str:
+    """async driver url for the same database (asyncpg / aiosqlite)"""
+    if sync_url.drivername.startswith("postgresql"):
+        return sync_url.set(drivername="postgresql+asyncpg")
+    if sync_url.drivername.startswith("sqlite"):
+        return sync_url.set(drivername="sqlite+aiosqlite")
+    return sync_url
+
+
+def async_engine_options(url, profile: str = None) -> Dict[str, Any]:
+    """engine_options for create_async_engine; asyncpg takes server settings instead of libpq options"""
+    opts = engine_options(str(url), profile)
+    if "connect_args" in opts and url.drivername == "postgresql+asyncpg":
+        timeout_ms = _env_int("DB_STATEMENT_TIMEOUT_MS", 5000)
+        opts = {**opts, "connect_args": {"server_settings": {"statement_timeout": str(timeout_ms)}}}
+    return opts
+
+
+def sqlite_pragmas() -> Dict[str, Any]:
+    """read when an engine is configured, so a .env loaded by create_app applies"""
+    return {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": _env_int("SQLITE_BUSY_TIMEOUT_MS", 5000),
+        "mmap_size": _env_int("SQLITE_MMAP_BYTES", 256 * 1024 * 1024),
+        "temp_store": "MEMORY",
+        "foreign_keys": "ON",
+    }
+
+
+def db_profile() -> str:
+    """DB_PROFILE=tuned (default) or default (plain library settings, for comparison)"""
+    return os.getenv("DB_PROFILE", "tuned")
+
+
+def engine_options(url: str, profile: str = None) -> Dict[str, Any]:
+    """SQLALCHEMY_ENGINE_OPTIONS for the url"""
+    if (profile or db_profile()) == "default":
+        return {}
+    if url.startswith("postgresql"):
+        return postgres_engine_options()
+    return {}
+
+
+def _apply_sqlite_pragmas(dbapi_conn, pragmas) -> None:
+    cur = dbapi_conn.cursor()
+    for name, value in pragmas.items():
+        cur.execute(f"PRAGMA {name}={value}")
+    cur.close()
+
+
+def configure_engine(engine: Engine, profile: str = None) -> None:
+    """
+    set the WAL/sync/mmap/busy pragmas on every new connection of a sqlite engine
+    (for an AsyncEngine pass engine.sync_engine)
+    """
+    if engine.dialect.name != "sqlite" or (profile or db_profile()) == "default":
+        return
+    pragmas = sqlite_pragmas()
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_conn, _record):
+        _apply_sqlite_pragmas(dbapi_conn, pragmas)
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+build the edge scoring artifact for the JS /api/assess handlers.
+
+compiles the default scoring model (its outcome table: every per-axis count
+combination) and the cost model into a compact artifact, and writes it with
+the scorer (edge/scorer.js) as one self-contained ES module, _scoring.js,
+next to each handler in TARGETS. a handler scores with a single array
+lookup and returns the same body as the Flask /api/assess, minus the
+database write:
+
+    outcomes    flat array, (1 + 2 * archetypes) numbers per combination:
+                primary archetype index, mix per archetype, match per archetype
+    strides     combination index = sum(A answers on axis a * strides[a])
+    axis_scores rounded axis score per axis per A count
+    archetypes  key, name, tagline, strengths, quick_wins
+    cost        cost_model parameters
+
+rebuild after changing scoring_models/ or cost_model.py. --check fails if a
+written module is stale, then runs the scorer under node on every count
+combination (with varied answer placement and context) plus the rounding
+edge cases, and compares each body with the Python one.
+
+usage:
+    python edge/build_artifact.py
+    python edge/build_artifact.py --check
+"""
+
+import argparse
+import itertools
+import json
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+API_DIR = HERE.parent
+REPO = API_DIR.parent
+sys.path.insert(0, str(API_DIR))
+
+import calm_profile_system as cps  # noqa: E402
+import cost_model  # noqa: E402
+
+FORMAT = 1
+MODULE_NAME = "_scoring.js"
+# the directories holding an api/assess.js handler (a leading _ keeps the module from becoming a route)
+TARGETS = [REPO / "api", REPO / "calm-profile-spa" / "api", API_DIR / "calm-profile-archetype-addon" / "api"]
+
+
+def build(model=None) -> dict:
+    model = model or cps.current_model()
+    table = model.outcome_table
+    if table is None:
+        raise SystemExit(f"scoring model {model.version} has no outcome table (over "
+                         f"{cps.OUTCOME_TABLE_MAX_ENTRIES:,} combinations); it can't be compiled for the edge")
+    outcomes = []
+    for entry in table.entries:
+        outcomes.append(model.names.index(entry["archetype"]["primary"]))
+        outcomes.extend(entry["archetype"]["mix"][k] for k in model.names)
+        outcomes.extend(entry["scores"]["match"][k] for k in model.names)
+    return {
+        "format": FORMAT,
+        "model": model.version,
+        "scoring_version": cps.scoring_version(model),
+        "cost_model_version": cost_model.COST_MODEL_VERSION,
+        "axes": list(model.axes),
+        "axis_questions": list(model.axis_questions.values()),
+        "strides": list(table.strides),
+        # read back from the table, so they are exactly what Python returns
+        "axis_scores": [[table.entries[c * table.strides[a]]["scores"]["axes"][axis] for c in range(n + 1)]
+                        for a, (axis, n) in enumerate(zip(model.axes, model.axis_sizes))],
+        "archetypes": [{"key": k, "name": a["name"], "tagline": a.get("tagline", ""),
+                        "strengths": a["strengths"], "quick_wins": a["quick_wins"]}
+                       for k, a in model.archetypes.items()],
+        "cost": {
+            "defaults": cost_model.DEFAULTS,
+            "overhead_multipliers": cost_model.OVERHEAD_MULTIPLIERS,
+            "default_meeting_load": cost_model.DEFAULT_MEETING_LOAD,
+            "archetype_adjust": cost_model.ARCHETYPE_ADJUST,
+            "team_multipliers": cost_model.TEAM_MULTIPLIERS,
+            "hours_per_overhead": cost_model.HOURS_PER_OVERHEAD,
+            "weeks_per_year": cost_model.WEEKS_PER_YEAR,
+        },
+        "outcomes": outcomes,
+    }
+
+
+def render_module(artifact: dict) -> str:
+    banner = (f"// generated by calm_profile_api/edge/build_artifact.py from scoring model {artifact['model']} "
+              f"(scoring version {artifact['scoring_version']}, cost model {artifact['cost_model_version']}).\n"
+              f"// do not edit: rebuild after changing scoring_models/ or cost_model.py\n\n")
+    data = json.dumps(artifact, separators=(",", ":"), ensure_ascii=False)
+    return f"{banner}{(HERE / 'scorer.js').read_text(encoding='utf-8')}\nexport const ARTIFACT = {data}\n"
+
+
+# --- parity ---
+
+DRIVER = """
+import { createInterface } from 'node:readline'
+const { ARTIFACT, assessmentPayload, pyRound } = await import(process.argv[2])
+for await (const line of createInterface({ input: process.stdin })) {
+  const c = JSON.parse(line)
+  let out
+  try {
+    out = c.round ? pyRound(...c.round) : assessmentPayload(ARTIFACT, c.responses, c.context, 'id')
+  } catch (e) {
+    out = { error: String(e.message || e) }
+  }
+  process.stdout.write(JSON.stringify(out) + '\\n')
+}
+"""
+
+CONTEXTS = {
+    "teamSize": ["solo", "2-5", "6-15", "16-50", "50+", "team of 6-15", "12", "", None],
+    "meetingLoad": ["light", "Moderate", "HEAVY (20h+)", "none", "", None],
+    "hourlyRate": [85, 0, 100.5, "120", " 77.25 ", 33.3, 1e6, 0.1, None],
+    "platform": ["web", "google", None],
+}
+
+
+def parity_cases(model, seed=0):
+    rnd = random.Random(seed)
+    radix = [n + 1 for n in model.axis_sizes]
+    for counts in itertools.product(*(range(r) for r in radix)):
+        for placement in ("first", "random"):
+            responses = {}
+            for idxs, c in zip(model.axis_questions.values(), counts):
+                chosen = idxs[:c] if placement == "first" else rnd.sample(idxs, c)
+                for i in idxs:
+                    # anything but "A" counts as B, including a missing answer
+                    other = "B" if placement == "first" else rnd.choice(["B", "B", "a", 1, None])
+                    if i in chosen:
+                        responses[str(i)] = "A"
+                    elif other is not None:
+                        responses[str(i)] = other
+            context = {k: v for k, v in ((k, rnd.choice(vs)) for k, vs in CONTEXTS.items()) if v is not None}
+            yield {"responses": responses, "context": context}
+    for k in range(-40, 41):
+        for x in (k / 4, k / 2, k / 20, k * 2.5 + 0.05):
+            yield {"round": [x, 0]}
+            yield {"round": [x, 1]}
+    for _ in range(2000):
+        x = rnd.uniform(-1e4, 1e6)
+        yield {"round": [x, 0]}
+        yield {"round": [x, 1]}
+
+
+def expected(case):
+    from app import assessment_payload, assessment_row, format_responses
+
+    if "round" in case:
+        return round(*case["round"])
+    formatted = format_responses(case["responses"])
+    result = cps.score_assessment(formatted)
+    row = assessment_row("id", formatted, result, case["context"])
+    return json.loads(json.dumps(assessment_payload(row, result)))
+
+
+def check_parity(artifact, node):
+    with tempfile.TemporaryDirectory() as tmp:
+        module = Path(tmp) / MODULE_NAME
+        module.write_text(render_module(artifact), encoding="utf-8")
+        driver = Path(tmp) / "driver.mjs"
+        driver.write_text(DRIVER, encoding="utf-8")
+        cases = list(parity_cases(cps.current_model()))
+        proc = subprocess.run([node, str(driver), module.as_uri()], input="\n".join(json.dumps(c) for c in cases),
+                              capture_output=True, text=True, check=True)
+    outputs = [json.loads(line) for line in proc.stdout.splitlines()]
+    if len(outputs) != len(cases):
+        raise SystemExit(f"node returned {len(outputs)} results for {len(cases)} cases:\n{proc.stderr}")
+    failures = [(c, o, e) for c, o in zip(cases, outputs) if o != (e := expected(c))]
+    for case, got, want in failures[:10]:
+        print(f"MISMATCH {json.dumps(case)}\n  js:     {json.dumps(got)}\n  python: {json.dumps(want)}")
+    return len(cases), len(failures)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="verify the written modules and JS/Python parity instead of writing")
+    parser.add_argument("--node", default="node", help="node binary for --check")
+    args = parser.parse_args()
+
+    artifact = build()
+    text = render_module(artifact)
+    if not args.check:
+        for target in TARGETS:
+            (target / MODULE_NAME).write_text(text, encoding="utf-8")
+            print(f"wrote {(target / MODULE_NAME).relative_to(REPO)}")
+        print(f"model {artifact['model']}, scoring version {artifact['scoring_version']}: "
+              f"{len(artifact['outcomes']):,} numbers, {len(text.encode('utf-8')):,} bytes per module")
+        return 0
+
+    status = 0
+    for target in TARGETS:
+        path = target / MODULE_NAME
+        if not path.exists() or path.read_text(encoding="utf-8") != text:
+            print(f"STALE {path.relative_to(REPO)}: run python calm_profile_api/edge/build_artifact.py")
+            status = 1
+    node = shutil.which(args.node)
+    if node is None:
+        print(f"{args.node} not found; parity not checked")
+        return status
+    n, failed = check_parity(artifact, node)
+    print(f"parity: {n:,} cases, {failed} mismatches")
+    return 1 if failed else status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+// Scoring from a compiled artifact (see build_artifact.py): the /api/assess
+// result of calm_profile_system + cost_model, without Python. Every per-axis
+// count combination is precomputed, so scoring is one array lookup.
+
+// Python's round(): ties go to the even neighbour. Only ndigits 0 and 1 are
+// needed; a tie at one decimal is exactly representable only for odd quarters.
+export function pyRound(x, ndigits = 0) {
+  if (ndigits === 0) {
+    const floor = Math.floor(x)
+    const diff = x - floor
+    if (diff === 0.5) return floor % 2 === 0 ? floor : floor + 1
+    return Math.round(x)
+  }
+  if (ndigits === 1) {
+    if (Number.isInteger(x * 4) && (x * 4) % 2 !== 0) {
+      const tenths = Math.floor(x * 10)
+      return (tenths % 2 === 0 ? tenths : tenths + 1) / 10
+    }
+    return Number(x.toFixed(1))
+  }
+  throw new Error('pyRound supports ndigits 0 and 1')
+}
+
+// raw 'A' / 'B' answers keyed by question number -> the shared result object
+export function score(artifact, responses) {
+  const { axes, axis_questions, axis_scores, strides, archetypes, outcomes } = artifact
+  const counts = axis_questions.map(qs => qs.reduce((c, q) => c + (responses[String(q)] === 'A' ? 1 : 0), 0))
+  const k = archetypes.length
+  const offset = counts.reduce((i, c, a) => i + c * strides[a], 0) * (1 + 2 * k)
+  const primary = archetypes[outcomes[offset]]
+  const mix = {}
+  const match = {}
+  archetypes.forEach((a, j) => {
+    mix[a.key] = outcomes[offset + 1 + j]
+    match[a.key] = outcomes[offset + 1 + k + j]
+  })
+  return {
+    archetype: { primary: primary.key, mix, tagline: primary.tagline },
+    scores: {
+      axes: Object.fromEntries(axes.map((name, a) => [name, axis_scores[a][counts[a]]])),
+      match,
+    },
+    recommendations: { strengths: primary.strengths, quick_wins: primary.quick_wins },
+  }
+}
+
+// cost_model.context_cost
+export function contextCost(artifact, primary, context) {
+  const cost = artifact.cost
+  const get = key => (context[key] === undefined ? cost.defaults[key] : context[key])
+  // float(): numbers and numeric strings (non-finite rates fail later in Python too)
+  const rawRate = get('hourlyRate')
+  const rate = typeof rawRate === 'number' ? rawRate
+    : typeof rawRate === 'string' && rawRate.trim() !== '' ? Number(rawRate) : NaN
+  if (!Number.isFinite(rate)) throw new Error(`invalid hourlyRate: ${JSON.stringify(rawRate)}`)
+  const meeting = String(get('meetingLoad')).toLowerCase()
+  const meetingKey = Object.keys(cost.overhead_multipliers).find(m => meeting.includes(m)) ?? cost.default_meeting_load
+  const overheadIndex = cost.overhead_multipliers[meetingKey] * (cost.archetype_adjust[primary.toLowerCase()] ?? 1.0)
+  const team = String(get('teamSize'))
+  const teamKey = Object.keys(cost.team_multipliers).find(t => team.includes(t))
+  const tm = teamKey === undefined ? 1 : cost.team_multipliers[teamKey]
+  const hoursLost = overheadIndex * cost.hours_per_overhead
+  return { overheadIndex, hoursLost, annualCost: hoursLost * cost.weeks_per_year * rate * tm }
+}
+
+// the /api/assess response body for raw answers + context
+export function assessmentPayload(artifact, responses, context, assessmentId) {
+  const result = score(artifact, responses || {})
+  const { overheadIndex, hoursLost, annualCost } = contextCost(artifact, result.archetype.primary, context || {})
+  return {
+    success: true,
+    assessment_id: assessmentId,
+    archetype: result.archetype,
+    scores: { ...result.scores.axes, overhead_index: pyRound(overheadIndex * 100) },
+    metrics: { hours_lost_ppw: pyRound(hoursLost, 1), annual_cost: pyRound(annualCost) },
+    recommendations: result.recommendations,
+    tagline: result.archetype.tagline,
+  }
+}
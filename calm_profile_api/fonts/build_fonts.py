@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+build the offline font bundle for diagnostic reports.
+
+subsets the Inter / JetBrains Mono faces the report stylesheet uses down to
+the glyphs the template can actually print (template text, scoring model copy,
+printable ASCII for ids/dates/metrics) and writes them with a matching
+fonts.css into fonts/bundle/, which report_renderer loads from disk.
+
+source fonts are vendored in fonts/src/ (see fonts/src/README.md): the static
+TTFs from https://github.com/rsms/inter/releases and
+https://github.com/JetBrains/JetBrainsMono/releases, with each family's SIL
+OFL text, which is copied into the bundle next to the subsets. a missing
+file, or a file whose name table isn't the family it should be, is an error
+(exit 1), so a deploy build that runs this can't ship system fonts.
+
+--check verifies an existing bundle against its manifest instead (every
+file present with the recorded sha256, licenses included).
+
+usage:
+    python fonts/build_fonts.py [--src fonts/src] [--out fonts/bundle]
+    python fonts/build_fonts.py --check [--out fonts/bundle]
+"""
+
+import argparse
+import hashlib
+import json
+import shutil
+import string
+import sys
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+API_DIR = HERE.parent
+sys.path.insert(0, str(API_DIR))
+
+from calm_profile_system import available_models, load_model  # noqa: E402
+from report_renderer import TEMPLATE_DIR, TEMPLATE_NAME, STYLESHEET_NAME  # noqa: E402
+
+# (family, weight, style, source file) — the faces the report stylesheet asks for
+FACES = [
+    ("Inter", 400, "normal", "Inter-Regular.ttf"),
+    ("Inter", 400, "italic", "Inter-Italic.ttf"),
+    ("Inter", 600, "normal", "Inter-SemiBold.ttf"),
+    ("Inter", 700, "normal", "Inter-Bold.ttf"),
+    ("JetBrains Mono", 500, "normal", "JetBrainsMono-Medium.ttf"),
+]
+
+# the OFL text each family ships with, vendored next to the fonts
+LICENSES = {"Inter": "OFL-Inter.txt", "JetBrains Mono": "OFL-JetBrainsMono.txt"}
+
+
+def report_charset() -> str:
+    """every character a rendered report can contain"""
+    chars = set(string.ascii_letters + string.digits + string.punctuation + " ")
+    chars |= set((TEMPLATE_DIR / TEMPLATE_NAME).read_text(encoding="utf-8"))
+    chars |= set((TEMPLATE_DIR / STYLESHEET_NAME).read_text(encoding="utf-8"))
+    # every model version's copy, so switching SCORING_MODEL needs no font rebuild
+    for arche in (a for v in available_models() for a in load_model(v).archetypes.values()):
+        for text in [arche["name"], arche.get("tagline", ""), *arche["strengths"], *arche["quick_wins"]]:
+            chars |= set(text) | set(text.title()) | set(text.lower())
+    return "".join(sorted(c for c in chars if c.isprintable()))
+
+
+def family_name(path: Path) -> str:
+    """the font's typographic family (name id 16), else its family name (id 1)"""
+    from fontTools.ttLib import TTFont
+
+    names = TTFont(str(path), lazy=True)["name"]
+    return str(names.getDebugName(16) or names.getDebugName(1) or "")
+
+
+def source_errors(src: Path) -> list:
+    errors = [f"missing {name}" for name in sorted(set(LICENSES.values())) if not (src / name).exists()]
+    for family, _, _, name in FACES:
+        if not (src / name).exists():
+            errors.append(f"missing {name}")
+        elif family_name(src / name) != family:
+            errors.append(f"{name} is {family_name(src / name)!r}, not {family!r}")
+    return errors
+
+
+def check_bundle(out: Path) -> list:
+    """problems with a built bundle; empty when it matches its manifest"""
+    if not (out / "manifest.json").exists():
+        return [f"no bundle in {out} (run fonts/build_fonts.py)"]
+    manifest = json.loads((out / "manifest.json").read_text(encoding="utf-8"))
+    errors = []
+    for name in ["fonts.css", *(f"LICENSE-{n}" for n in sorted(set(LICENSES.values())))]:
+        if not (out / name).exists():
+            errors.append(f"missing {name}")
+    for name, meta in manifest["files"].items():
+        path = out / name
+        if not path.exists():
+            errors.append(f"missing {name}")
+        elif hashlib.sha256(path.read_bytes()).hexdigest() != meta["sha256"]:
+            errors.append(f"{name} doesn't match the manifest")
+    return errors
+
+
+def subset_font(src: Path, dst: Path, text: str) -> None:
+    from fontTools import subset
+
+    options = subset.Options()
+    options.hinting = False          # pdf output doesn't use hints
+    options.desubroutinize = True
+    options.layout_features = ["kern", "liga", "calt", "tnum"]
+    font = subset.load_font(str(src), options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=text)
+    subsetter.subset(font)
+    subset.save_font(font, str(dst), options)
+
+
+def build(src: Path, out: Path) -> str:
+    """subset every face from src into out, with fonts.css, the licenses and manifest.json; returns the charset"""
+    text = report_charset()
+    out.mkdir(parents=True, exist_ok=True)
+    rules, files = [], {}
+    for family, weight, style, name in FACES:
+        out_name = name.replace(".ttf", ".subset.ttf")
+        subset_font(src / name, out / out_name, text)
+        data = (out / out_name).read_bytes()
+        files[out_name] = {"bytes": len(data), "sha256": hashlib.sha256(data).hexdigest()}
+        rules.append(
+            "@font-face {\n"
+            f"    font-family: '{family}';\n"
+            f"    font-weight: {weight};\n"
+            f"    font-style: {style};\n"
+            f"    src: url('{out_name}');\n"
+            "}\n"
+        )
+        src_size = (src / name).stat().st_size
+        print(f"{out_name}: {src_size:,} -> {len(data):,} bytes")
+
+    for name in sorted(set(LICENSES.values())):
+        shutil.copyfile(src / name, out / f"LICENSE-{name}")
+    (out / "fonts.css").write_text("\n".join(rules), encoding="utf-8")
+    (out / "manifest.json").write_text(json.dumps({"charset": text, "files": files}, indent=2), encoding="utf-8")
+    return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--src", type=Path, default=HERE / "src")
+    parser.add_argument("--out", type=Path, default=HERE / "bundle")
+    parser.add_argument("--check", action="store_true", help="verify the bundle in --out; build nothing")
+    args = parser.parse_args()
+
+    if args.check:
+        errors = check_bundle(args.out)
+        for e in errors:
+            print(f"error: {e}")
+        if errors:
+            sys.exit(1)
+        print(f"bundle in {args.out} is complete")
+        return
+
+    errors = source_errors(args.src)
+    if errors:
+        print(f"error: source fonts in {args.src} (see fonts/src/README.md):")
+        for e in errors:
+            print(f"  {e}")
+        sys.exit(1)
+
+    text = build(args.src, args.out)
+    print(f"bundle written to {args.out} ({len(text)} glyphs per face)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+gunicorn settings for the Flask app: gunicorn -c gunicorn.conf.py
+
+The app is built once in the master (preload_app) and the workers fork from
+it, sharing its memory copy-on-write: imported modules, the scoring outcome
+table and the pre-encoded JSON are not rebuilt per worker, so a new worker
+serves almost immediately. Workers, bind address and timeouts keep
+gunicorn's own defaults and environment (WEB_CONCURRENCY, PORT,
+GUNICORN_CMD_ARGS).
+
+Nothing that holds a socket or a thread may cross the fork. create_app()
+opens no database connection, and post_fork throws away the engine's pool
+anyway; the write-behind, metrics and render threads start lazily in each
+worker.
+
+Run `flask --app app init-db` before starting (render.yaml does).
+"""
+
+import gc
+import os
+import tempfile
+
+wsgi_app = "app:create_app()"
+preload_app = True
+
+# one metrics directory per master, shared by its workers (see request_metrics)
+os.environ.setdefault("METRICS_DIR", os.path.join(tempfile.gettempdir(), f"calm-profile-metrics-{os.getpid()}"))
+
+
+def when_ready(server):
+    # the preloaded objects live as long as the master: keep the gc from
+    # touching them, which would dirty (and copy) their pages in every worker
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    from models import db
+
+    with server.app.wsgi().app_context():
+        # pool connections opened in the master must not be shared; close=False leaves them to it
+        db.engine.dispose(close=False)
@@ -0,0 +1,61 @@
+"""
+Faster JSON for the Flask app.
+
+OrjsonProvider does the response encoding and request parsing with orjson
+and keeps DefaultJSONProvider's output rules (sorted keys, Flask's default()
+for dates/decimals/uuids, compact unless debug, trailing newline from
+response()). Its output differs from the stdlib's only in escaping: non-ASCII
+text is sent as UTF-8 rather than \\u escapes. See benchmarks/bench_json.py.
+
+JSON_PROVIDER picks one: "orjson" (default; pinned in requirements.txt, falls
+back to "stdlib" with a warning when it isn't installed) or "stdlib" (Flask's
+DefaultJSONProvider).
+"""
+
+import logging
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+log = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # optional: the stdlib provider is used instead
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    # datetimes go through Flask's default() (HTTP dates), like the stdlib provider
+    OPTIONS = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if orjson else 0
+
+    def encode(self, obj: Any, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, default=self.default, option=self.OPTIONS | orjson.OPT_INDENT_2 if indent else self.OPTIONS)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            # json.dumps options (e.g. from the tojson filter): the stdlib path
+            return super().dumps(obj, **kwargs)
+        return self.encode(obj).decode("utf-8")
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self.encode(obj, indent) + b"\n", mimetype=self.mimetype)
+
+
+PROVIDERS = {"orjson": OrjsonProvider, "stdlib": DefaultJSONProvider}
+
+
+def provider_class(name: str = "orjson"):
+    if name not in PROVIDERS:
+        raise ValueError(f"unknown JSON provider {name!r} (choose from {', '.join(PROVIDERS)})")
+    if name == "orjson" and orjson is None:
+        log.warning("orjson is not installed; using the stdlib JSON provider")
+        return DefaultJSONProvider
+    return PROVIDERS[name]
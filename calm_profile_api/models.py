@@ -0,0 +1,77 @@
+"""
+Database extension, the assessments model and schema creation.
+
+Nothing here touches the database on import: init_db() (the `flask init-db`
+command) creates or upgrades the schema as an explicit deploy step, including
+swapping indexes that newer ones supersede (SUPERSEDED_INDEXES).
+"""
+
+from datetime import datetime
+
+from flask_sqlalchemy import SQLAlchemy
+
+from assessment_storage import add_missing_columns, create_missing_indexes, drop_indexes
+import rollups
+
+db = SQLAlchemy()
+
+
+class Assessment(db.Model):
+    __tablename__ = "assessments"
+    __table_args__ = (
+        # team size filters, optionally within a time window (a plain team_size index
+        # makes sqlite scan it for every grouped time-window query)
+        db.Index("ix_assessments_team_size_created_at", "team_size", "created_at"),
+        # keyset pages of /api/assessments, newest first, unfiltered or by one filter:
+        # each is a single range scan of one of these, however deep the page
+        db.Index("ix_assessments_created_at_id", "created_at", "id"),
+        db.Index("ix_assessments_email_created_at_id", "email", "created_at", "id"),
+        db.Index("ix_assessments_payment_status_created_at_id", "payment_status", "created_at", "id"),
+        db.Index("ix_assessments_report_sent_created_at_id", "report_sent", "created_at", "id"),
+    )
+    id = db.Column(db.String(36), primary_key=True)
+    email = db.Column(db.String(255))
+    archetype_primary = db.Column(db.String(32), index=True)
+    overhead_index = db.Column(db.Float)
+    hours_lost = db.Column(db.Float)
+    annual_cost = db.Column(db.Float)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    report_sent = db.Column(db.Boolean, default=False)
+    payment_status = db.Column(db.String(20), default="pending")
+
+    # schema_version 2: typed columns (see assessment_storage)
+    schema_version = db.Column(db.SmallInteger)
+    responses_mask = db.Column(db.Integer)
+    axis_structure = db.Column(db.SmallInteger)
+    axis_collaboration = db.Column(db.SmallInteger)
+    axis_scope = db.Column(db.SmallInteger)
+    axis_tempo = db.Column(db.SmallInteger)
+    mix_architect = db.Column(db.SmallInteger)
+    mix_conductor = db.Column(db.SmallInteger)
+    mix_curator = db.Column(db.SmallInteger)
+    mix_craftsperson = db.Column(db.SmallInteger)
+    team_size = db.Column(db.String(32))
+    meeting_load = db.Column(db.String(32))
+    hourly_rate = db.Column(db.Float)
+    platform = db.Column(db.String(32))
+
+    # schema_version 1 (NULL): JSON blobs, kept for rows not yet migrated
+    archetype_mix = db.Column(db.JSON(none_as_null=True))
+    axis_scores = db.Column(db.JSON(none_as_null=True))
+    raw_responses = db.Column(db.JSON(none_as_null=True))
+    context_data = db.Column(db.JSON(none_as_null=True))
+
+
+# single-column indexes that are prefixes of the composite ones above; init_db drops them
+SUPERSEDED_INDEXES = ("ix_assessments_email", "ix_assessments_created_at", "ix_assessments_payment_status")
+
+
+def init_db(engine):
+    """create missing tables, columns and indexes, drop superseded indexes (idempotent); returns the changes made"""
+    db.metadata.create_all(engine)
+    with engine.begin() as conn:
+        changes = [f"added column {c}" for c in add_missing_columns(conn, Assessment.__table__)]
+    changes += [f"created index {n}" for n in create_missing_indexes(engine, Assessment.__table__)]
+    changes += [f"dropped index {n}" for n in drop_indexes(engine, Assessment.__table__, SUPERSEDED_INDEXES)]
+    rollups.metadata.create_all(engine)
+    return changes
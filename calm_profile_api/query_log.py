@@ -0,0 +1,137 @@
+"""
+SQL statement instrumentation.
+
+instrument(engine) hooks the engine's cursor events:
+
+    - every statement run while serving a request is counted and timed on
+      that request's Timings (request_metrics), which feeds Server-Timing and
+      the per-route calm_db_* metrics;
+    - with slow_query_ms set (SQL_SLOW_QUERY_MS), statements at or over the
+      threshold are logged to the "calm.sql.slow" logger with normalized SQL
+      (literals and placeholders -> ?, IN lists and multi-row VALUES
+      collapsed) and the bind shape (names and types, never values: binds
+      carry emails);
+    - count_queries() / assert_max_queries() collect statements in tests, so
+      an N+1 regression fails instead of just getting slower.
+
+With no request, no threshold and no counter active the hooks return
+immediately.
+"""
+
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from sqlalchemy import event
+
+from request_metrics import current
+
+slow_log = logging.getLogger("calm.sql.slow")
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<![:\w]):\w+|\?")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])")
+_GROUP = re.compile(r"\(\?(?:, \?)+\)")
+_REPEATED_GROUPS = re.compile(r"(\(\?(?:, \.\.\.)?\))(?:, \1)+")
+
+
+def normalize_sql(statement: str) -> str:
+    """one line, literals and placeholders as ?, repeated lists collapsed: equal for equal query shapes"""
+    sql = _WHITESPACE.sub(" ", statement).strip()
+    sql = _STRING.sub("?", sql)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _GROUP.sub("(?, ...)", sql)
+    return _REPEATED_GROUPS.sub(r"\1, ...", sql)
+
+
+def _shape(params) -> str:
+    if isinstance(params, dict):
+        return "{" + ", ".join(f"{k}: {type(v).__name__}" for k, v in params.items()) + "}"
+    if isinstance(params, (list, tuple)):
+        return "(" + ", ".join(type(v).__name__ for v in params) + ")"
+    return type(params).__name__
+
+
+def bind_shape(parameters, executemany: bool = False, limit: int = 300) -> str:
+    """bind parameter names and types, e.g. {id_1: str} or 250 x {id: str, email: NoneType, ...}"""
+    if executemany and isinstance(parameters, (list, tuple)):
+        shape = f"{len(parameters)} x {_shape(parameters[0]) if parameters else '()'}"
+    elif parameters is None:
+        shape = "()"
+    else:
+        shape = _shape(parameters)
+    return shape if len(shape) <= limit else shape[:limit] + "..."
+
+
+# --- test support ---
+
+class QueryCounter:
+    def __init__(self):
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+_counters: List[QueryCounter] = []
+_counters_lock = threading.Lock()
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """collect the normalized statements every instrumented engine runs inside the block"""
+    counter = QueryCounter()
+    with _counters_lock:
+        _counters.append(counter)
+    try:
+        yield counter
+    finally:
+        with _counters_lock:
+            _counters.remove(counter)
+
+
+@contextmanager
+def assert_max_queries(n: int) -> Iterator[QueryCounter]:
+    with count_queries() as counter:
+        yield counter
+    if counter.count > n:
+        listing = "\n".join(f"  {s}" for s in counter.statements)
+        raise AssertionError(f"{counter.count} queries, expected at most {n}:\n{listing}")
+
+
+# --- hooks ---
+
+def instrument(engine, slow_query_ms: Optional[float] = None) -> None:
+    slow = slow_query_ms / 1000.0 if slow_query_ms is not None else None
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if slow is not None or _counters or current() is not None:
+            # on the execution context: a statement that raises never reaches _after
+            context._query_log_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_query_log_started", None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+
+        timings = current()
+        if timings is not None:
+            timings.db_seconds += elapsed
+            timings.db_queries += 1
+        if _counters:
+            normalized = normalize_sql(statement)
+            for counter in list(_counters):
+                counter.statements.append(normalized)
+        if slow is not None and elapsed >= slow:
+            slow_log.warning("slow query %.1f ms [%s] %s | binds %s", elapsed * 1000.0,
+                             timings.label if timings is not None else "-",
+                             normalize_sql(statement), bind_shape(parameters, executemany))
@@ -0,0 +1,372 @@
+"""
+Diagnostic report rendering.
+
+ReportRenderer keeps the compiled jinja template, the parsed stylesheets and
+the WeasyPrint font configuration for the life of the process, so only the
+per-report layout is paid on each render. Fonts come from the local subset
+bundle (fonts/build_fonts.py) and rendering never touches the network.
+
+RenderPool runs renderers in warm worker processes. A worker retires itself
+after `max_renders` reports or once its RSS passes `max_rss_mb`, and the
+pool starts a fresh one in its place.
+"""
+
+import hashlib
+import itertools
+import logging
+import multiprocessing as mp
+import os
+import queue
+import resource
+import threading
+from concurrent.futures import Future
+from datetime import datetime
+from pathlib import Path
+from multiprocessing.connection import wait
+from typing import Any, Dict, List, Optional
+
+log = logging.getLogger(__name__)
+
+TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+TEMPLATE_NAME = "diagnostic_report.html"
+STYLESHEET_NAME = "diagnostic_report.css"
+
+# subset fonts built by fonts/build_fonts.py
+FONT_BUNDLE_DIR = Path(__file__).resolve().parent / "fonts" / "bundle"
+GOOGLE_FONTS_CSS = (
+    "@import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700"
+    "&family=JetBrains+Mono:wght@400;500&display=swap');"
+)
+
+SAMPLE_DATA = {
+    "assessment_id": "warmup",
+    "archetype": {"primary": "conductor", "tagline": "orchestrators of collaborative excellence", "confidence": 72.5},
+    "metrics": {"hours_lost_ppw": 4.2, "annual_cost": 221000},
+    "recommendations": {"quick_wins": ["Define decision owners"], "strengths": ["Team coordination"]},
+}
+
+
+def offline_url_fetcher(url: str, *args, **kwargs):
+    """weasyprint url fetcher that only resolves local files and data: urls"""
+    from weasyprint import default_url_fetcher
+
+    if not url.startswith(("file:", "data:")):
+        raise ValueError(f"network access disabled for report rendering: {url}")
+    return default_url_fetcher(url, *args, **kwargs)
+
+
+def template_version() -> str:
+    """hash of everything that shapes a rendered report besides its data"""
+    h = hashlib.sha256()
+    for path in (TEMPLATE_DIR / TEMPLATE_NAME, TEMPLATE_DIR / STYLESHEET_NAME, FONT_BUNDLE_DIR / "manifest.json"):
+        h.update(path.name.encode())
+        h.update(path.read_bytes() if path.exists() else b"-")
+    return h.hexdigest()[:16]
+
+
+class ReportRenderer:
+    """
+    font_source: "bundle" (local subset fonts, system fonts if the bundle
+    isn't built), "system", or "google" (the old remote @import; network).
+    """
+
+    def __init__(self, font_source: str = "bundle"):
+        import jinja2
+        import weasyprint
+        from weasyprint.text.fonts import FontConfiguration
+
+        self._weasyprint = weasyprint
+        env = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(str(TEMPLATE_DIR)),
+            autoescape=jinja2.select_autoescape(["html"]),
+        )
+        self.template = env.get_template(TEMPLATE_NAME)
+        self.font_config = FontConfiguration()
+        self.url_fetcher = weasyprint.default_url_fetcher if font_source == "google" else offline_url_fetcher
+
+        self.stylesheets = []
+        if font_source == "google":
+            self.stylesheets.append(weasyprint.CSS(string=GOOGLE_FONTS_CSS, font_config=self.font_config))
+        elif font_source == "bundle":
+            if (FONT_BUNDLE_DIR / "fonts.css").exists():
+                self.stylesheets.append(weasyprint.CSS(
+                    filename=str(FONT_BUNDLE_DIR / "fonts.css"),
+                    font_config=self.font_config,
+                    url_fetcher=offline_url_fetcher,
+                ))
+            else:
+                log.warning("font bundle not built (python fonts/build_fonts.py); using system fonts")
+        self.stylesheets.append(weasyprint.CSS(
+            filename=str(TEMPLATE_DIR / STYLESHEET_NAME),
+            font_config=self.font_config,
+            url_fetcher=self.url_fetcher,
+        ))
+
+    def render_html(self, assessment_data: Dict[str, Any], current_date: Optional[str] = None) -> str:
+        # current_date="" leaves the date out (content-addressed renders)
+        if current_date is None:
+            current_date = datetime.now().strftime("%b %d, %Y at %I:%M %p")
+        return self.template.render(assessment_data=assessment_data, current_date=current_date)
+
+    def render(self, assessment_data: Dict[str, Any], current_date: Optional[str] = None) -> bytes:
+        html = self._weasyprint.HTML(
+            string=self.render_html(assessment_data, current_date),
+            base_url=str(TEMPLATE_DIR),
+            url_fetcher=self.url_fetcher,
+        )
+        return html.write_pdf(stylesheets=self.stylesheets, font_config=self.font_config)
+
+    def warm(self) -> None:
+        """one throwaway render so font discovery and layout caches are hot"""
+        self.render(SAMPLE_DATA)
+
+
+_renderer: Optional[ReportRenderer] = None
+
+
+def get_renderer() -> ReportRenderer:
+    """the process-wide renderer, created on first use"""
+    global _renderer
+    if _renderer is None:
+        _renderer = ReportRenderer()
+    return _renderer
+
+
+def render_pdf(assessment_data: Dict[str, Any], current_date: Optional[str] = None) -> bytes:
+    return get_renderer().render(assessment_data, current_date)
+
+
+def _rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        # peak rather than current, but still a bound (KB on linux, bytes on macOS)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if peak > 2**32 else peak / 1024
+
+
+def _worker_main(conn, max_renders: int, max_rss_mb: float) -> None:
+    renderer = get_renderer()
+    renderer.warm()
+    renders = 0
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        job_id, data, current_date = task
+        try:
+            outcome = (True, renderer.render(data, current_date))
+        except Exception as e:
+            outcome = (False, f"{type(e).__name__}: {e}")
+        renders += 1
+        # say so in the reply, so the pool never hands a retiring worker another job
+        retiring = renders >= max_renders or bool(max_rss_mb and _rss_mb() > max_rss_mb)
+        conn.send((job_id, *outcome, retiring))
+        if retiring:
+            return
+
+
+class RenderError(RuntimeError):
+    pass
+
+
+class _Worker:
+    __slots__ = ("proc", "conn", "job", "stopping", "served")
+
+    def __init__(self, proc, conn):
+        self.proc = proc
+        self.conn = conn
+        self.job: Optional[int] = None
+        self.stopping = False
+        self.served = False
+
+
+class RenderPool:
+    """
+    Warm render processes behind a bounded job queue. Each worker has its
+    own pipe, so the pool always knows which job a worker holds and can fail
+    exactly that job if the worker dies mid-render.
+    """
+
+    MAX_STARTUP_FAILURES = 3
+
+    def __init__(self, workers: int = 2, max_renders: int = 200, max_rss_mb: float = 500, queue_size: int = 64):
+        self.workers = workers
+        self.max_renders = max_renders
+        self.max_rss_mb = max_rss_mb
+        self.pid = os.getpid()
+
+        # spawn, not fork: the parent is a threaded web worker
+        self._ctx = mp.get_context("spawn")
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._futures: Dict[int, Future] = {}
+        self._workers: List[_Worker] = []
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._wake_r, self._wake_w = self._ctx.Pipe(duplex=False)
+        self._closing = False
+
+        self.rendered = 0
+        self.failed = 0
+        self.recycled = 0
+        self.crashed = 0
+        # workers dying before their first reply (e.g. weasyprint can't load) stop the respawning
+        self._startup_failures = 0
+        self.broken = False
+
+        for _ in range(workers):
+            self._spawn()
+        self._thread = threading.Thread(target=self._dispatch, name="render-pool", daemon=True)
+        self._thread.start()
+
+    def _spawn(self) -> None:
+        parent, child = self._ctx.Pipe()
+        proc = self._ctx.Process(target=_worker_main, args=(child, self.max_renders, self.max_rss_mb), daemon=True)
+        proc.start()
+        child.close()
+        self._workers.append(_Worker(proc, parent))
+
+    def _wake(self) -> None:
+        with self._lock:
+            self._wake_w.send_bytes(b"!")
+
+    def submit(self, assessment_data: Dict[str, Any], current_date: Optional[str] = None, timeout: float = 30.0) -> Future:
+        """queue a render; blocks (up to timeout) while the bounded queue is full"""
+        if self.broken:
+            raise RenderError("render workers fail to start")
+        if self._closing:
+            raise RenderError("render pool is closed")
+        fut: Future = Future()
+        job_id = next(self._ids)
+        self._futures[job_id] = fut
+        try:
+            self._queue.put((job_id, assessment_data, current_date), timeout=timeout)
+        except queue.Full:
+            self._futures.pop(job_id, None)
+            raise RenderError("render queue is full")
+        self._wake()
+        return fut
+
+    def render(self, assessment_data: Dict[str, Any], current_date: Optional[str] = None, timeout: float = 60.0) -> bytes:
+        return self.submit(assessment_data, current_date).result(timeout=timeout)
+
+    # --- dispatcher thread ---
+
+    def _dispatch(self) -> None:
+        while self._workers or not self._closing:
+            for w in self._workers:
+                if w.job is not None or w.stopping:
+                    continue
+                if self._closing:
+                    w.stopping = True
+                    try:
+                        w.conn.send(None)
+                    except OSError:
+                        pass  # already dead; its sentinel fires below
+                    continue
+                try:
+                    task = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                w.job = task[0]
+                try:
+                    w.conn.send(task)
+                except OSError:
+                    pass  # died while idle: _on_exit fails the job
+
+            by_conn = {w.conn: w for w in self._workers}
+            by_sentinel = {w.proc.sentinel: w for w in self._workers}
+            ready = wait([self._wake_r, *by_conn, *by_sentinel], timeout=1.0)
+            # messages before deaths, so a worker that answered and then exited isn't blamed
+            for obj in sorted(ready, key=lambda o: o in by_sentinel):
+                if obj is self._wake_r:
+                    while self._wake_r.poll():
+                        self._wake_r.recv_bytes()
+                elif obj in by_conn:
+                    self._on_message(by_conn[obj])
+                else:
+                    self._on_exit(by_sentinel[obj])
+
+        reason = "render workers fail to start" if self.broken else "render pool is closed"
+        while not self._queue.empty():
+            self._resolve(self._queue.get_nowait()[0], (False, reason))
+
+    def _on_message(self, w: _Worker) -> None:
+        if w not in self._workers:
+            return
+        try:
+            job_id, ok, value, retiring = w.conn.recv()
+        except (EOFError, OSError):
+            return self._on_exit(w)
+        w.job = None
+        w.served = True
+        self._startup_failures = 0
+        if retiring:
+            w.stopping = True
+        self._resolve(job_id, (ok, value))
+
+    def _on_exit(self, w: _Worker) -> None:
+        if w not in self._workers:
+            return
+        self._remove(w)
+        w.proc.join(timeout=5)
+        if w.job is not None:
+            self._resolve(w.job, (False, f"render worker {w.proc.pid} exited with code {w.proc.exitcode}"))
+        if self._closing:
+            return
+        if w.stopping and w.job is None:
+            self.recycled += 1
+        else:
+            self.crashed += 1
+            log.warning("render worker %s died (exit code %s); restarting", w.proc.pid, w.proc.exitcode)
+        if not w.served:
+            self._startup_failures += 1
+            if self._startup_failures >= self.MAX_STARTUP_FAILURES:
+                log.error("render workers keep failing to start; giving up")
+                self.broken = True
+                self._closing = True
+                return
+        self._spawn()
+
+    def _remove(self, w: _Worker) -> None:
+        self._workers.remove(w)
+        w.conn.close()
+
+    def _resolve(self, job_id: int, outcome) -> None:
+        fut = self._futures.pop(job_id, None)
+        if fut is None:
+            return
+        ok, value = outcome
+        if ok:
+            self.rendered += 1
+            fut.set_result(value)
+        else:
+            self.failed += 1
+            fut.set_exception(RenderError(value))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": len(self._workers),
+            "queued": self._queue.qsize(),
+            "pending": len(self._futures),
+            "rendered": self.rendered,
+            "failed": self.failed,
+            "recycled": self.recycled,
+            "crashed": self.crashed,
+            "broken": self.broken,
+        }
+
+    def close(self, timeout: float = 30.0) -> None:
+        """let in-flight renders finish, stop the workers, fail anything still queued"""
+        if self._closing or self.pid != os.getpid():
+            return
+        self._closing = True
+        self._wake()
+        self._thread.join(timeout=timeout)
+        for w in list(self._workers):
+            if w.proc.is_alive():
+                w.proc.terminate()
@@ -0,0 +1,130 @@
+"""
+Content-addressed store for rendered report PDFs.
+
+A report's content depends only on the template (html, css, font bundle),
+the archetype and the numbers derived from the answers, so two
+assessments with the same inputs share one PDF. The key is a hash of
+exactly those inputs; per-assessment details (id, generation date) are
+left out of stored renders.
+
+Files live under root/<key[:2]>/<key>.pdf. Reads bump the file's mtime,
+and once the directory grows past max_bytes the least recently read files
+are removed until it is back under 90% of the budget. Several workers can
+share one directory: writes go through a temp file and rename.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from report_renderer import template_version
+
+log = logging.getLogger(__name__)
+
+# the parts of report_data that make it into a stored render
+CONTENT_KEYS = ("archetype", "metrics", "recommendations")
+
+
+def report_content(assessment_data: Dict[str, Any]) -> Dict[str, Any]:
+    """report_data without the per-assessment identity"""
+    return {k: assessment_data[k] for k in CONTENT_KEYS}
+
+
+class ReportStore:
+    def __init__(self, root, max_bytes: int = 512 * 1024 * 1024):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.version = template_version()
+        self._lock = threading.Lock()
+        self._bytes: Optional[int] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def key(self, content: Dict[str, Any]) -> str:
+        blob = json.dumps({"template": self.version, **content}, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.pdf"
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self.path(key)
+        try:
+            pdf = path.read_bytes()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass  # evicted by another worker meanwhile; we still have the bytes
+        self.hits += 1
+        return pdf
+
+    def put(self, key: str, pdf: bytes) -> None:
+        path = self.path(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(pdf)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self.stores += 1
+        with self._lock:
+            if self._bytes is not None:
+                self._bytes += len(pdf)
+            if self.size() > self.max_bytes:
+                self._evict()
+
+    def size(self) -> int:
+        """bytes on disk; counted once, then tracked (other workers' writes show up at the next eviction)"""
+        if self._bytes is None:
+            self._bytes = sum(f.stat().st_size for f in self.root.glob("*/*.pdf"))
+        return self._bytes
+
+    def _evict(self) -> None:
+        files = []
+        for f in self.root.glob("*/*.pdf"):
+            try:
+                st = f.stat()
+            except FileNotFoundError:
+                continue
+            files.append((st.st_mtime, st.st_size, f))
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        target = int(self.max_bytes * 0.9)
+        for _, size, f in files:
+            if total <= target:
+                break
+            try:
+                f.unlink()
+                self.evictions += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._bytes = total
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "template_version": self.version,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "bytes": self.size(),
+            "max_bytes": self.max_bytes,
+        }
@@ -0,0 +1,301 @@
+"""
+Per-request phase timing and Prometheus metrics.
+
+Handlers wrap their steps in `with phase("score"):`. Every phase, the time
+spent in SQL (counted by query_log's engine hooks) and the whole request go
+out in a Server-Timing header, in milliseconds:
+
+    Server-Timing: parse;dur=0.081, cache;dur=0.012, score;dur=0.049, save;dur=1.920, sql;dur=0.412, total;dur=2.310
+
+Each worker also keeps per-route counters (requests by status, errors, SQL
+queries and time) and fixed-bucket latency histograms for the request and
+for each phase. Gunicorn workers are separate processes, so a background
+thread in every worker writes its totals to <directory>/<pid>.json every
+flush_interval seconds (and at exit), and collect() sums every file in the
+directory. Files of exited workers stay, so counters never go backwards when
+gunicorn recycles a worker; point each deployment at its own directory
+(the default is one per gunicorn master, under the temp dir).
+
+Recording costs a few perf_counter() calls and dict updates per request;
+files are only written off the request path.
+"""
+
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+# seconds; the last bucket (+Inf) is implicit
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HELP = {
+    "calm_http_requests_total": ("counter", "requests by route, method and status"),
+    "calm_http_request_errors_total": ("counter", "requests that raised or answered 5xx"),
+    "calm_http_request_duration_seconds": ("histogram", "time from routing to response"),
+    "calm_http_request_phase_seconds": ("histogram", "time per instrumented phase of a request"),
+    "calm_db_queries_total": ("counter", "SQL statements executed while serving requests"),
+    "calm_db_query_seconds_total": ("counter", "time spent executing SQL while serving requests"),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def default_directory() -> str:
+    # gunicorn workers share their master as parent, so each master gets a fresh directory
+    return os.path.join(tempfile.gettempdir(), f"calm-profile-metrics-{os.getppid()}")
+
+
+# --- per-request timings ---
+
+class Timings:
+    __slots__ = ("label", "started", "phases", "db_seconds", "db_queries")
+
+    def __init__(self, label: str = ""):
+        self.label = label
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.db_seconds = 0.0
+        self.db_queries = 0
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def server_timing(self, total: float) -> str:
+        parts = [f"{name};dur={s * 1000:.3f}" for name, s in self.phases.items()]
+        if self.db_queries:
+            parts.append(f"sql;dur={self.db_seconds * 1000:.3f}")
+        parts.append(f"total;dur={total * 1000:.3f}")
+        return ", ".join(parts)
+
+
+_current: ContextVar[Optional[Timings]] = ContextVar("request_timings", default=None)
+
+
+def current() -> Optional[Timings]:
+    return _current.get()
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """time a block as one phase of the current request (no-op outside a request)"""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.phases[name] = timings.phases.get(name, 0.0) + time.perf_counter() - started
+
+
+# --- aggregation ---
+
+class Metrics:
+    def __init__(self, directory: Optional[str] = None, flush_interval: float = 5.0):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._histograms: Dict[Tuple[str, Labels], List[Any]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._pid: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        atexit.register(self.flush)
+
+    # --- recording ---
+
+    def inc(self, name: str, labels: Labels, value: float = 1) -> None:
+        with self._lock:
+            self._inc(name, labels, value)
+
+    def observe(self, name: str, labels: Labels, seconds: float) -> None:
+        with self._lock:
+            self._observe(name, labels, seconds)
+
+    def record(self, route: str, method: str, status: int, timings: Timings, total: float) -> None:
+        self._ensure_started()
+        rm = (("route", route), ("method", method))
+        with self._lock:
+            self._inc("calm_http_requests_total", rm + (("status", str(status)),))
+            if status >= 500:
+                self._inc("calm_http_request_errors_total", rm)
+            self._observe("calm_http_request_duration_seconds", rm, total)
+            for name, seconds in timings.phases.items():
+                self._observe("calm_http_request_phase_seconds", (("route", route), ("phase", name)), seconds)
+            if timings.db_queries:
+                self._inc("calm_db_queries_total", (("route", route),), timings.db_queries)
+                self._inc("calm_db_query_seconds_total", (("route", route),), timings.db_seconds)
+
+    # callers hold self._lock
+
+    def _inc(self, name: str, labels: Labels, value: float = 1) -> None:
+        key = (name, labels)
+        self._counters[key] = self._counters.get(key, 0) + value
+        self._dirty = True
+
+    def _observe(self, name: str, labels: Labels, seconds: float) -> None:
+        key = (name, labels)
+        h = self._histograms.get(key)
+        if h is None:
+            h = self._histograms[key] = [[0] * (len(BUCKETS) + 1), 0.0, 0]
+        h[0][bisect_left(BUCKETS, seconds)] += 1
+        h[1] += seconds
+        h[2] += 1
+        self._dirty = True
+
+    # --- sharing between workers ---
+
+    def _ensure_started(self) -> None:
+        # one flusher per worker; state inherited across fork belongs to the parent
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            with self._lock:
+                self._counters.clear()
+                self._histograms.clear()
+            self._pid = os.getpid()
+            if self.directory:
+                self._thread = threading.Thread(target=self._run, name="request-metrics-flush", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.flush_interval)
+            if self._dirty:
+                self.flush()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            self._dirty = False
+            return {
+                "counters": [[name, labels, value] for (name, labels), value in self._counters.items()],
+                "histograms": [[name, labels, list(h[0]), h[1], h[2]] for (name, labels), h in self._histograms.items()],
+            }
+
+    def flush(self) -> None:
+        """write this worker's totals to its file in the shared directory"""
+        if not self.directory or self._pid != os.getpid():
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, f"{os.getpid()}.json")
+            tmp = f"{path}.tmp"
+            with self._flush_lock:
+                with open(tmp, "w") as f:
+                    json.dump(self.snapshot(), f)
+                os.replace(tmp, path)
+        except OSError as e:
+            log.warning("request metrics: writing %s failed: %s", self.directory, e)
+
+    def collect(self) -> Dict[str, Any]:
+        """totals over every worker that wrote to the directory (just this one without a directory)"""
+        if not self.directory:
+            return self.snapshot()
+        self.flush()
+        counters: Dict[Tuple[str, Labels], float] = {}
+        histograms: Dict[Tuple[str, Labels], List[Any]] = {}
+        try:
+            names = [n for n in os.listdir(self.directory) if n.endswith(".json")]
+        except FileNotFoundError:
+            names = []
+        for name in names:
+            try:
+                with open(os.path.join(self.directory, name)) as f:
+                    snap = json.load(f)
+            except (OSError, ValueError) as e:
+                log.warning("request metrics: skipping %s: %s", name, e)
+                continue
+            for metric, labels, value in snap["counters"]:
+                key = (metric, tuple(map(tuple, labels)))
+                counters[key] = counters.get(key, 0) + value
+            for metric, labels, buckets, total, count in snap["histograms"]:
+                key = (metric, tuple(map(tuple, labels)))
+                h = histograms.setdefault(key, [[0] * (len(BUCKETS) + 1), 0.0, 0])
+                h[0] = [a + b for a, b in zip(h[0], buckets)]
+                h[1] += total
+                h[2] += count
+        return {
+            "counters": [[name, labels, value] for (name, labels), value in counters.items()],
+            "histograms": [[name, labels, *h] for (name, labels), h in histograms.items()],
+        }
+
+    def render(self) -> str:
+        """Prometheus text exposition format (0.0.4)"""
+        snap = self.collect()
+        by_name: Dict[str, List[str]] = {}
+        for name, labels, value in sorted(snap["counters"], key=lambda c: (c[0], c[1])):
+            by_name.setdefault(name, []).append(f"{name}{_labels(labels)} {_number(value)}")
+        for name, labels, buckets, total, count in sorted(snap["histograms"], key=lambda h: (h[0], h[1])):
+            lines = by_name.setdefault(name, [])
+            cumulative = 0
+            for bound, n in zip((*BUCKETS, None), buckets):
+                cumulative += n
+                le = "+Inf" if bound is None else _number(bound)
+                lines.append(f"{name}_bucket{_labels(tuple(labels) + (('le', le),))} {cumulative}")
+            lines.append(f"{name}_sum{_labels(labels)} {_number(total)}")
+            lines.append(f"{name}_count{_labels(labels)} {count}")
+        out = []
+        for name in sorted(by_name):
+            kind, text = HELP.get(name, ("untyped", name))
+            out += [f"# HELP {name} {text}", f"# TYPE {name} {kind}", *by_name[name]]
+        return "\n".join(out) + "\n"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _number(v) -> str:
+    return repr(float(v)) if isinstance(v, float) else str(v)
+
+
+# --- wiring ---
+
+def init_app(app, metrics: Metrics) -> None:
+    """
+    time every request of a Flask app, add Server-Timing and record into
+    metrics. with app.testing, responses also carry X-Query-Count.
+    """
+    from flask import request
+
+    @app.before_request
+    def _start():
+        _current.set(Timings(f"{request.method} {request.path}"))
+
+    @app.after_request
+    def _finish(response):
+        timings = _current.get()
+        if timings is None:
+            return response
+        total = timings.elapsed()
+        response.headers["Server-Timing"] = timings.server_timing(total)
+        if app.testing:
+            response.headers["X-Query-Count"] = str(timings.db_queries)
+        route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        metrics.record(route, request.method, response.status_code, timings, total)
+        _current.set(None)
+        return response
+
+    @app.teardown_request
+    def _clear(exc):
+        _current.set(None)
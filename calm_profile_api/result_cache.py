@@ -0,0 +1,158 @@
+"""
+Cache of finished /api/assess responses.
+
+The response depends only on the 20 answers (a bitmask), the four context
+values and the scoring/cost model, so repeated answer patterns can skip
+scoring, row building and JSON encoding. An entry holds the serialized
+body split around the assessment id (head + id + tail is byte-for-byte what
+jsonify would produce) and the row to insert, minus id and created_at.
+
+Each worker keeps a bounded LRU. With a redis url (RESULT_CACHE_REDIS_URL,
+needs the redis package) the entries are also
+shared between workers (and survive restarts): a local miss checks redis
+before computing. invalidate() drops the local entries and, with redis,
+bumps a generation counter that every worker picks up within
+sync_interval seconds. Keys contain the scoring version, so a model
+change makes old entries unreachable without an explicit invalidate.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional
+
+log = logging.getLogger(__name__)
+
+
+class CachedResult(NamedTuple):
+    head: bytes
+    tail: bytes
+    row: Dict[str, Any]
+
+    def body(self, assessment_id: str) -> bytes:
+        return self.head + assessment_id.encode("utf-8") + self.tail
+
+    def dumps(self) -> str:
+        return json.dumps({"head": self.head.decode("utf-8"), "tail": self.tail.decode("utf-8"), "row": self.row})
+
+    @classmethod
+    def loads(cls, raw) -> "CachedResult":
+        d = json.loads(raw)
+        return cls(d["head"].encode("utf-8"), d["tail"].encode("utf-8"), d["row"])
+
+
+class ResultCache:
+    def __init__(self, max_entries: int = 10000, redis_url: Optional[str] = None, ttl: int = 7 * 86400,
+                 namespace: str = "calm:assess", sync_interval: float = 5.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.namespace = namespace
+        self.sync_interval = sync_interval
+        self._entries: "OrderedDict[str, CachedResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._redis = None
+        self._generation = 0
+        self._synced = 0.0
+        if redis_url:
+            import redis  # optional: only needed for a shared cache
+            self._redis = redis.Redis.from_url(redis_url, socket_timeout=0.05, socket_connect_timeout=0.2)
+
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.shared_errors = 0
+
+    # --- lookups ---
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        self._sync()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+        entry = self._shared_get(key)
+        if entry is not None:
+            self.shared_hits += 1
+            self._store(key, entry)
+            return entry
+        self.misses += 1
+        return None
+
+    def put(self, key: str, entry: CachedResult) -> None:
+        self._store(key, entry)
+        if self._redis is not None:
+            try:
+                self._redis.set(self._shared_key(key), entry.dumps(), ex=self.ttl)
+            except Exception as e:
+                self.shared_errors += 1
+                log.warning("result cache: redis set failed: %s", e)
+
+    def invalidate(self) -> None:
+        """drop everything cached (here, and in every worker when shared)"""
+        with self._lock:
+            self._entries.clear()
+        self.invalidations += 1
+        if self._redis is not None:
+            self._generation = int(self._redis.incr(f"{self.namespace}:generation"))
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.shared_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.shared_hits) / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "shared": self._redis is not None,
+            "shared_errors": self.shared_errors,
+        }
+
+    # --- internals ---
+
+    def _store(self, key: str, entry: CachedResult) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _shared_key(self, key: str) -> str:
+        return f"{self.namespace}:{self._generation}:{key}"
+
+    def _shared_get(self, key: str) -> Optional[CachedResult]:
+        if self._redis is None:
+            return None
+        try:
+            raw = self._redis.get(self._shared_key(key))
+        except Exception as e:
+            self.shared_errors += 1
+            log.warning("result cache: redis get failed: %s", e)
+            return None
+        return CachedResult.loads(raw) if raw is not None else None
+
+    def _sync(self) -> None:
+        # pick up invalidations made by other workers
+        if self._redis is None or time.monotonic() - self._synced < self.sync_interval:
+            return
+        self._synced = time.monotonic()
+        try:
+            generation = int(self._redis.get(f"{self.namespace}:generation") or 0)
+        except Exception as e:
+            self.shared_errors += 1
+            log.warning("result cache: redis sync failed: %s", e)
+            return
+        if generation != self._generation:
+            with self._lock:
+                self._entries.clear()
+            self._generation = generation
@@ -0,0 +1,254 @@
+"""
+Analytics rollups for the ops dashboard.
+
+Two small tables keyed by (week, team_size band, archetype):
+
+    assessment_rollups        count and sums of annual_cost / hours_lost / overhead_index
+    assessment_rollup_buckets log-spaced histogram counts per metric, for percentiles
+
+apply() is never run inside a transaction that stores assessments: the
+upserts hit the same few hot rows from every worker, so requests would queue
+on their row locks, and a rollup error would roll the assessments back.
+Once rows are committed (by the request, or by the write-behind flush with
+ASSESS_WRITE_BEHIND=1) they go to each worker's rollup consumer
+(app.rollup_queue), which applies them in batches every ROLLUP_INTERVAL_MS.
+So the rollups can lag the assessments by one interval, and a hard kill of
+a worker or a failed rollup write can drop rows from them (never from
+assessments); `flask rebuild-rollups` repairs that. apply()
+pre-aggregates its rows and upserts the touched keys in a fixed order
+(concurrent batches can't deadlock on each other). The dashboard
+reads only these tables: its cost depends on weeks x bands x archetypes x
+buckets, not on how many assessments exist.
+
+rebuild() recomputes both tables from the assessments for backfills
+(`flask rebuild-rollups`).
+"""
+
+import math
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from assessment_storage import team_size_of
+from sqlalchemy import BigInteger, Column, Date, Float, Integer, MetaData, String, Table, delete, insert, select
+
+metadata = MetaData()
+
+rollups = Table(
+    "assessment_rollups", metadata,
+    Column("week", Date, primary_key=True),
+    Column("team_size", String(16), primary_key=True),
+    Column("archetype", String(32), primary_key=True),
+    Column("n", BigInteger, nullable=False, default=0),
+    Column("annual_cost_sum", Float, nullable=False, default=0.0),
+    Column("hours_lost_sum", Float, nullable=False, default=0.0),
+    Column("overhead_index_sum", Float, nullable=False, default=0.0),
+)
+
+buckets = Table(
+    "assessment_rollup_buckets", metadata,
+    Column("week", Date, primary_key=True),
+    Column("team_size", String(16), primary_key=True),
+    Column("archetype", String(32), primary_key=True),
+    Column("metric", String(16), primary_key=True),
+    Column("bucket", Integer, primary_key=True),
+    Column("n", BigInteger, nullable=False, default=0),
+)
+
+# same bands (and substring match) as the cost model's team multiplier
+TEAM_SIZE_BANDS = ("solo", "2-5", "6-15", "16-50", "50+")
+HISTOGRAM_METRICS = ("annual_cost", "hours_lost")
+SUM_COLUMNS = ("n", "annual_cost_sum", "hours_lost_sum", "overhead_index_sum")
+
+# histogram bucket b >= 1 holds [1.05**(b-1), 1.05**b): percentiles within ~2.5%
+BUCKET_BASE = 1.05
+_LOG_BASE = math.log(BUCKET_BASE)
+
+
+def week_start(ts: datetime) -> date:
+    """monday of the (utc) week"""
+    d = ts.date() if isinstance(ts, datetime) else ts
+    return d - timedelta(days=d.weekday())
+
+
+def team_size_band(team_size) -> str:
+    return next((band for band in TEAM_SIZE_BANDS if band in str(team_size)), "other")
+
+
+def _band_order(band: str) -> int:
+    return TEAM_SIZE_BANDS.index(band) if band in TEAM_SIZE_BANDS else len(TEAM_SIZE_BANDS)
+
+
+def bucket_of(value: float) -> int:
+    if value is None or value < 1:
+        return 0
+    return 1 + int(math.log(value) / _LOG_BASE)
+
+
+def bucket_value(bucket: int) -> float:
+    """
+    representative (geometric middle) value of a bucket. it can be up to ~2.5%
+    off any value in the bucket, so a percentile read from it can be above the
+    largest (or below the smallest) value actually recorded
+    """
+    if bucket <= 0:
+        return 0.0
+    return math.exp((bucket - 0.5) * _LOG_BASE)
+
+
+def _aggregate(rows: Iterable[Dict[str, Any]], sums=None, hist=None):
+    sums = defaultdict(lambda: [0, 0.0, 0.0, 0.0]) if sums is None else sums
+    hist = defaultdict(int) if hist is None else hist
+    now = datetime.utcnow()
+    for row in rows:
+        key = (
+            week_start(row.get("created_at") or now),
+            team_size_band(team_size_of(row)),
+            row.get("archetype_primary") or "unknown",
+        )
+        acc = sums[key]
+        acc[0] += 1
+        acc[1] += row.get("annual_cost") or 0.0
+        acc[2] += row.get("hours_lost") or 0.0
+        acc[3] += row.get("overhead_index") or 0.0
+        for metric in HISTOGRAM_METRICS:
+            hist[(*key, metric, bucket_of(row.get(metric)))] += 1
+    return sums, hist
+
+
+def _sum_rows(sums):
+    return [
+        {"week": w, "team_size": t, "archetype": a, **dict(zip(SUM_COLUMNS, acc))}
+        for (w, t, a), acc in sorted(sums.items())
+    ]
+
+
+def _bucket_rows(hist):
+    return [
+        {"week": w, "team_size": t, "archetype": a, "metric": m, "bucket": b, "n": n}
+        for (w, t, a, m, b), n in sorted(hist.items())
+    ]
+
+
+def _upsert(conn, table, rows: List[Dict[str, Any]], add_columns) -> None:
+    """insert rows, adding add_columns onto any row already there"""
+    if not rows:
+        return
+    dialect = conn.dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as upsert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as upsert
+        stmt = upsert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[c.name for c in table.primary_key],
+            set_={c: table.c[c] + stmt.excluded[c] for c in add_columns},
+        )
+        conn.execute(stmt, rows)
+        return
+    # anything else: update, insert what wasn't there
+    keys = [c.name for c in table.primary_key]
+    for row in rows:
+        where = [table.c[k] == row[k] for k in keys]
+        values = {c: table.c[c] + row[c] for c in add_columns}
+        if conn.execute(table.update().where(*where).values(values)).rowcount == 0:
+            conn.execute(insert(table), [row])
+
+
+def apply(conn, rows: List[Dict[str, Any]]) -> None:
+    """add freshly inserted assessment rows (column dicts) to the rollups"""
+    sums, hist = _aggregate(rows)
+    _upsert(conn, rollups, _sum_rows(sums), SUM_COLUMNS)
+    _upsert(conn, buckets, _bucket_rows(hist), ("n",))
+
+
+def rebuild(engine, chunks: Iterable[List[Dict[str, Any]]]) -> int:
+    """recompute both tables from chunks of assessment rows; swaps the contents in one transaction"""
+    sums, hist = None, None
+    total = 0
+    for chunk in chunks:
+        sums, hist = _aggregate(chunk, sums, hist)
+        total += len(chunk)
+    with engine.begin() as conn:
+        conn.execute(delete(buckets))
+        conn.execute(delete(rollups))
+        if total:
+            conn.execute(insert(rollups), _sum_rows(sums))
+            conn.execute(insert(buckets), _bucket_rows(hist))
+    return total
+
+
+# --- dashboard reads ---
+
+def _percentiles(hist: Dict[int, int], qs=(0.5, 0.9, 0.99)) -> Dict[str, float]:
+    total = sum(hist.values())
+    out = {}
+    if not total:
+        return {f"p{round(q * 100)}": None for q in qs}
+    ordered = sorted(hist.items())
+    for q in qs:
+        rank, seen = q * total, 0
+        for bucket, n in ordered:
+            seen += n
+            if seen >= rank:
+                out[f"p{round(q * 100)}"] = round(bucket_value(bucket), 2)
+                break
+    return out
+
+
+class _Group:
+    __slots__ = ("n", "sums", "archetypes", "hist")
+
+    def __init__(self):
+        self.n = 0
+        self.sums = [0.0, 0.0, 0.0]
+        self.archetypes = defaultdict(int)
+        self.hist = {m: defaultdict(int) for m in HISTOGRAM_METRICS}
+
+    def add(self, r) -> None:
+        self.n += r.n
+        self.sums[0] += r.annual_cost_sum
+        self.sums[1] += r.hours_lost_sum
+        self.sums[2] += r.overhead_index_sum
+        self.archetypes[r.archetype] += r.n
+
+    def body(self) -> Dict[str, Any]:
+        mean = (lambda s: round(s / self.n, 2)) if self.n else (lambda s: None)
+        return {
+            "count": self.n,
+            "archetypes": dict(sorted(self.archetypes.items())),
+            "annual_cost": {"mean": mean(self.sums[0]), **_percentiles(self.hist["annual_cost"])},
+            "hours_lost": {"mean": mean(self.sums[1]), **_percentiles(self.hist["hours_lost"])},
+            "overhead_index": {"mean": mean(self.sums[2])},
+        }
+
+
+def summary(conn, since: Optional[date] = None, team_size: Optional[str] = None, archetype: Optional[str] = None) -> Dict[str, Any]:
+    """archetype distribution and cost/hours stats overall, by week and by team size band"""
+    filters = []
+    for table in (rollups, buckets):
+        f = []
+        if since is not None:
+            f.append(table.c.week >= week_start(since))
+        if team_size is not None:
+            f.append(table.c.team_size == team_size)
+        if archetype is not None:
+            f.append(table.c.archetype == archetype)
+        filters.append(f)
+
+    overall = _Group()
+    by_week = defaultdict(_Group)
+    by_team = defaultdict(_Group)
+    for r in conn.execute(select(rollups).where(*filters[0])):
+        for g in (overall, by_week[r.week], by_team[r.team_size]):
+            g.add(r)
+    for r in conn.execute(select(buckets).where(*filters[1])):
+        for g in (overall, by_week[r.week], by_team[r.team_size]):
+            g.hist[r.metric][r.bucket] += r.n
+
+    return {
+        **overall.body(),
+        "by_week": [{"week": w.isoformat(), **g.body()} for w, g in sorted(by_week.items())],
+        "by_team_size": [{"team_size": t, **by_team[t].body()} for t in sorted(by_team, key=_band_order)],
+    }
@@ -0,0 +1,67 @@
+import os
+import sys
+
+import pytest
+
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, API_DIR)
+
+ANSWERS = {str(i): "A" if i % 3 else "B" for i in range(20)}
+CONTEXT = {"teamSize": "6-15", "meetingLoad": "heavy", "hourlyRate": 95}
+
+
+@pytest.fixture
+def app_env():
+    """extra environment for the app fixture; override in a test module to turn services on"""
+    return {}
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch, app_env):
+    """a fresh app on an empty sqlite database; per-process services off unless a test turns them on"""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'test.db'}")
+    monkeypatch.setenv("REPORT_STORE_DIR", str(tmp_path / "reports"))
+    monkeypatch.setenv("REQUEST_METRICS", "0")
+    monkeypatch.setenv("RESULT_CACHE_SIZE", "0")
+    monkeypatch.setenv("ASSESS_WRITE_BEHIND", "0")
+    monkeypatch.setenv("ROLLUP_INTERVAL_MS", "5")
+    for name in ("REPORT_TOKEN", "SUPPORT_TOKEN", "EXPORT_TOKEN", "METRICS_TOKEN"):
+        monkeypatch.delenv(name, raising=False)
+    for name, value in app_env.items():
+        monkeypatch.setenv(name, value)
+    import app as app_module
+    from models import db, init_db
+
+    monkeypatch.setattr(app_module, "_report_store", None)
+    application = app_module.create_app({"TESTING": True})
+    with application.app_context():
+        init_db(db.engine)
+    yield application
+    if app_module.write_behind:
+        app_module.write_behind.close()
+    app_module.rollup_writer.close()
+    with application.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def assessment_id(client):
+    """one stored assessment, unpaid"""
+    r = client.post("/api/assess", json={"responses": ANSWERS, "context": CONTEXT})
+    assert r.status_code == 200, r.get_data(as_text=True)
+    return r.get_json()["assessment_id"]
+
+
+@pytest.fixture
+def rollups_held(app, monkeypatch):
+    """keep the rollup consumer's batch open, so statement counts cover only the request's own queries"""
+    import app as app_module
+
+    monkeypatch.setattr(app_module.rollup_writer, "interval", 60.0)
+    return app_module.rollup_writer
@@ -0,0 +1,44 @@
+import random
+
+import pytest
+
+from calm_profile_system import score_assessment, score_batch
+from conftest import CONTEXT
+
+
+def answer_sets(n, seed=11):
+    rng = random.Random(seed)
+    return [{str(i): rng.choice("AB") for i in range(20)} for _ in range(n)]
+
+
+def test_score_batch_matches_score_assessment():
+    import app as app_module
+
+    formatted = [app_module.format_responses(a) for a in answer_sets(300)]
+    results = score_batch([[f[str(i)] for i in range(20)] for f in formatted]).results()
+    assert results == [score_assessment(f) for f in formatted]
+
+
+def test_batch_endpoint_matches_single_assess(client):
+    contexts = [CONTEXT, {}, {"teamSize": "solo", "meetingLoad": "light", "hourlyRate": 40}]
+    items = [{"responses": a, "context": contexts[i % len(contexts)]} for i, a in enumerate(answer_sets(30))]
+    r = client.post("/api/assess/batch", json={"items": items})
+    assert r.status_code == 200, r.get_data(as_text=True)
+    body = r.get_json()
+    assert body["count"] == len(items)
+    for item, batch_payload in zip(items, body["results"]):
+        single = client.post("/api/assess", json=item).get_json()
+        assert single.pop("assessment_id") != batch_payload.pop("assessment_id")
+        assert batch_payload == single
+
+
+@pytest.mark.parametrize("items, error", [
+    (["x"], "items[0] must be an object"),
+    ([{"responses": {}}, {"responses": ["A"]}], "items[1].responses must be an object"),
+    ([{"responses": {}, "context": "heavy"}], "items[0].context must be an object"),
+    ([], "items must be a non-empty list"),
+])
+def test_malformed_items_are_400(client, items, error):
+    r = client.post("/api/assess/batch", json={"items": items})
+    assert r.status_code == 400
+    assert r.get_json()["error"] == error
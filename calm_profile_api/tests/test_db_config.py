@@ -0,0 +1,14 @@
+import pytest
+from sqlalchemy import text
+
+import db_config  # noqa: F401  imported before the app fixture sets the environment
+
+
+@pytest.mark.parametrize("app_env", [{"SQLITE_BUSY_TIMEOUT_MS": "1234", "SQLITE_MMAP_BYTES": "4096"}])
+def test_sqlite_pragmas_read_the_environment_at_engine_setup(app):
+    from models import db
+
+    with app.app_context(), db.engine.connect() as conn:
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 1234
+        assert conn.execute(text("PRAGMA mmap_size")).scalar() == 4096
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
@@ -0,0 +1,92 @@
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from assessment_export import EXPORT_FIELDS, export_columns, export_record
+from conftest import ANSWERS, CONTEXT
+from models import Assessment, db
+
+pytestmark = pytest.mark.parametrize("app_env", [{"EXPORT_TOKEN": "export"}])
+
+STATUSES = ("pending", "paid", "refunded")
+
+
+@pytest.fixture
+def stored(app, client):
+    """nine assessments a day apart from 2024-05-01, cycling through STATUSES"""
+    ids = []
+    for i in range(9):
+        answers = {**ANSWERS, str(i): "A" if ANSWERS[str(i)] == "B" else "B"}
+        ids.append(client.post("/api/assess", json={"responses": answers, "context": CONTEXT}).get_json()["assessment_id"])
+    t = Assessment.__table__
+    with app.app_context(), db.engine.begin() as conn:
+        for i, assessment_id in enumerate(ids):
+            conn.execute(t.update().where(t.c.id == assessment_id).values(
+                created_at=datetime(2024, 5, 1) + timedelta(days=i), payment_status=STATUSES[i % 3]))
+    return ids
+
+
+def expected(app, keep):
+    """export records of the stored rows that pass keep(record), in id order, as JSON would give them back"""
+    t = Assessment.__table__
+    with app.app_context():
+        rows = db.session.execute(select(*export_columns(t)).order_by(t.c.id)).all()
+    records = [{**rec, "created_at": rec["created_at"].isoformat()} for rec in map(export_record, rows)]
+    return [rec for rec in records if keep(rec)]
+
+
+def export(client, query):
+    r = client.get(f"/api/assessments/export?{query}", headers={"Authorization": "Bearer export"})
+    assert r.status_code == 200, r.get_data(as_text=True)
+    return r
+
+
+def as_csv_rows(records):
+    return [["" if rec[f] is None else str(rec[f]) for f in EXPORT_FIELDS] for rec in records]
+
+
+FILTERS = [
+    ("", lambda rec: True),
+    ("since=2024-05-04&until=2024-05-07", lambda rec: "2024-05-04" <= rec["created_at"][:10] < "2024-05-07"),
+    ("payment_status=paid,refunded", lambda rec: rec["payment_status"] in ("paid", "refunded")),
+    ("since=2024-05-03T00:00:00&payment_status=pending",
+     lambda rec: rec["created_at"] >= "2024-05-03" and rec["payment_status"] == "pending"),
+]
+
+
+@pytest.mark.parametrize("query, keep", FILTERS, ids=["all", "window", "status", "since+status"])
+def test_ndjson_round_trip(app, client, stored, query, keep):
+    r = export(client, query)
+    assert r.mimetype == "application/gzip"
+    lines = gzip.decompress(r.get_data()).decode("utf-8").splitlines()
+    want = expected(app, keep)
+    assert want
+    assert [json.loads(line) for line in lines] == want
+
+
+@pytest.mark.parametrize("query, keep", FILTERS, ids=["all", "window", "status", "since+status"])
+def test_csv_round_trip(app, client, stored, query, keep):
+    body = export(client, f"format=csv&gzip=0&{query}").get_data(as_text=True)
+    header, *rows = csv.reader(io.StringIO(body))
+    assert tuple(header) == EXPORT_FIELDS
+    assert rows == as_csv_rows(expected(app, keep))
+
+
+def test_cli_export_matches_the_endpoint(app, client, stored, tmp_path):
+    out = tmp_path / "export.ndjson.gz"
+    with app.app_context():
+        result = app.test_cli_runner().invoke(args=["export", "-o", str(out), "--since", "2024-05-02",
+                                                    "--payment-status", "paid", "--payment-status", "pending"])
+    assert result.exit_code == 0, result.output
+    endpoint = export(client, "since=2024-05-02&payment_status=paid,pending&gzip=0").get_data()
+    assert gzip.decompress(out.read_bytes()) == endpoint
+
+
+def test_malformed_filter_is_400(client, stored):
+    r = client.get("/api/assessments/export?since=yesterday", headers={"Authorization": "Bearer export"})
+    assert r.status_code == 400
@@ -0,0 +1,65 @@
+import importlib.util
+import os
+
+import pytest
+
+pytest.importorskip("fontTools")
+from fontTools.fontBuilder import FontBuilder  # noqa: E402
+from fontTools.pens.ttGlyphPen import TTGlyphPen  # noqa: E402
+
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+spec = importlib.util.spec_from_file_location("build_fonts", os.path.join(API_DIR, "fonts", "build_fonts.py"))
+build_fonts = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(build_fonts)
+
+
+def tiny_font(path, family):
+    """a one-glyph TrueType font named family"""
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder([".notdef", "A"])
+    fb.setupCharacterMap({ord("A"): "A"})
+    pen = TTGlyphPen(None)
+    pen.moveTo((0, 0))
+    pen.lineTo((500, 700))
+    pen.lineTo((1000, 0))
+    pen.closePath()
+    glyph = pen.glyph()
+    fb.setupGlyf({".notdef": glyph, "A": glyph})
+    fb.setupHorizontalMetrics({".notdef": (1000, 0), "A": (1000, 0)})
+    fb.setupHorizontalHeader(ascent=800, descent=-200)
+    fb.setupNameTable({"familyName": family, "styleName": "Regular"})
+    fb.setupOS2()
+    fb.setupPost()
+    fb.save(str(path))
+
+
+def vendored_sources(src, family_of=lambda family: family):
+    src.mkdir()
+    for family, _, _, name in build_fonts.FACES:
+        tiny_font(src / name, family_of(family))
+    for name in build_fonts.LICENSES.values():
+        (src / name).write_text("SIL OPEN FONT LICENSE Version 1.1\n")
+
+
+def test_stand_in_and_missing_sources_are_rejected(tmp_path):
+    vendored_sources(tmp_path / "src", lambda family: "DejaVu Sans")
+    (tmp_path / "src" / "OFL-Inter.txt").unlink()
+    errors = build_fonts.source_errors(tmp_path / "src")
+    assert "missing OFL-Inter.txt" in errors
+    assert "Inter-Regular.ttf is 'DejaVu Sans', not 'Inter'" in errors
+    assert len(errors) == 1 + len(build_fonts.FACES)
+
+
+def test_built_bundle_passes_check_until_changed(tmp_path):
+    src, out = tmp_path / "src", tmp_path / "bundle"
+    vendored_sources(src)
+    assert build_fonts.source_errors(src) == []
+    assert build_fonts.check_bundle(out) == [f"no bundle in {out} (run fonts/build_fonts.py)"]
+
+    build_fonts.build(src, out)
+    assert build_fonts.check_bundle(out) == []
+    assert (out / "LICENSE-OFL-Inter.txt").read_text() == "SIL OPEN FONT LICENSE Version 1.1\n"
+
+    (out / "Inter-Bold.subset.ttf").write_bytes(b"\0")
+    (out / "LICENSE-OFL-Inter.txt").unlink()
+    assert build_fonts.check_bundle(out) == ["missing LICENSE-OFL-Inter.txt", "Inter-Bold.subset.ttf doesn't match the manifest"]
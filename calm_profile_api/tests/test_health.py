@@ -0,0 +1,25 @@
+import importlib
+
+import pytest
+
+pytest.importorskip("starlette")
+from starlette.testclient import TestClient  # noqa: E402
+
+
+@pytest.fixture
+def asgi_client(app):
+    # asgi.py builds its engines at import, from the DATABASE_URL the app fixture set
+    import asgi
+
+    with TestClient(importlib.reload(asgi).app) as client:
+        yield client
+
+
+def test_flask_and_asgi_health_match(client, asgi_client):
+    flask_body = client.get("/api/health").get_json()
+    asgi_body = asgi_client.get("/api/health").json()
+    for body in (flask_body, asgi_body):
+        assert body.pop("status") == "healthy"
+        assert body.pop("timestamp")
+    assert set(flask_body) >= {"scoring_model", "scoring_version"}
+    assert asgi_body == flask_body
@@ -0,0 +1,57 @@
+import itertools
+from collections import Counter
+
+import pytest
+from sqlalchemy import func, select
+
+from calm_profile_system import score_assessment, scoring_version
+from conftest import ANSWERS, CONTEXT
+from models import Assessment, db
+
+
+def progress(client, responses):
+    r = client.post("/api/assess/progress", json={"responses": responses})
+    assert r.status_code == 200, r.get_data(as_text=True)
+    return r.get_json()
+
+
+@pytest.mark.parametrize("open_questions", [(0, 5, 9, 13, 17, 19), (1, 2, 3, 4, 6, 7, 8)])
+def test_odds_match_every_completion_scored(client, open_questions):
+    partial = {k: v for k, v in ANSWERS.items() if int(k) not in open_questions}
+    body = progress(client, partial)
+
+    primaries = Counter()
+    for fill in itertools.product((1, 0), repeat=len(open_questions)):
+        formatted = {k: 1 if v == "A" else 0 for k, v in partial.items()}
+        formatted.update({str(q): a for q, a in zip(open_questions, fill)})
+        primaries[score_assessment(formatted)["archetype"]["primary"]] += 1
+
+    assert (body["answered"], body["remaining"]) == (20 - len(open_questions), len(open_questions))
+    assert body["completions"] == 2 ** len(open_questions)
+    assert {k: c for k, c in body["counts"].items() if c} == dict(primaries)
+    assert body["probabilities"][body["leading"]] == max(primaries.values()) / body["completions"]
+    assert body["scoring_version"] == scoring_version()
+
+
+def test_complete_answers_are_decided_on_the_assess_primary(client):
+    body = progress(client, ANSWERS)
+    primary = client.post("/api/assess", json={"responses": ANSWERS, "context": CONTEXT}).get_json()["archetype"]["primary"]
+    assert (body["leading"], body["decided"], body["completions"]) == (primary, True, 1)
+
+
+def test_nothing_answered_counts_every_pattern(client):
+    body = progress(client, {"3": "maybe"})
+    assert (body["answered"], body["completions"]) == (0, 2 ** 20)
+    assert sum(body["counts"].values()) == 2 ** 20
+    assert not body["decided"]
+
+
+def test_nothing_is_stored(app, client):
+    progress(client, ANSWERS)
+    with app.app_context():
+        assert db.session.execute(select(func.count()).select_from(Assessment)).scalar() == 0
+
+
+def test_responses_must_be_an_object(client):
+    r = client.post("/api/assess/progress", json={"responses": ["A"]})
+    assert r.status_code == 400
@@ -0,0 +1,61 @@
+"""
+statement budgets for the hot routes: an N+1 or an extra round trip fails
+here instead of only showing up as latency.
+"""
+
+import pytest
+
+from conftest import ANSWERS, CONTEXT
+from query_log import assert_max_queries
+
+SUPPORT = {"Authorization": "Bearer support"}
+
+
+def assess(client):
+    r = client.post("/api/assess", json={"responses": ANSWERS, "context": CONTEXT})
+    assert r.status_code == 200
+    return r.get_json()["assessment_id"]
+
+
+def test_assess_is_one_insert(client, rollups_held):
+    with assert_max_queries(1) as queries:
+        assess(client)
+    assert queries.statements[0].startswith("INSERT INTO assessments")
+
+
+def test_assess_batch_is_one_insert(client, rollups_held):
+    items = [{"responses": ANSWERS, "context": CONTEXT}] * 50
+    with assert_max_queries(1):
+        assert client.post("/api/assess/batch", json={"items": items}).status_code == 200
+
+
+def test_create_checkout(client, rollups_held):
+    assessment_id = assess(client)
+    # attaching the email: load the row, update it
+    with assert_max_queries(2):
+        r = client.post("/api/create-checkout", json={"assessment_id": assessment_id, "email": "a@example.com"})
+    assert r.status_code == 200
+    # nothing to attach: no database at all
+    with assert_max_queries(0):
+        assert client.post("/api/create-checkout", json={"assessment_id": assessment_id}).status_code == 200
+
+
+@pytest.mark.parametrize("query", ["", "&email=a@example.com", "&payment_status=pending&report_sent=false"])
+def test_assessments_page_is_one_query(client, rollups_held, monkeypatch, query):
+    monkeypatch.setenv("SUPPORT_TOKEN", "support")
+    for i in range(25):
+        assessment_id = assess(client)
+        if i % 2:
+            client.post("/api/create-checkout", json={"assessment_id": assessment_id, "email": "a@example.com"})
+
+    cursor, seen = None, 0
+    while True:
+        with assert_max_queries(1):
+            r = client.get(f"/api/assessments?limit=10{query}" + (f"&cursor={cursor}" if cursor else ""), headers=SUPPORT)
+        assert r.status_code == 200
+        body = r.get_json()
+        seen += len(body["assessments"])
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+    assert seen == {"": 25, "&email=a@example.com": 12}.get(query, 25)
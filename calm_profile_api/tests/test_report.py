@@ -0,0 +1,86 @@
+import pytest
+
+import app as app_module
+from models import Assessment, db
+from report_store import report_content
+
+PDF = b"%PDF-1.7 stored report"
+
+
+@pytest.fixture
+def stored_pdf(app, assessment_id):
+    """the assessment's report already in the report store, so serving it needs no renderer"""
+    with app.app_context():
+        a = db.session.get(Assessment, assessment_id)
+        store = app_module.report_store()
+        store.put(store.key(report_content(app_module.report_data(a))), PDF)
+    return assessment_id
+
+
+def set_payment_status(app, assessment_id, status):
+    with app.app_context():
+        db.session.get(Assessment, assessment_id).payment_status = status
+        db.session.commit()
+
+
+def test_unknown_assessment_is_404(client):
+    assert client.get("/api/report/00000000-0000-4000-8000-000000000000.pdf").status_code == 404
+
+
+def test_unpaid_report_is_402(client, stored_pdf):
+    r = client.get(f"/api/report/{stored_pdf}.pdf")
+    assert r.status_code == 402
+    assert r.get_json() == {"success": False, "error": "report not paid for"}
+    assert PDF not in r.get_data()
+
+
+def test_paid_report_is_served(app, client, stored_pdf):
+    set_payment_status(app, stored_pdf, "paid")
+    r = client.get(f"/api/report/{stored_pdf}.pdf")
+    assert r.status_code == 200
+    assert r.mimetype == "application/pdf"
+    assert r.get_data() == PDF
+
+
+def test_report_token_serves_unpaid_report(client, stored_pdf, monkeypatch):
+    monkeypatch.setenv("REPORT_TOKEN", "s3cret")
+    assert client.get(f"/api/report/{stored_pdf}.pdf").status_code == 402
+    assert client.get(f"/api/report/{stored_pdf}.pdf", headers={"Authorization": "Bearer wrong"}).status_code == 402
+    r = client.get(f"/api/report/{stored_pdf}.pdf", headers={"Authorization": "Bearer s3cret"})
+    assert r.status_code == 200
+    assert r.get_data() == PDF
+
+
+@pytest.fixture
+def render_pool(monkeypatch):
+    """a real one-worker RenderPool; skips where WeasyPrint or its pango/cairo libraries are missing"""
+    try:
+        import weasyprint  # noqa: F401
+    except (ImportError, OSError) as e:
+        pytest.skip(f"weasyprint unavailable: {e}")
+    monkeypatch.setenv("REPORT_RENDER_WORKERS", "1")
+    monkeypatch.setattr(app_module, "_render_pool", None)
+    yield app_module.render_pool
+    if app_module._render_pool is not None:
+        app_module._render_pool.close()
+
+
+def test_paid_report_is_rendered_through_the_pool(app, client, assessment_id, render_pool):
+    set_payment_status(app, assessment_id, "paid")
+    r = client.get(f"/api/report/{assessment_id}.pdf")
+    assert r.status_code == 200, r.get_data(as_text=True)[:200]
+    assert r.mimetype == "application/pdf"
+    assert r.get_data().startswith(b"%PDF")
+    assert render_pool().rendered == 1
+
+    # the render landed in the report store: the next request serves it without rendering
+    assert client.get(f"/api/report/{assessment_id}.pdf").get_data() == r.get_data()
+    assert render_pool().rendered == 1
+
+
+def test_checkout_attaches_the_email(app, client, assessment_id):
+    r = client.post("/api/create-checkout", json={"assessment_id": assessment_id, "email": "a@example.com"})
+    assert r.status_code == 200
+    assert r.get_json()["checkout_url"].endswith(f"session_id=mock_{assessment_id}")
+    with app.app_context():
+        assert db.session.get(Assessment, assessment_id).email == "a@example.com"
@@ -0,0 +1,62 @@
+import pytest
+from sqlalchemy import select
+
+from conftest import ANSWERS, CONTEXT
+from models import Assessment, db
+
+SCALARS = ("archetype_primary", "overhead_index", "hours_lost", "annual_cost")
+
+
+@pytest.fixture
+def stored(app, client):
+    """three assessments; the first has its scored columns overwritten, as if by an older model"""
+    ids = []
+    for answers in (ANSWERS, {str(i): "A" for i in range(20)}, {str(i): "B" for i in range(20)}):
+        r = client.post("/api/assess", json={"responses": answers, "context": CONTEXT})
+        ids.append(r.get_json()["assessment_id"])
+    t = Assessment.__table__
+    with app.app_context(), db.engine.begin() as conn:
+        original = conn.execute(select(*(t.c[f] for f in SCALARS)).where(t.c.id == ids[0])).one()
+        conn.execute(t.update().where(t.c.id == ids[0]).values(archetype_primary="stale", hours_lost=0.0, annual_cost=0.0))
+    return ids, original
+
+
+def scalars(assessment_id):
+    t = Assessment.__table__
+    with db.engine.connect() as conn:
+        return conn.execute(select(*(t.c[f] for f in SCALARS)).where(t.c.id == assessment_id)).one()
+
+
+def test_rescore_rewrites_only_changed_rows(app, stored, tmp_path):
+    ids, original = stored
+    checkpoint = tmp_path / "rescore.json"
+    with app.app_context():
+        result = app.test_cli_runner().invoke(args=["rescore", "--chunk-size", "2", "--checkpoint", str(checkpoint)])
+        assert result.exit_code == 0, result.output
+        assert "done: 3 scanned, 1 updated" in result.output
+        assert "rollups rebuilt from 3 assessments" in result.output
+        assert scalars(ids[0]) == original
+        assert not checkpoint.exists()
+
+        again = app.test_cli_runner().invoke(args=["rescore", "--checkpoint", str(checkpoint)])
+        assert "done: 3 scanned, 0 updated" in again.output
+
+
+def test_dry_run_counts_without_writing(app, stored, tmp_path):
+    ids, _ = stored
+    with app.app_context():
+        result = app.test_cli_runner().invoke(args=["rescore", "--dry-run", "--checkpoint", str(tmp_path / "c.json")])
+        assert "done: 3 scanned, 1 changed" in result.output
+        assert scalars(ids[0]).archetype_primary == "stale"
+
+
+def test_resumes_after_the_checkpoint(app, stored, tmp_path):
+    ids, _ = stored
+    checkpoint = tmp_path / "rescore.json"
+    # a previous run got past every row: nothing left to scan
+    checkpoint.write_text(f'{{"last_id": "{max(ids)}", "scanned": 3, "updated": 0}}')
+    with app.app_context():
+        result = app.test_cli_runner().invoke(args=["rescore", "--checkpoint", str(checkpoint)])
+        assert "resuming after" in result.output
+        assert scalars(ids[0]).archetype_primary == "stale"
+        assert not checkpoint.exists()
@@ -0,0 +1,39 @@
+import pytest
+from sqlalchemy import select
+
+import app as app_module
+from conftest import ANSWERS, CONTEXT
+from models import Assessment, db
+
+pytestmark = pytest.mark.parametrize("app_env", [{"RESULT_CACHE_SIZE": "100"}])
+
+
+def assess(client, context=CONTEXT):
+    r = client.post("/api/assess", json={"responses": ANSWERS, "context": context})
+    assert r.status_code == 200
+    return r
+
+
+def test_hit_matches_the_miss_apart_from_the_id(app, client):
+    miss = assess(client)
+    hit = assess(client)
+    assert app_module.result_cache.stats()["hits"] == 1
+    miss_id, hit_id = miss.get_json()["assessment_id"], hit.get_json()["assessment_id"]
+    assert miss_id != hit_id
+    assert hit.get_data() == miss.get_data().replace(miss_id.encode(), hit_id.encode())
+    assert hit.mimetype == miss.mimetype
+
+    # the hit is stored as its own row with the same scored values
+    t = Assessment.__table__
+    with app.app_context():
+        rows = {r.id: r for r in db.session.execute(select(t).where(t.c.id.in_([miss_id, hit_id]))).all()}
+    columns = [c for c in t.c.keys() if c not in ("id", "created_at")]
+    assert [getattr(rows[hit_id], c) for c in columns] == [getattr(rows[miss_id], c) for c in columns]
+
+
+def test_context_is_part_of_the_key(client):
+    first = assess(client).get_json()
+    other = assess(client, {**CONTEXT, "hourlyRate": 40}).get_json()
+    stats = app_module.result_cache.stats()
+    assert (stats["hits"], stats["misses"]) == (0, 2)
+    assert other["metrics"]["annual_cost"] < first["metrics"]["annual_cost"]
@@ -0,0 +1,52 @@
+import pytest
+from sqlalchemy import text
+
+import app as app_module
+import query_log
+from conftest import ANSWERS, CONTEXT
+from models import Assessment, db
+
+
+def summary(client, query=""):
+    r = client.get(f"/api/analytics/summary?weeks=0{query}")
+    assert r.status_code == 200
+    return r.get_json()
+
+
+def test_assess_rollups_are_written_by_the_consumer(client):
+    for _ in range(2):
+        assert client.post("/api/assess", json={"responses": ANSWERS, "context": CONTEXT}).status_code == 200
+    items = [{"responses": {str(i): "B" for i in range(20)}, "context": CONTEXT}] * 3
+    assert client.post("/api/assess/batch", json={"items": items}).status_code == 200
+
+    assert app_module.rollup_writer.flush()
+    body = summary(client)
+    assert body["count"] == 5
+    assert app_module.rollup_writer.stats()["flushed_rows"] == 5
+    primary = client.post("/api/assess", json={"responses": ANSWERS, "context": CONTEXT}).get_json()["archetype"]["primary"]
+    assert app_module.rollup_writer.flush()
+    assert summary(client, f"&archetype={primary}")["archetypes"] == {primary: 3}
+
+
+def test_assess_request_does_not_touch_rollups(client, rollups_held):
+    with query_log.count_queries() as queries:
+        assert client.post("/api/assess", json={"responses": ANSWERS, "context": CONTEXT}).status_code == 200
+    assert queries.count and not any("assessment_rollup" in sql for sql in queries.statements)
+    assert rollups_held.stats()["pending"] == 1
+
+
+@pytest.mark.parametrize("app_env", [{}, {"ASSESS_WRITE_BEHIND": "1"}], ids=["sync", "write-behind"])
+def test_rollup_failure_never_loses_assessments(app, client):
+    with app.app_context():
+        db.session.execute(text("DROP TABLE assessment_rollup_buckets"))
+        db.session.commit()
+    for _ in range(3):
+        assert client.post("/api/assess", json={"responses": ANSWERS, "context": CONTEXT}).status_code == 200
+    if app_module.write_behind:
+        assert app_module.write_behind.flush()
+        assert app_module.write_behind.stats()["failed_rows"] == 0
+    assert app_module.rollup_writer.flush()
+
+    with app.app_context():
+        assert db.session.query(Assessment).count() == 3
+    assert app_module.rollup_writer.stats()["failed_rows"] == 3
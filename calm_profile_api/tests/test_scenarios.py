@@ -0,0 +1,55 @@
+import pytest
+
+from cost_model import OVERHEAD_MULTIPLIERS, TEAM_MULTIPLIERS, context_cost
+
+
+def scenarios(client, assessment_id, query=""):
+    return client.get(f"/api/assessments/{assessment_id}/scenarios{query}")
+
+
+def test_grid_matches_context_cost(client, assessment_id):
+    r = scenarios(client, assessment_id, "?hourly_rate=60:80:10,250&team_size=2-5,16-50&meeting_load=light,heavy")
+    assert r.status_code == 200
+    body = r.get_json()
+    assert body["hourly_rates"] == [60.0, 70.0, 80.0, 250.0]
+    for i, rate in enumerate(body["hourly_rates"]):
+        for j, team in enumerate(body["team_sizes"]):
+            for k, load in enumerate(body["meeting_loads"]):
+                context = {"hourlyRate": rate, "teamSize": team, "meetingLoad": load}
+                assert body["annual_cost"][i][j][k] == round(context_cost(body["archetype"], context)[3])
+
+
+def test_defaults_to_own_rate_and_every_context(client, assessment_id):
+    body = scenarios(client, assessment_id).get_json()
+    assert body["hourly_rates"] == [95.0]
+    assert body["team_sizes"] == list(TEAM_MULTIPLIERS)
+    assert body["meeting_loads"] == list(OVERHEAD_MULTIPLIERS)
+
+
+def test_unknown_assessment_is_404(client):
+    assert scenarios(client, "00000000-0000-4000-8000-000000000000").status_code == 404
+
+
+@pytest.mark.parametrize("rates", [
+    "0:inf:1", "0:100:inf", "-inf:0:1", "nan:10:1", "0:10:nan",   # non-finite bounds
+    "0:10:0", "10:0:-1",                                         # step must be positive
+    "0:10", "abc", ",", "inf", "-5", "2e9",                       # malformed or out of range
+])
+def test_bad_rates_are_400(client, assessment_id, rates):
+    r = scenarios(client, assessment_id, f"?hourly_rate={rates}")
+    assert r.status_code == 400, rates
+    assert r.get_json()["success"] is False
+
+
+def test_rate_ranges_are_capped_in_total(app, client, assessment_id):
+    app.config["SCENARIO_MAX_CELLS"] = 1000
+    # each range alone is under the cap, together they are not
+    r = scenarios(client, assessment_id, "?hourly_rate=" + ",".join(["0:599:1"] * 2) + "&team_size=solo&meeting_load=light")
+    assert r.status_code == 400
+    assert "too long" in r.get_json()["error"]
+    assert scenarios(client, assessment_id, "?hourly_rate=0:599:1,600:999:1&team_size=solo&meeting_load=light").status_code == 200
+
+
+def test_grid_over_the_cell_cap_is_413(app, client, assessment_id):
+    app.config["SCENARIO_MAX_CELLS"] = 100
+    assert scenarios(client, assessment_id, "?hourly_rate=0:20:1").status_code == 413
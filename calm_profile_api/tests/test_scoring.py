@@ -0,0 +1,83 @@
+"""
+Scoring against a frozen copy of the original results.
+
+fixtures/score_assessment_v1.json holds what score_assessment returned, as
+first committed, for every per-axis answer count (6^4 = 1296 outcomes):
+primary, mix, axis scores and match per count tuple, plus each archetype's
+tagline and recommendations. The outcome table, the uncached path and the
+stored scoring version must all still agree with it.
+"""
+
+import itertools
+import json
+import os
+
+import pytest
+
+import calm_profile_system as cps
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "score_assessment_v1.json")
+
+# hash of the v1 outcome table; cached results and stored rows are keyed by it
+V1_SCORING_VERSION = "baf2e5003c06cf31"
+
+
+@pytest.fixture(scope="module")
+def frozen():
+    with open(FIXTURE) as f:
+        return json.load(f)
+
+
+def expected_result(frozen, outcome):
+    archetype = frozen["archetypes"][outcome["primary"]]
+    return {
+        "archetype": {"primary": outcome["primary"], "mix": outcome["mix"], "tagline": archetype["tagline"]},
+        "scores": {"axes": outcome["axes"], "match": outcome["match"]},
+        "recommendations": {"strengths": archetype["strengths"], "quick_wins": archetype["quick_wins"]},
+    }
+
+
+def answer_patterns(axis_questions, counts):
+    """responses with each axis's A answers first, then last: both must score the same"""
+    for first in (True, False):
+        responses = {}
+        for idxs, c in zip(axis_questions.values(), counts):
+            for j, i in enumerate(idxs):
+                responses[str(i)] = 1 if (j < c if first else j >= len(idxs) - c) else 0
+        yield responses
+
+
+def plain(result):
+    """FrozenDict/tuple result -> the dicts and lists the fixture holds"""
+    return json.loads(json.dumps(result))
+
+
+def test_fixture_covers_every_outcome(frozen):
+    sizes = [len(q) + 1 for q in frozen["axis_questions"].values()]
+    keys = {",".join(map(str, c)) for c in itertools.product(*(range(n) for n in sizes))}
+    assert set(frozen["outcomes"]) == keys
+    assert len(keys) == 1296
+
+
+def test_model_questions_unchanged(frozen):
+    model = cps.load_model("v1")
+    assert {a: list(q) for a, q in model.axis_questions.items()} == frozen["axis_questions"]
+
+
+@pytest.mark.parametrize("path", ["outcome_table", "reference"])
+def test_all_outcomes_match_original(frozen, path):
+    model = cps.load_model("v1")
+    assert model.outcome_table is not None and len(model.outcome_table.entries) == 1296
+    score = cps.score_assessment if path == "outcome_table" else cps._score_assessment_reference
+    mismatches = []
+    for key, outcome in frozen["outcomes"].items():
+        counts = tuple(int(c) for c in key.split(","))
+        expected = expected_result(frozen, outcome)
+        for responses in answer_patterns(frozen["axis_questions"], counts):
+            if plain(score(responses, model)) != expected:
+                mismatches.append(counts)
+    assert mismatches == []
+
+
+def test_scoring_version_unchanged():
+    assert cps.scoring_version(cps.load_model("v1")) == V1_SCORING_VERSION
@@ -0,0 +1,63 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, select
+
+import app as app_module
+from assessment_storage import COMPACT_COLUMNS, JSON_COLUMNS, SCHEMA_VERSION, storage_row
+from calm_profile_system import score_assessment
+from models import Assessment, db
+
+TOKENS = {"SUPPORT_TOKEN": "support", "EXPORT_TOKEN": "export"}
+pytestmark = pytest.mark.parametrize("app_env", [TOKENS])
+
+
+def version_1_rows(n, seed=5):
+    """rows as the JSON-blob layout stored them; the last one has context typed columns can't hold"""
+    rng = random.Random(seed)
+    started = datetime(2024, 3, 1)
+    rows = []
+    for i in range(n):
+        formatted = app_module.format_responses({str(q): rng.choice("AB") for q in range(20)})
+        context = {"teamSize": rng.choice(["solo", "2-5", "6-15"]), "meetingLoad": rng.choice(["light", "heavy"]),
+                   "hourlyRate": rng.choice([40, 85, 120.5])}
+        if i == n - 1:
+            context["platform"] = "x" * 100
+        row = app_module.assessment_row(f"00000000-0000-4000-8000-{i:012d}", formatted, score_assessment(formatted), context)
+        row["created_at"] = started + timedelta(hours=i)
+        rows.append({**storage_row(row), **dict.fromkeys(COMPACT_COLUMNS), **{k: row[k] for k in JSON_COLUMNS}})
+    return rows
+
+
+def bodies(client, ids):
+    """every read that decodes the stored layout, as raw bytes"""
+    urls = [("/api/assessments?limit=100", "support"), ("/api/assessments/export?gzip=0", "export"),
+            ("/api/assessments/export?gzip=0&format=csv", "export"), *((f"/api/assessments/{i}/scenarios", None) for i in ids)]
+    out = []
+    for url, token in urls:
+        r = client.get(url, headers={"Authorization": f"Bearer {token}"} if token else {})
+        assert r.status_code == 200, url
+        out.append(r.get_data())
+    return out
+
+
+def test_migrated_rows_read_back_byte_identical(app, client, tmp_path):
+    rows = version_1_rows(12)
+    with app.app_context():
+        db.session.execute(insert(Assessment), rows)
+        db.session.commit()
+    ids = [r["id"] for r in rows]
+    before = bodies(client, ids)
+
+    with app.app_context():
+        result = app.test_cli_runner().invoke(
+            args=["migrate-storage", "--chunk-size", "5", "--checkpoint", str(tmp_path / "migrate.json")])
+        assert result.exit_code == 0, result.output
+        assert "done: 12 scanned, 11 updated" in result.output
+        assert "1 rows kept as JSON" in result.output
+        t = Assessment.__table__
+        versions = dict(db.session.execute(select(t.c.id, t.c.schema_version)).all())
+    assert [versions[i] for i in ids] == [SCHEMA_VERSION] * 11 + [None]
+
+    assert bodies(client, ids) == before
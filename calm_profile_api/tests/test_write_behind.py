@@ -0,0 +1,104 @@
+import threading
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, func, select
+
+from write_behind import WriteBehindQueue
+
+metadata = MetaData()
+rows_table = Table("rows", metadata, Column("id", Integer, primary_key=True), Column("label", String))
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'wb.db'}")
+    metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def make_queue(engine):
+    queues = []
+
+    def make(**kwargs):
+        kwargs.setdefault("interval_ms", 200)
+        q = WriteBehindQueue(engine, rows_table, name="test-write-behind", **kwargs)
+        queues.append(q)
+        return q
+
+    yield make
+    for q in queues:
+        q.close()
+
+
+def stored_ids(engine):
+    with engine.connect() as conn:
+        return sorted(conn.execute(select(rows_table.c.id)).scalars())
+
+
+def test_rows_submitted_within_an_interval_share_one_commit(engine, make_queue):
+    committed = []
+    q = make_queue(after_commit=committed.append)
+    q.submit_many([{"id": i, "label": f"row {i}"} for i in range(50)])
+    assert q.flush()
+    assert stored_ids(engine) == list(range(50))
+    stats = q.stats()
+    assert (stats["flushes"], stats["flushed_rows"], stats["pending"]) == (1, 50, 0)
+    assert [len(batch) for batch in committed] == [50]
+
+
+def test_max_batch_bounds_each_commit(engine, make_queue):
+    q = make_queue(max_batch=4)
+    q.submit_many([{"id": i, "label": "x"} for i in range(10)])
+    assert q.flush()
+    assert q.stats()["flushes"] == 3
+    assert stored_ids(engine) == list(range(10))
+
+
+def test_flush_waits_for_the_write_and_times_out(engine, make_queue):
+    release = threading.Event()
+    q = make_queue(interval_ms=1, after_insert=lambda conn, rows: release.wait(5))
+    q.submit({"id": 1, "label": "x"})
+    assert not q.flush(timeout=0.05)
+    assert q.stats()["pending"] == 1
+    release.set()
+    assert q.flush()
+    assert stored_ids(engine) == [1]
+
+
+def test_close_drains_the_queue(engine, make_queue):
+    # what the atexit hook does on a graceful worker shutdown
+    q = make_queue(interval_ms=60_000)
+    q.submit_many([{"id": i, "label": "x"} for i in range(5)])
+    q.close()
+    assert stored_ids(engine) == list(range(5))
+    assert q.stats()["flushed_rows"] == 5
+    q.close()  # idempotent
+
+
+def test_failed_batch_is_retried_row_by_row(engine, make_queue):
+    with engine.begin() as conn:
+        conn.execute(rows_table.insert(), [{"id": 3, "label": "already stored"}])
+    committed = []
+    q = make_queue(after_commit=committed.append)
+    q.submit_many([{"id": i, "label": "new"} for i in range(1, 6)])
+    assert q.flush()
+    # the duplicate id fails the batch insert; the retry drops only that row
+    assert stored_ids(engine) == [1, 2, 3, 4, 5]
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).where(rows_table.c.label == "new")).scalar() == 4
+    stats = q.stats()
+    assert (stats["failed_rows"], stats["flushed_rows"], stats["pending"]) == (1, 4, 0)
+    assert [[r["id"] for r in batch] for batch in committed] == [[1, 2, 4, 5]]
+
+
+def test_after_commit_failure_keeps_the_rows(engine, make_queue):
+    def fail(rows):
+        raise RuntimeError("derived write failed")
+
+    q = make_queue(after_commit=fail)
+    q.submit_many([{"id": i, "label": "x"} for i in range(3)])
+    assert q.flush()
+    assert stored_ids(engine) == [0, 1, 2]
+    assert q.stats()["failed_rows"] == 0
@@ -0,0 +1,205 @@
+"""
+Write-behind (group commit) persistence for assessment rows.
+
+Requests enqueue a fully built row and return immediately; a background
+thread per worker process drains the queue and writes everything pending
+as one multi-row INSERT every `interval_ms`, or sooner once `max_batch`
+rows are waiting. One commit (one fsync) then covers many requests.
+`after_insert(conn, rows)`, if given, runs inside that same transaction,
+so its failure loses the rows too: use it only when it is the whole write.
+With table=None nothing is inserted and after_insert is the whole write:
+a batched consumer for derived data (the analytics rollups) whose rows are
+already stored. `after_commit(rows)` runs once rows are committed, outside
+the transaction; an error there is logged and never touches the rows.
+
+Durability: close() drains the queue and is registered with atexit, which
+gunicorn workers run on graceful shutdown (SIGTERM/SIGINT/SIGQUIT). Only a
+hard kill can lose rows, bounded by one flush interval.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+log = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class WriteBehindQueue:
+    def __init__(self, engine, table, interval_ms: float = 5.0, max_batch: int = 500, max_queue: int = 20000,
+                 after_insert=None, after_commit=None, name: str = "assessment-write-behind"):
+        self.engine = engine
+        self.table = table
+        self.after_commit = after_commit
+        self.name = name
+        self.after_insert = after_insert
+        self.interval = interval_ms / 1000.0
+        self.max_batch = max_batch
+        self.max_queue = max_queue
+
+        self._q: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._start_lock = threading.Lock()
+        self._idle = threading.Condition()
+        self._pending = 0
+
+        self.enqueued = 0
+        self.flushes = 0
+        self.flushed_rows = 0
+        self.failed_rows = 0
+        self.sync_fallbacks = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self.total_flush_ms = 0.0
+
+        atexit.register(self.close)
+
+    # --- producer side ---
+
+    def submit(self, row: Dict[str, Any]) -> None:
+        """queue a row for insert; writes synchronously if the queue is full"""
+        self._ensure_started()
+        with self._idle:
+            self._pending += 1
+        try:
+            self._q.put(row, timeout=1.0)
+            self.enqueued += 1
+        except queue.Full:
+            self.sync_fallbacks += 1
+            self._write([row])
+            self._done(1)
+
+    def submit_many(self, rows: List[Dict[str, Any]]) -> None:
+        for row in rows:
+            self.submit(row)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """block until everything submitted so far is written (e.g. read-your-write)"""
+        deadline = time.monotonic() + timeout
+        with self._idle:
+            while self._pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def close(self) -> None:
+        """drain and stop the flusher for this process"""
+        thread = self._thread
+        if thread is None or self._pid != os.getpid() or not thread.is_alive():
+            return
+        self._q.put(_STOP)
+        thread.join()
+        self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self._q.qsize() if self._q is not None and self._pid == os.getpid() else 0,
+            "pending": self._pending,
+            "enqueued": self.enqueued,
+            "flushes": self.flushes,
+            "flushed_rows": self.flushed_rows,
+            "failed_rows": self.failed_rows,
+            "sync_fallbacks": self.sync_fallbacks,
+            "last_flush_ms": round(self.last_flush_ms, 3),
+            "max_flush_ms": round(self.max_flush_ms, 3),
+            "avg_flush_ms": round(self.total_flush_ms / self.flushes, 3) if self.flushes else 0.0,
+        }
+
+    # --- flusher side ---
+
+    def _ensure_started(self) -> None:
+        # one flusher per worker: a thread inherited across fork is not running
+        if self._pid == os.getpid() and self._thread is not None:
+            return
+        with self._start_lock:
+            if self._pid == os.getpid() and self._thread is not None:
+                return
+            self._q = queue.Queue(maxsize=self.max_queue)
+            self._pending = 0
+            self._idle = threading.Condition()
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        stopping = False
+        while True:
+            if stopping:
+                # after STOP, drain whatever is left without waiting
+                try:
+                    item = self._q.get_nowait()
+                except queue.Empty:
+                    return
+            else:
+                item = self._q.get()
+            batch = []
+            if item is _STOP:
+                stopping = True
+            else:
+                batch.append(item)
+            deadline = time.monotonic() + self.interval
+            while len(batch) < self.max_batch:
+                try:
+                    if stopping:
+                        item = self._q.get_nowait()
+                    else:
+                        item = self._q.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+            if batch:
+                self._write(batch)
+                self._done(len(batch))
+
+    def _write(self, rows: List[Dict[str, Any]]) -> None:
+        started = time.perf_counter()
+        try:
+            with self.engine.begin() as conn:
+                self._insert(conn, rows)
+        except Exception:
+            log.exception("%s flush of %d rows failed; retrying row by row", self.name, len(rows))
+            committed = []
+            for row in rows:
+                try:
+                    with self.engine.begin() as conn:
+                        self._insert(conn, [row])
+                    committed.append(row)
+                except Exception:
+                    self.failed_rows += 1
+                    log.exception("%s: dropping assessment %s after failed write", self.name, row.get("id"))
+        else:
+            committed = rows
+        self.flushed_rows += len(committed)
+        elapsed = (time.perf_counter() - started) * 1000.0
+        self.flushes += 1
+        self.last_flush_ms = elapsed
+        self.max_flush_ms = max(self.max_flush_ms, elapsed)
+        self.total_flush_ms += elapsed
+        if committed and self.after_commit is not None:
+            try:
+                self.after_commit(committed)
+            except Exception:
+                log.exception("%s: after_commit failed for %d committed rows", self.name, len(committed))
+
+    def _insert(self, conn, rows: List[Dict[str, Any]]) -> None:
+        if self.table is not None:
+            conn.execute(self.table.insert(), rows)
+        if self.after_insert is not None:
+            self.after_insert(conn, rows)
+
+    def _done(self, n: int) -> None:
+        with self._idle:
+            self._pending -= n
+            if self._pending <= 0:
+                self._idle.notify_all()